@@ -1,7 +1,7 @@
 import random
 from engine.cards import Card
 from agents.base_agent import BaseAgent
-from engine.hand_evaluator import evaluate_hand
+from engine.hand_evaluator import hand_score
 
 class Basey(BaseAgent):
     def __init__(self, name="Basey", simulations=1000):
@@ -39,20 +39,19 @@ class Basey(BaseAgent):
                 deck_index += 2
                 opp_hands.append(opp_hand)
 
-            # Evaluate all hands
-            my_eval = evaluate_hand(hole_cards + sim_community)
-            if my_eval is None or not isinstance(my_eval, tuple) or len(my_eval) == 0:
+            # Evaluate all hands as plain int scores (higher wins)
+            my_rank = hand_score(hole_cards + sim_community)
+            if my_rank is None:
                 continue  # skip this simulation if evaluation failed
-            my_rank = my_eval[0]
 
             opp_ranks = []
             skip = False
             for opp_hand in opp_hands:
-                opp_eval = evaluate_hand(opp_hand + sim_community)
-                if opp_eval is None or not isinstance(opp_eval, tuple) or len(opp_eval) == 0:
+                opp_rank = hand_score(opp_hand + sim_community)
+                if opp_rank is None:
                     skip = True
                     break
-                opp_ranks.append(opp_eval[0])
+                opp_ranks.append(opp_rank)
             if skip:
                 continue  # skip this simulation if any opponent hand failed
 
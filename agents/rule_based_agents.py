@@ -8,6 +8,10 @@ import random
 import numpy as np
 from typing import Optional, List
 from agents.base_agent import BaseAgent
+from engine.cards import RANK_MAP
+
+# Rank char <-> numeric value (2-14), built once rather than per lookup
+_VALUE_TO_RANK = {value: rank for rank, value in RANK_MAP.items()}
 
 
 class TightAggressiveAgent(BaseAgent):
@@ -65,15 +69,11 @@ class TightAggressiveAgent(BaseAgent):
     
     def _rank_to_value(self, rank):
         """Convert rank to numeric value"""
-        rank_map = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, 
-                   '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        return rank_map.get(rank, 2)
+        return RANK_MAP.get(rank, 2)
     
     def _value_to_rank(self, value):
         """Convert numeric value back to rank"""
-        value_map = {2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 8: '8',
-                    9: '9', 10: 'T', 11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
-        return value_map.get(value, '2')
+        return _VALUE_TO_RANK.get(value, '2')
     
     def act(self, observation, action_mask=None, **kwargs):
         """Make decision based on tight-aggressive strategy"""
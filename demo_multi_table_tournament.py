@@ -32,7 +32,8 @@ def run_tournament_demo(total_players=27, max_players_per_table=9, hands_per_bli
         total_players=total_players,
         max_players_per_table=max_players_per_table,
         hands_per_blind_level=hands_per_blind_level,
-        table_balancing_threshold=6
+        table_balancing_threshold=6,
+        verbose=True
     )
     
     # Reset and get initial state
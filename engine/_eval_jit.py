@@ -0,0 +1,132 @@
+# poker-ai/engine/_eval_jit.py
+
+"""
+Native 7-card evaluation kernel. Compiled with Numba when it is installed;
+without it the same functions still run as plain Python (handy for tests),
+and hand_evaluator.Evaluator stays on its pure-Python path.
+"""
+
+import numpy as np
+
+from engine.hand_ranks_table import STRAIGHT_HIGH as _STRAIGHT_HIGH
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def _njit_fallback(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    njit = _njit_fallback
+
+# High card of the best straight per 13-bit rank mask, as an array the
+# kernel can index (see hand_ranks_table.STRAIGHT_HIGH)
+STRAIGHT_HIGH = np.array(_STRAIGHT_HIGH, dtype=np.int8)
+
+@njit(cache=True)
+def _push(score, value):
+    return (score << 4) | value
+
+@njit(cache=True)
+def _top_ranks(counts, min_count, skip1, skip2, limit, score):
+    # Append up to `limit` ranks (high to low) with at least min_count cards
+    taken = 0
+    for r in range(14, 1, -1):
+        if taken == limit:
+            break
+        if r != skip1 and r != skip2 and counts[r] >= min_count:
+            score = _push(score, r)
+            taken += 1
+    return score, taken
+
+@njit(cache=True)
+def _finish(score, used):
+    for _ in range(5 - used):
+        score = _push(score, 0)
+    return score
+
+@njit(cache=True, boundscheck=False)
+def evaluate_hand_jit(ranks, suits):
+    """
+    Return the best hand_evaluator.pack_score() int for the cards given as
+    parallel rank (2-14) and suit (0-3) arrays, in one pass over the cards.
+    """
+    counts = np.zeros(15, dtype=np.int64)
+    suit_masks = np.zeros(4, dtype=np.int64)
+    suit_counts = np.zeros(4, dtype=np.int64)
+    rank_mask = 0
+    for i in range(ranks.shape[0]):
+        r = np.int64(ranks[i])
+        s = np.int64(suits[i])
+        counts[r] += 1
+        suit_masks[s] |= 1 << (r - 2)
+        suit_counts[s] += 1
+        rank_mask |= 1 << (r - 2)
+
+    flush_suit = -1
+    for s in range(4):
+        if suit_counts[s] >= 5:
+            flush_suit = s
+
+    # Straight flush
+    if flush_suit >= 0:
+        high = np.int64(STRAIGHT_HIGH[suit_masks[flush_suit]])
+        if high:
+            return _finish(_push(8, high), 1)
+
+    quad = 0
+    trip = 0
+    for r in range(14, 1, -1):
+        if counts[r] == 4 and quad == 0:
+            quad = r
+        elif counts[r] == 3 and trip == 0:
+            trip = r
+
+    # Four of a kind
+    if quad:
+        score, used = _top_ranks(counts, 1, quad, 0, 1, _push(7, quad))
+        return _finish(score, used + 1)
+
+    # Full house (a second set of trips plays as the pair)
+    if trip:
+        score, used = _top_ranks(counts, 2, trip, 0, 1, _push(6, trip))
+        if used:
+            return _finish(score, used + 1)
+
+    # Flush
+    if flush_suit >= 0:
+        score = 5
+        m = suit_masks[flush_suit]
+        for r in range(14, 1, -1):
+            if m >> (r - 2) & 1:
+                score = _push(score, r)
+        return score >> (4 * (suit_counts[flush_suit] - 5))
+
+    # Straight
+    high = np.int64(STRAIGHT_HIGH[rank_mask])
+    if high:
+        return _finish(_push(4, high), 1)
+
+    # Three of a kind
+    if trip:
+        score, used = _top_ranks(counts, 1, trip, 0, 2, _push(3, trip))
+        return _finish(score, used + 1)
+
+    # Two pair / one pair
+    score, pairs = _top_ranks(counts, 2, 0, 0, 2, 0)
+    if pairs == 2:
+        high_pair = (score >> 4) & 0xF
+        low_pair = score & 0xF
+        score, used = _top_ranks(counts, 1, high_pair, low_pair, 1, _push(_push(2, high_pair), low_pair))
+        return _finish(score, used + 2)
+    if pairs == 1:
+        score, used = _top_ranks(counts, 1, score, 0, 3, _push(1, score))
+        return _finish(score, used + 1)
+
+    # High card
+    score, used = _top_ranks(counts, 1, 0, 0, 5, 0)
+    return _finish(score, used)
@@ -0,0 +1,52 @@
+# poker-ai/engine/_game_jit.py
+
+"""
+Native chip-movement kernel for bulk betting simulations. Like
+engine._eval_jit, it is compiled with Numba when that is installed and runs
+as plain Python otherwise.
+
+Table state is held as parallel arrays, one entry per seat: stacks and bets
+(int64) and in_hand (bool). The kernel only moves chips. Turn order and
+action legality stay with PokerGame.
+"""
+
+import numpy as np
+
+from engine._eval_jit import njit
+
+# Action codes, matching the env action space
+FOLD, CALL, RAISE = 0, 1, 2
+
+@njit(cache=True, boundscheck=False)
+def apply_actions(stacks, bets, in_hand, seats, actions, amounts, current_bet):
+    """
+    Apply actions[k] by seat seats[k] in order, updating the arrays in place.
+    CALL also covers a check, and a short stack calls all-in. RAISE raises
+    to amounts[k], capped at the seat's stack. Returns (chips added to the
+    pot, the new current bet).
+    """
+    pot = 0
+    for k in range(seats.shape[0]):
+        i = seats[k]
+        action = actions[k]
+        if action == FOLD:
+            in_hand[i] = False
+            continue
+        if action == CALL:
+            target = current_bet
+        else:
+            target = amounts[k]
+        pay = min(stacks[i], max(target - bets[i], 0))
+        stacks[i] -= pay
+        bets[i] += pay
+        pot += pay
+        if bets[i] > current_bet:
+            current_bet = bets[i]
+    return pot, current_bet
+
+def table_arrays(players):
+    """Return (stacks, bets, in_hand) arrays for a list of Player objects."""
+    stacks = np.fromiter((p.stack for p in players), dtype=np.int64, count=len(players))
+    bets = np.fromiter((p.current_bet for p in players), dtype=np.int64, count=len(players))
+    in_hand = np.fromiter((p.in_hand for p in players), dtype=np.bool_, count=len(players))
+    return stacks, bets, in_hand
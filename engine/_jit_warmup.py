@@ -0,0 +1,36 @@
+# poker-ai/engine/_jit_warmup.py
+
+"""
+Compile the Numba kernels ahead of the first hand. They are built with
+cache=True, so running this once (e.g. `python -m engine._jit_warmup` after
+installing, or when building a CI image) leaves the compiled code in
+engine/__pycache__ and later processes load it instead of recompiling.
+Without Numba this only runs the plain Python kernels once.
+"""
+
+import numpy as np
+
+from engine._eval_jit import HAVE_NUMBA, evaluate_hand_jit
+from engine._game_jit import CALL, FOLD, RAISE, apply_actions
+
+def warm_up():
+    """Call every kernel once with the argument types the engine passes it."""
+    # Evaluator.score: rank and suit views of a packed uint8 buffer
+    packed = np.array([(r << 2) | (r % 4) for r in range(2, 9)], dtype=np.uint8)
+    evaluate_hand_jit(packed >> 2, packed & 3)
+
+    # Bulk betting: int64 stacks/bets, bool in_hand, int64 scripts
+    stacks = np.array([100, 100], dtype=np.int64)
+    bets = np.zeros(2, dtype=np.int64)
+    in_hand = np.ones(2, dtype=np.bool_)
+    apply_actions(
+        stacks, bets, in_hand,
+        np.array([0, 1, 0], dtype=np.int64),
+        np.array([RAISE, CALL, FOLD], dtype=np.int64),
+        np.array([20, 0, 0], dtype=np.int64),
+        0,
+    )
+
+if __name__ == "__main__":
+    warm_up()
+    print("Numba kernels compiled and cached." if HAVE_NUMBA else "Numba not installed; nothing to compile.")
@@ -1,7 +1,78 @@
+from dataclasses import dataclass
 from typing import NamedTuple, Optional
 
+from utils.enums import ActionId
+
+# Error codes carried by ActionValidationError.code and returned by
+# PokerGame.step_checked; 0 means the action is legal
+OK = 0
+ERR_UNKNOWN_ACTION = 1
+ERR_FOLD_CAN_CHECK = 2
+ERR_CHECK_FACING_BET = 3
+ERR_CALL_NOTHING_TO_CALL = 4
+ERR_NO_CHIPS = 5
+ERR_INVALID_RAISE = 6
+ERR_MIN_RAISE = 7
+
+ERROR_MESSAGES = {
+    ERR_UNKNOWN_ACTION: "Invalid action.",
+    ERR_FOLD_CAN_CHECK: "Cannot fold when you can check (to_call == 0).",
+    ERR_CHECK_FACING_BET: "Cannot check when there is a bet to call.",
+    ERR_CALL_NOTHING_TO_CALL: "Cannot call when to_call is zero; should check instead.",
+    ERR_NO_CHIPS: "Player has no chips left to bet.",
+    ERR_INVALID_RAISE: "Invalid raise.",
+    ERR_MIN_RAISE: "Raise is below the minimum raise.",
+}
+
 class ActionValidationError(ValueError):
-    pass
+    """
+    An illegal action. The message may be a %-format with its arguments
+    passed after it; it is only formatted when the error is displayed, so
+    callers that catch and discard the error never pay for the string.
+    `code` is one of the ERR_* constants for the common illegal actions
+    (None for the rest), so callers can branch on it instead of the text.
+    """
+
+    def __init__(self, message, *format_args, code=None):
+        super().__init__(message)
+        self.format_args = format_args
+        self.code = code
+
+    def __str__(self):
+        message = self.args[0] if self.args else ""
+        return message % self.format_args if self.format_args else message
+
+# Legality of each action for a player in the hand with chips, indexed
+# [ActionId][facing a bet]. Raises need the full validate_raise rules and
+# are not covered here.
+ACTION_CODES = (
+    (ERR_FOLD_CAN_CHECK, OK),        # FOLD
+    (OK, ERR_CHECK_FACING_BET),      # CHECK
+    (ERR_CALL_NOTHING_TO_CALL, OK),  # CALL
+    (OK, OK),                        # RAISE
+)
+# The same table keyed by (action string, facing a bet)
+_ACTION_CODES = {
+    (action.name.lower(), facing_bet): ACTION_CODES[action][facing_bet]
+    for action in ActionId
+    for facing_bet in (False, True)
+}
+
+def validate_action(action_id, has_bet):
+    """Raise ActionValidationError if ActionId action_id is illegal with or without a bet to call."""
+    code = ACTION_CODES[action_id][has_bet]
+    if code:
+        raise ActionValidationError(ERROR_MESSAGES[code], code=code)
+
+def action_error_code(action, *, player_stack, to_call):
+    """
+    Return the error code for `action` by a player still in the hand, or OK,
+    without raising. One table lookup; raise amounts are checked by
+    validate_raise.
+    """
+    if player_stack == 0:
+        return ERR_NO_CHIPS
+    return _ACTION_CODES.get((action, to_call > 0), ERR_UNKNOWN_ACTION)
 
 class RaiseValidationResult(NamedTuple):
     is_all_in: bool
@@ -9,6 +80,30 @@ class RaiseValidationResult(NamedTuple):
     amount_to_put_in: int
     reason: Optional[str] = None
 
+@dataclass(slots=True)
+class ActionResult:
+    """
+    Outcome of a PokerGame.handle_* call. One fixed-shape slotted object
+    instead of a fresh dict per action; fields that don't apply to the
+    action keep their defaults.
+    """
+    kind: str  # "fold", "check", "call" or "raise"
+    player: str
+    pot: int
+    current_bet: int
+    can_fold: bool = False
+    can_check: bool = False
+    call_amount: int = 0
+    is_all_in: bool = False
+    raise_to: int = 0
+    raise_amount: int = 0
+    actual_raise: int = 0
+    last_raise_amount: int = 0
+
+    def __getitem__(self, key):
+        # dict-style access kept for callers still written against the old dict results
+        return getattr(self, key)
+
 def validate_raise(*, raise_to, player_stack, to_call, current_bet, min_raise, big_blind, player_current_bet) -> RaiseValidationResult:
     """
     Validate raise in No-Limit Texas Hold'em.
@@ -38,12 +133,12 @@ def validate_raise(*, raise_to, player_stack, to_call, current_bet, min_raise, b
         ("current_bet", current_bet), ("min_raise", min_raise), ("big_blind", big_blind), ("player_current_bet", player_current_bet)
     ]:
         if not isinstance(val, int):
-            raise ActionValidationError(f"{name} must be an integer.")
+            raise ActionValidationError("%s must be an integer.", name)
         if val < 0:
-            raise ActionValidationError(f"{name} must be positive.")
+            raise ActionValidationError("%s must be positive.", name)
 
     if player_stack == 0:
-        raise ActionValidationError("Player has no chips left to bet.")
+        raise ActionValidationError("Player has no chips left to bet.", code=ERR_NO_CHIPS)
 
     if raise_to <= 0:
         raise ActionValidationError("raise_to must be positive.")
@@ -70,7 +165,7 @@ def validate_raise(*, raise_to, player_stack, to_call, current_bet, min_raise, b
     # Now check if player is trying to put in more than their stack (not all-in)
     print(f"[DEBUG] raise_to={raise_to}, player_stack={player_stack}, to_call={to_call}, current_bet={current_bet}, min_raise={min_raise}, big_blind={big_blind}, player_current_bet={player_current_bet}, amount_to_put_in={amount_to_put_in}")
     if amount_to_put_in > player_stack:
-        raise ActionValidationError(f"Invalid raise: player only has {player_stack} chips.")
+        raise ActionValidationError("Invalid raise: player only has %d chips.", player_stack)
 
     # Opening bet (to_call == 0) - player wants to be first to raise in this betting round
     if to_call == 0:
@@ -80,11 +175,11 @@ def validate_raise(*, raise_to, player_stack, to_call, current_bet, min_raise, b
         if amount_to_put_in == player_stack and raise_to > current_bet:
             pass  # Allow all-in opening bet below min
         elif raise_amount < big_blind:
-            raise ActionValidationError(f"Opening bet must raise by at least the big blind ({big_blind}). Tried to raise by {raise_amount}.")
+            raise ActionValidationError("Opening bet must raise by at least the big blind (%d). Tried to raise by %d.", big_blind, raise_amount, code=ERR_MIN_RAISE)
     else:
         raise_amount = raise_to - current_bet
         if raise_amount < min_raise:
-            raise ActionValidationError(f"Must raise by at least {min_raise} chips (big blind or last raise).")
+            raise ActionValidationError("Must raise by at least %d chips (big blind or last raise).", min_raise, code=ERR_MIN_RAISE)
 
     if player_current_bet > current_bet:
         raise ActionValidationError("player_current_bet cannot be greater than current_bet.")
@@ -108,9 +203,10 @@ def validate_call(*, player_stack, to_call):
         raise ActionValidationError("player_stack and to_call must be integers.")
     if player_stack < 0 or to_call < 0:
         raise ActionValidationError("player_stack and to_call must be non-negative.")
+    validate_action(ActionId.CALL, to_call > 0)
 
     if player_stack == 0:
-        raise ActionValidationError("Player has no chips left to call.")
+        raise ActionValidationError("Player has no chips left to call.", code=ERR_NO_CHIPS)
 
     # If player has enough chips, normal call
     if player_stack >= to_call:
@@ -136,10 +232,8 @@ def validate_check(*, to_call):
     if to_call < 0:
         raise ActionValidationError("to_call must be non-negative.")
 
-    if to_call == 0:
-        return {"can_check": True}
-    else:
-        raise ActionValidationError("Cannot check when there is a bet to call.")
+    validate_action(ActionId.CHECK, to_call > 0)
+    return {"can_check": True}
 
 def validate_fold(*, in_hand, to_call):
     """
@@ -163,7 +257,5 @@ def validate_fold(*, in_hand, to_call):
 
     if not in_hand:
         raise ActionValidationError("Cannot fold if player is not in hand.")
-    if to_call == 0:
-        raise ActionValidationError("Cannot fold when you can check (to_call == 0).")
-
+    validate_action(ActionId.FOLD, to_call > 0)
     return {"can_fold": True}
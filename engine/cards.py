@@ -1,19 +1,85 @@
 # poker-ai/engine/cards.py
 
 import random
+from operator import itemgetter
+
+import numpy as np
 
 # Ranks and suits for standard 52-card deck
-RANKS = "2 3 4 5 6 7 8 9 T J Q K A".split()
-SUITS = "♠ ♥ ♦ ♣".split()  # Unicode suits for display
+RANKS = tuple("2 3 4 5 6 7 8 9 T J Q K A".split())
+SUITS = tuple("♠ ♥ ♦ ♣".split())  # Unicode suits for display
+
+# Map ranks to numeric values as per poker convention (2-14) and suits to 0-3
+RANK_MAP = {rank: value for value, rank in enumerate(RANKS, start=2)}
+SUIT_MAP = {suit: idx for idx, suit in enumerate(SUITS)}
+
+# One prime per rank (2..A) for Cactus-Kev prime-product hand keys
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def cactus_kev(rank_idx, suit_idx):
+    """
+    Return the Cactus-Kev 32-bit encoding of a card:
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+    b = one bit per rank (bits 16-28), cdhs = one-hot suit (bits 12-15),
+    r = rank 0-12 (bits 8-11), p = rank prime (bits 0-5).
+    """
+    r = rank_idx - 2
+    return (1 << (16 + r)) | (1 << (12 + suit_idx)) | (r << 8) | PRIMES[r]
 
 class Card:
+    """
+    An immutable playing card stored as ints: rank_idx (2-14) and suit_idx
+    (0-3), plus the packed byte and Cactus-Kev forms derived from them.
+    The rank and suit strings are computed on access, for display only.
+    """
+
+    __slots__ = ('rank_idx', 'suit_idx', 'packed', 'ck')
+
     def __init__(self, rank, suit):
         if rank not in RANKS:
             raise ValueError(f"Invalid rank: {rank}")
         if suit not in SUITS:
             raise ValueError(f"Invalid suit: {suit}")
-        self.rank = rank
-        self.suit = suit
+        rank_idx = RANK_MAP[rank]
+        suit_idx = SUIT_MAP[suit]
+        object.__setattr__(self, 'rank_idx', rank_idx)
+        object.__setattr__(self, 'suit_idx', suit_idx)
+        # Single-byte form (rank_idx << 2 | suit_idx, 8..59) for packed evaluation
+        object.__setattr__(self, 'packed', (rank_idx << 2) | suit_idx)
+        # Cactus-Kev 32-bit form used by the hand evaluator
+        object.__setattr__(self, 'ck', cactus_kev(rank_idx, suit_idx))
+
+    @property
+    def rank(self):
+        return RANKS[self.rank_idx - 2]
+
+    @property
+    def suit(self):
+        return SUITS[self.suit_idx]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Card is immutable, cannot delete {name!r}")
+
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.packed == other.packed
+
+    def __hash__(self):
+        return hash(self.packed)
+
+    def __reduce__(self):
+        return (Card, (self.rank, self.suit))
+
+    # Immutable, so copies (e.g. an env clone) can share the same object
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self):
         return f"{self.rank}{self.suit}"
@@ -24,30 +90,79 @@ class Card:
     def to_tuple(self):
         return (self.rank, self.suit)
 
+# Cards are immutable values, so all 52 are built once and shared
+_CARD_CACHE = {(rank, suit): Card(rank, suit) for suit in SUITS for rank in RANKS}
+_ALL_CARDS = tuple(_CARD_CACHE.values())
+
+def get_card(rank, suit):
+    """Return the shared Card for (rank, suit); raises ValueError like Card() for bad input."""
+    try:
+        return _CARD_CACHE[(rank, suit)]
+    except KeyError:
+        return Card(rank, suit)
+
 class Deck:
-    def __init__(self):
-        self.cards = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+    """
+    A 52-card deck dealt from the top via a cursor, so drawing and
+    reshuffling reuse one list instead of building new ones.
+    Every shuffle draws from one NumPy generator: `rng` if given (several
+    decks may share one), otherwise the deck's own, seeded from the global
+    random module when the deck is built. Seeding random before building a
+    game therefore fixes its deals; reseeding later does not change an
+    existing deck, so pass `rng` to control that.
+    The first full shuffle is a single permutation. Reshuffles after that
+    (a reused deck, one per hand) take the next of a batch of
+    DECK_ORDER_BATCH orders drawn at once.
+    """
+
+    DECK_ORDER_BATCH = 128
+
+    def __init__(self, rng=None):
+        self._cards = list(_ALL_CARDS)
+        self._top = 0  # index of the next card to deal
+        self._rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        self._orders = None  # pending full-deck orders (lists of card indices); None until reshuffled
         self.shuffle()
 
+    @property
+    def cards(self):
+        """The undealt cards, top first (a copy)."""
+        return self._cards[self._top:]
+
     def shuffle(self):
-        random.shuffle(self.cards)
+        """Shuffle the undealt cards."""
+        if self._top == 0:
+            if self._orders is None:
+                # First shuffle: one order, so one-hand decks never draw a batch
+                self._orders = []
+                order = self._rng.permutation(len(_ALL_CARDS)).tolist()
+            else:
+                if not self._orders:
+                    base = np.broadcast_to(np.arange(len(_ALL_CARDS)), (self.DECK_ORDER_BATCH, len(_ALL_CARDS)))
+                    self._orders = self._rng.permuted(base, axis=1).tolist()
+                order = self._orders.pop()
+            self._cards[:] = itemgetter(*order)(_ALL_CARDS)
+        else:
+            rest = self._cards[self._top:]
+            self._rng.shuffle(rest)
+            self._cards[self._top:] = rest
 
     def draw(self, n=1):
         if n <= 0:
             raise ValueError("Number of cards to draw must be positive")
-        if n > len(self.cards):
+        if n > len(self):
             raise ValueError("Not enough cards left in the deck")
-        drawn = self.cards[:n]
-        self.cards = self.cards[n:]
+        drawn = self._cards[self._top:self._top + n]
+        self._top += n
         return drawn
 
-
     def reset(self):
-        self.__init__()
+        """Gather all 52 cards back and shuffle them, keeping the same list."""
+        self._top = 0
+        self.shuffle()
 
     def __len__(self):
-        return len(self.cards)
+        return len(self._cards) - self._top
 
     def __str__(self):
-        return f"Deck with {len(self.cards)} cards."
-
+        return f"Deck with {len(self)} cards."
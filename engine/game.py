@@ -4,9 +4,9 @@ import sys
 from engine import player
 from engine.cards import Deck
 from engine.player import Player
-from engine.hand_evaluator import hand_rank
+from engine.hand_evaluator import ck_score
 from utils.enums import GameMode
-from engine.action_validation import validate_raise, validate_call, validate_check, validate_fold, ActionValidationError
+from engine.action_validation import validate_raise, validate_call, validate_check, validate_fold, ActionValidationError, ActionResult, OK, ERR_INVALID_RAISE, ERR_UNKNOWN_ACTION, action_error_code
 class PokerGame:
     def collect_bet(self, player, amount, suppress_log=False):
         """Take chips from player and add to pot, always keeping pot and contributions in sync."""
@@ -22,6 +22,19 @@ class PokerGame:
         self._assert_pot_consistency()
         return actual_ante
 
+    def reset_to(self, **state):
+        """
+        Jump straight to a given table state (e.g. pot=150, current_bet=60).
+        Set player fields with Player.reset_to first: the pot must still match
+        the sum of player contributions afterwards.
+        """
+        for key, value in state.items():
+            if not hasattr(self, key):
+                raise AttributeError(f"PokerGame has no attribute '{key}'")
+            setattr(self, key, value)
+        self._assert_pot_consistency()
+        return self
+
     def _assert_pot_consistency(self):
         total_contrib = sum(p.total_contributed for p in self.players)
         if self.pot != total_contrib:
@@ -29,10 +42,14 @@ class PokerGame:
             for p in self.players:
                 print(f"    {p.name}: total_contributed={p.total_contributed}, current_bet={p.current_bet}, stack={p.stack}")
             raise RuntimeError("Pot and player contributions are out of sync!")
-    PHASES = ["preflop", "flop", "turn", "river", "showdown"]
+    PHASES = ("preflop", "flop", "turn", "river", "showdown")
+    # phase_idx values, so hot paths avoid PHASES.index()
+    PREFLOP, FLOP, TURN, RIVER, SHOWDOWN = range(len(PHASES))
+    # Action strings indexed by utils.enums.ActionId
+    ACTION_NAMES = ("fold", "check", "call", "raise")
 
     def __init__(self, players, starting_stack=1000, small_blind=10, big_blind=20,
-                 ante=0, game_mode=GameMode.AI_VS_AI, human_action_callback=None, table_id=None):
+                 ante=0, game_mode=GameMode.AI_VS_AI, human_action_callback=None, table_id=None, rng=None):
         if len(players) < 2:
             raise ValueError("Need at least two players to start the game.")
         if ante < 0:
@@ -45,6 +62,8 @@ class PokerGame:
         self.game_mode = game_mode
         self.human_action_callback = human_action_callback
         self.deck = None
+        self._own_deck = None  # Deck reshuffled every hand unless one is passed in
+        self.rng = rng  # Optional np.random.Generator for the deck, e.g. one shared by all tables
         self.community_cards = []
         self.pot = 0
         self.current_bet = 0
@@ -82,8 +101,12 @@ class PokerGame:
             
         # Do NOT call reset_bets() here! Bets should only be reset after a betting round is complete.
         if deck is None:
-            self.deck = Deck()
-            self.deck.shuffle()
+            # Reuse the game's own deck: gather and reshuffle it in place
+            if self._own_deck is None:
+                self._own_deck = Deck(rng=self.rng)
+            else:
+                self._own_deck.reset()
+            self.deck = self._own_deck
         else:
             self.deck = deck
 
@@ -401,11 +424,7 @@ class PokerGame:
 
         print(f"[DEBUG] Entering step: phase_idx={self.phase_idx}, players_to_act={[p.name for p in self.players_to_act]}, action={action}")
 
-        # If players_to_act is empty and not showdown, re-initialize for new round
-        if not self.players_to_act and self.phase_idx < self.PHASES.index("showdown"):
-            self.players_to_act = [p for p in self.players if p.in_hand and not p.all_in and p.stack > 0]
-            if self.players_to_act:
-                self.current_player_idx = self.players.index(self.players_to_act[0])
+        self._start_round_if_needed()
 
         if self.hand_over:
             raise RuntimeError("Hand is over. Please reset for new hand.")
@@ -427,8 +446,7 @@ class PokerGame:
             self._advance_to_next_player()
             return self._get_state(), 0, self.hand_over, {}
 
-        to_call = self.current_bet - player.current_bet
-        to_call = max(0, to_call)  # Ensure non-negative
+        to_call = self.to_call(self.current_player_idx)
 
         # Handle human input if needed
         if player.is_human and action is None:
@@ -455,7 +473,7 @@ class PokerGame:
 
         elif action == "call":
             result = self.handle_call(player, to_call)
-            print(f"[DEBUG] {player.name} calls {result['call_amount']}{' (all-in)' if result['is_all_in'] else ''}.")
+            print(f"[DEBUG] {player.name} calls {result.call_amount}{' (all-in)' if result.is_all_in else ''}.")
 
         elif action == "check":
             result = self.handle_check(player, to_call)
@@ -473,7 +491,8 @@ class PokerGame:
         # --- Update active players ---
         self.active_players = [p for p in self.players if p.in_hand and p.stack > 0]
 
-        # Clean up players_to_act: only keep players who are still in hand and not all-in
+        # Clean up players_to_act in one pass: only players still in hand, not
+        # all-in and with chips can act, so an empty list ends the round
         self.players_to_act = [p for p in self.players_to_act if p.in_hand and not p.all_in and p.stack > 0]
 
         # Always remove the acting player from players_to_act (except after a raise, which resets the list)
@@ -481,16 +500,6 @@ class PokerGame:
             print(f"[DEBUG] Removing {player.name} from players_to_act")
             self.players_to_act.remove(player)
 
-        # Defensive check: ensure no folded or all-in players remain in players_to_act
-        for p in self.players_to_act:
-            if not p.in_hand or p.all_in:
-                print(f"[DEBUG] Removing {p.name} from players_to_act (folded or all-in)")
-                self.players_to_act.remove(p)
-
-        # If players_to_act is now empty or only contains non-actionable players, clear it and trigger hand termination
-        if not any(p.in_hand and not p.all_in and p.stack > 0 for p in self.players_to_act):
-            self.players_to_act = []
-
         # --- HAND TERMINATION LOGIC ---
         active_in_hand = [p for p in self.players if p.in_hand and p.stack > 0]
         if len(active_in_hand) == 1 and not self.players_to_act:
@@ -503,10 +512,10 @@ class PokerGame:
 
         elif all(p.all_in or p.stack == 0 for p in active_in_hand) and not self.players_to_act:
             # All-in showdown, no pending actions
-            if self.phase_idx < self.PHASES.index("showdown"):
-                while self.phase_idx < self.PHASES.index("showdown"):
+            if self.phase_idx < self.SHOWDOWN:
+                while self.phase_idx < self.SHOWDOWN:
                     self._advance_phase()
-            self.phase_idx = self.PHASES.index("showdown")
+            self.phase_idx = self.SHOWDOWN
             self.showdown()
             self.hand_over = True
             print("[DEBUG] Hand over: all players are all-in, go to showdown")
@@ -531,7 +540,7 @@ class PokerGame:
         # --- Check for all-in showdown ---
         if all(p.all_in or not p.in_hand for p in self.active_players) and not self.players_to_act:
             # All remaining players are all-in or folded: go to showdown
-            self.phase_idx = self.PHASES.index("showdown")
+            self.phase_idx = self.SHOWDOWN
             self.showdown()
             self.hand_over = True
             return
@@ -579,6 +588,49 @@ class PokerGame:
 
         return self._get_state(), 0, self.hand_over, {}
 
+    def to_call(self, player_idx):
+        """Chips the player at player_idx must add to call the current bet (never negative)."""
+        to_call = self.current_bet - self.players[player_idx].current_bet
+        return to_call if to_call > 0 else 0
+
+    def step_int(self, action_id, raise_amount=0):
+        """
+        step() for an int action id (utils.enums.ActionId), resolved by one
+        tuple index instead of building or comparing action strings.
+        """
+        return self.step(self.ACTION_NAMES[action_id], raise_amount)
+
+    def _start_round_if_needed(self):
+        """At the start of a betting round (players_to_act empty before showdown), queue everyone who can act."""
+        if not self.players_to_act and self.phase_idx < self.SHOWDOWN:
+            self.players_to_act = [p for p in self.players if p.in_hand and not p.all_in and p.stack > 0]
+            if self.players_to_act:
+                self.current_player_idx = self.players.index(self.players_to_act[0])
+
+    def step_checked(self, action, raise_amount=0):
+        """
+        Like step(), but an illegal action is reported instead of raised.
+        Returns (True, OK) once the action is applied, or (False, code) with
+        one of the engine.action_validation error codes (see ERROR_MESSAGES).
+        Fold, check and call are checked with a table lookup before step()
+        runs, so agents exploring illegal actions in self-play do not pay for
+        building exceptions, and a rejected one leaves the game untouched
+        (apart from queueing the players of a new betting round, as step()
+        would). A rejected raise is only found by step() itself: the chips
+        stay put, but step()'s bookkeeping before validation has run.
+        """
+        self._start_round_if_needed()
+        player = self.players[self.current_player_idx]
+        if not self.hand_over and player.in_hand and not player.all_in and action is not None:
+            code = action_error_code(action, player_stack=player.stack, to_call=self.to_call(self.current_player_idx))
+            if code != OK:
+                return False, code
+        try:
+            self.step(action, raise_amount)
+        except ActionValidationError as e:
+            return False, e.code or (ERR_INVALID_RAISE if action == "raise" else ERR_UNKNOWN_ACTION)
+        return True, OK
+
     def prompt_human_action(self, player, to_call):
         """
         Prompt the action by the human player.
@@ -715,8 +767,7 @@ class PokerGame:
         done = False
         while not done:
             player = self.players[self.current_player_idx]
-            to_call = self.current_bet - player.current_bet
-            to_call = max(0, to_call)  # Ensure non-negative
+            to_call = self.to_call(self.current_player_idx)
 
             if player.is_human:
                 # Human input will be requested inside step()
@@ -748,14 +799,15 @@ class PokerGame:
             result = validate_fold(in_hand=player.in_hand, to_call=to_call)
         except ValueError as e:
             print(f"Invalid fold by {player.name}: {e}")
-            raise ActionValidationError(str(e))
+            raise ActionValidationError(str(e), code=getattr(e, "code", None))
         player.fold()
-        return {
-            "player": player.name,
-            "can_fold": result["can_fold"],
-            "pot": self.pot,
-            "current_bet": self.current_bet,
-        }
+        return ActionResult(
+            kind="fold",
+            player=player.name,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            can_fold=result["can_fold"],
+        )
 
     def handle_check(self, player, to_call):
         print(f"[DEBUG handle_check] {player.name} called handle_check()")
@@ -765,25 +817,24 @@ class PokerGame:
             result = validate_check(to_call=to_call)
         except ValueError as e:
             print(f"Invalid check by {player.name}: {e}")
-            raise ActionValidationError(str(e))
-        return {
-            "player": player.name,
-            "can_check": result["can_check"],
-            "pot": self.pot,
-            "current_bet": self.current_bet,
-        }
+            raise ActionValidationError(str(e), code=getattr(e, "code", None))
+        return ActionResult(
+            kind="check",
+            player=player.name,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            can_check=result["can_check"],
+        )
 
     def handle_call(self, player, to_call):
         print(f"[DEBUG handle_call] {player.name} called handle_call()")
         if not isinstance(self.current_bet, int) or not isinstance(player.current_bet, int):
             raise ActionValidationError("current_bet and player.current_bet must be integers.")
-        if to_call == 0:
-            raise ActionValidationError("Cannot call when to_call is zero; should check instead.")
         try:
             result = validate_call(player_stack=player.stack, to_call=to_call)
         except ValueError as e:
             print(f"Invalid call by {player.name}: {e}")
-            raise ActionValidationError(str(e))
+            raise ActionValidationError(str(e), code=getattr(e, "code", None))
 
         call_amount = min(player.stack, to_call)
         self.collect_bet(player, call_amount)
@@ -796,13 +847,14 @@ class PokerGame:
         else:
             is_all_in = False
 
-        return {
-            "player": player.name,
-            "call_amount": call_amount,
-            "is_all_in": is_all_in,
-            "pot": self.pot,
-            "current_bet": self.current_bet,
-        }
+        return ActionResult(
+            kind="call",
+            player=player.name,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            call_amount=call_amount,
+            is_all_in=is_all_in,
+        )
 
     def handle_raise(self, player, raise_to: int, to_call):
         print(f"[DEBUG handle_raise] {player.name} called handle_raise({raise_to})")
@@ -821,7 +873,7 @@ class PokerGame:
                 player_current_bet=player.current_bet
             )
         except ValueError as e:
-            raise ActionValidationError(str(e))
+            raise ActionValidationError(str(e), code=getattr(e, "code", None))
 
         raise_amount = raise_to - player.current_bet  # Only pay the difference!
         actual_raise = raise_to - self.current_bet
@@ -850,16 +902,17 @@ class PokerGame:
 
         print(f"[DEBUG] {player.name} raises to {raise_to}. (Put in {raise_amount}, stack now {player.stack})")
 
-        return {
-            "player": player.name,
-            "raise_to": raise_to,
-            "raise_amount": raise_amount,
-            "actual_raise": actual_raise,
-            "is_all_in": player.all_in,
-            "pot": self.pot,
-            "current_bet": self.current_bet,
-            "last_raise_amount": self.last_raise_amount,
-        }
+        return ActionResult(
+            kind="raise",
+            player=player.name,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            is_all_in=player.all_in,
+            raise_to=raise_to,
+            raise_amount=raise_amount,
+            actual_raise=actual_raise,
+            last_raise_amount=self.last_raise_amount,
+        )
 
     def showdown(self):
         print("\n--- Showdown ---")
@@ -912,31 +965,41 @@ class PokerGame:
                 print(f"[SHOWDOWN] Adjusting pot from {self.pot} to calculated {total_pot}")
                 self.pot = total_pot
 
+        # Score hands from the cards' Cactus-Kev ints, one comparable int per
+        # hand; the board is converted once for every player
+        board_ck = [c.ck for c in self.community_cards]
         hand_ranks = {}
-        for p in self.players:
-            if p.in_hand or p.all_in:
+
+        def score(p):
+            # Scored on first use and memoized for the later side pots
+            if p not in hand_ranks:
                 try:
-                    hand_ranks[p] = hand_rank(p.hole_cards + self.community_cards)
+                    hand_ranks[p] = ck_score([c.ck for c in p.hole_cards] + board_ck)
                 except Exception as e:
                     print(f"Error evaluating hand for {p.name}: {e}")
                     hand_ranks[p] = None
+            return hand_ranks[p]
 
         for i, pot in enumerate(pots):
             eligible = [p for p in pot["players"] if (p.in_hand or p.all_in)]
             if not eligible:
                 print(f"No eligible players for pot {i+1}, skipping.")
                 continue
-            best_rank = None
-            winners = []
-            for p in eligible:
-                rank = hand_ranks.get(p)
-                if rank is None:
-                    continue
-                if best_rank is None or rank > best_rank:
-                    best_rank = rank
-                    winners = [p]
-                elif rank == best_rank:
-                    winners.append(p)
+            # An uncontested pot (e.g. a short all-in's excess) needs no evaluation
+            if len(eligible) == 1:
+                winners = eligible
+            else:
+                best_rank = None
+                winners = []
+                for p in eligible:
+                    rank = score(p)
+                    if rank is None:
+                        continue
+                    if best_rank is None or rank > best_rank:
+                        best_rank = rank
+                        winners = [p]
+                    elif rank == best_rank:
+                        winners.append(p)
             if not winners:
                 print(f"No winners for pot {i+1}, skipping.")
                 continue
@@ -1,141 +1,295 @@
 # poker-ai/engine/hand_evaluator.py
 
-from collections import Counter
-from itertools import combinations
-
-# Map ranks to numeric values as per poker convention
-RANK_MAP = {
-    '2': 2,
-    '3': 3,
-    '4': 4,
-    '5': 5,
-    '6': 6,
-    '7': 7,
-    '8': 8,
-    '9': 9,
-    'T': 10,
-    'J': 11,
-    'Q': 12,
-    'K': 13,
-    'A': 14,
+import numpy as np
+
+# Cards carry their int rank (2-14) and suit (0-3), so no string lookups here
+from engine.cards import RANKS, SUITS, cactus_kev
+from engine._eval_jit import HAVE_NUMBA, evaluate_hand_jit
+from engine.hand_ranks_table import (
+    FLUSHES, PRODUCTS, STRAIGHT_HIGH, UNIQUE5, pack_score, score_to_rank,
+)
+
+# Native popcount on Python 3.10+, string count fallback before that
+_popcount = getattr(int, "bit_count", None) or (lambda x: bin(x).count("1"))
+
+def rank_mask(ranks):
+    """Return a bitmask with bit r set for every rank r (2-14) present."""
+    mask = 0
+    for r in ranks:
+        mask |= 1 << r
+    return mask
+
+def straight_ranks(high):
+    """Return the five ranks of the straight topped by `high`, wheel Ace last."""
+    if high == 5:
+        return (5, 4, 3, 2, 14)
+    return tuple(range(high, high - 5, -1))
+
+# Multiplicity of each rank listed after the category in a rank tuple, used
+# to rebuild the best five from the tuple alone (straights are handled apart)
+GROUP_SIZES = {
+    0: (1, 1, 1, 1, 1),  # High card
+    1: (2, 1, 1, 1),     # One pair
+    2: (2, 2, 1),        # Two pair
+    3: (3, 1, 1),        # Three of a kind
+    5: (1, 1, 1, 1, 1),  # Flush
+    6: (3, 2),           # Full house
+    7: (4, 1),           # Four of a kind
 }
 
-def card_rank(card):
-    """Return the poker rank of a card as an int 2-14."""
-    return RANK_MAP[card.rank]
+def ncount(best, rank):
+    """Return how many cards of `rank` (2-14) are in a best-five nibble set."""
+    return (best >> (4 * rank)) & 0xF
+
+def best_ranks(rank):
+    """Return the best five card ranks implied by a rank tuple as a tuple, biggest group first."""
+    if rank[0] in (4, 8):
+        return straight_ranks(rank[1])
+    return tuple(r for r, size in zip(rank[1:], GROUP_SIZES[rank[0]]) for _ in range(size))
+
+def best_nibbles(rank):
+    """
+    Pack the best five card ranks implied by a rank tuple into one int,
+    4 bits per rank: the count of rank r lives at bits 4r..4r+3.
+    """
+    best = 0
+    for r in best_ranks(rank):
+        best += 1 << (4 * r)
+    return best
+
+WHEEL_NIBBLES = sum(1 << (4 * r) for r in (14, 5, 4, 3, 2))
+
+def best_as_tuple(best):
+    """Expand a best-five nibble set into a tuple of ranks, biggest group first."""
+    if best == WHEEL_NIBBLES:
+        return straight_ranks(5)
+    return tuple(
+        r
+        for count in (4, 3, 2, 1)
+        for r in range(14, 1, -1)
+        if ncount(best, r) == count
+        for _ in range(count)
+    )
+
+def pack_cards(cards):
+    """Pack Card objects into bytes, one (rank_idx << 2 | suit_idx) byte per card."""
+    return bytes(c.packed for c in cards)
+
+# Cactus-Kev int for every packed card byte (unused bytes stay 0)
+PACKED_TO_CK = [0] * 64
+for _rank_idx in range(2, 2 + len(RANKS)):
+    for _suit_idx in range(len(SUITS)):
+        PACKED_TO_CK[(_rank_idx << 2) | _suit_idx] = cactus_kev(_rank_idx, _suit_idx)
+
+CK_SUIT_BITS = 0xF000
+# Bit offset of each suit's lane, keyed by the Cactus-Kev one-hot suit nibble
+SUIT_LANE_SHIFT = {1: 0, 2: 16, 4: 32, 8: 48}
+WORST_STRAIGHT_FLUSH = pack_score(8, 5)
+
+class Evaluator:
+    """
+    Hand evaluator. Its lookup tables (engine.hand_ranks_table) are built
+    once at import and shared; create one instance and reuse it
+    (evaluate_hand and evaluate_hand_nibbles use a module default).
+    With use_jit (the default when Numba is installed) hands go through the
+    compiled kernel in engine._eval_jit instead of the pure-Python path.
+    """
+
+    def __init__(self, use_jit=HAVE_NUMBA):
+        self.use_jit = use_jit
+
+    def evaluate(self, cards):
+        """
+        Evaluate the best 5-card poker hand from 7 cards.
+        `cards` may be a list of Card objects or an already packed bytes-like
+        buffer (see pack_cards) for hot loops that evaluate the same cards often.
+        Returns (rank_tuple, best_five) where best_five lists the five card
+        ranks (2-14), biggest group first, or (None, None) for fewer than five.
+        """
+        return self._result(self.score(cards))
+
+    def evaluate_packed(self, packed):
+        """Evaluate a pack_cards() buffer directly, skipping the input type check."""
+        return self._result(self.score_packed(packed))
+
+    def evaluate_nibbles(self, cards):
+        """
+        evaluate() for hot loops: returns (rank_tuple, best) where best is the
+        nibble set from best_nibbles() instead of a list, so no list is built
+        per hand. Use ncount() to query it or best_as_tuple() to display it.
+        """
+        return self._result(self.score(cards), nibbles=True)
+
+    def score(self, cards):
+        """
+        Return the best hand as one pack_score() int, or None for fewer than
+        five cards. Higher scores win, so comparing two hands is a single int
+        compare and no rank tuple is built.
+        """
+        if isinstance(cards, (bytes, bytearray, memoryview)):
+            return self.score_packed(cards)
+        if self.use_jit:
+            return self._score_jit(np.fromiter((c.packed for c in cards), dtype=np.uint8, count=len(cards)))
+        return self._score_ck([c.ck for c in cards])
+
+    def score_packed(self, packed):
+        """score() for a pack_cards() buffer."""
+        if self.use_jit:
+            return self._score_jit(np.frombuffer(packed, dtype=np.uint8))
+        return self._score_ck([PACKED_TO_CK[b] for b in packed])
+
+    def _score_jit(self, packed):
+        if len(packed) < 5:
+            return None
+        return int(evaluate_hand_jit(packed >> 2, packed & 3))
+
+    def _score_ck(self, cks):
+        if len(cks) < 5:
+            return None
+        return ck_score(cks)
+
+    def _result(self, score, nibbles=False):
+        if score is None:
+            return None, None
+        best_rank = score_to_rank(score)
+        if nibbles:
+            return best_rank, best_nibbles(best_rank)
+        return best_rank, list(best_ranks(best_rank))
+
+_default_evaluator = Evaluator()
 
 def evaluate_hand(cards):
-    """Evaluate the best 5-card poker hand from 7 cards."""
-    best_rank = None
-    best_five = None
+    """Evaluate the best 5-card poker hand from 7 cards with the shared default Evaluator."""
+    return _default_evaluator.evaluate(cards)
 
-    for five_cards in combinations(cards, 5):
-        rank, ranked_five = hand_rank(five_cards)
-        if best_rank is None or rank > best_rank:
-            best_rank = rank
-            best_five = ranked_five
+def evaluate_hand_packed(packed):
+    """Evaluate a pack_cards() buffer with the shared default Evaluator."""
+    return _default_evaluator.evaluate_packed(packed)
 
-    return best_rank, best_five
+def evaluate_hand_nibbles(cards):
+    """evaluate_hand() with the best five as a nibble set (see Evaluator.evaluate_nibbles)."""
+    return _default_evaluator.evaluate_nibbles(cards)
+
+def hand_score(cards):
+    """Return the best hand in `cards` as one comparable int (see Evaluator.score)."""
+    return _default_evaluator.score(cards)
 
 def hand_rank(cards):
-    """Return (rank_tuple, cards) for a 5-card hand."""
-    ranks = sorted([card_rank(card) for card in cards], reverse=True)
-    suits = [card.suit for card in cards]
-
-    rank_counts = Counter(ranks)
-    counts = sorted(rank_counts.values(), reverse=True)
-    sorted_ranks = sorted(rank_counts.keys(), key=lambda r: (rank_counts[r], r), reverse=True)
-
-    def get_cards_by_ranks(target_ranks):
-        result = []
-        for rank in target_ranks:
-            result.extend([c for c in cards if card_rank(c) == rank])
-        return result[:5]
-
-    flush = None
-    for suit in set(suits):
-        suited_cards = [card for card in cards if card.suit == suit]
-        if len(suited_cards) >= 5:
-            flush = sorted(suited_cards, key=card_rank, reverse=True)
-            break
-
-    def straight(ranks_list):
-        ranks_set = set(ranks_list)
-        for high in range(14, 5 - 1, -1):
-            needed = set(range(high, high - 5, -1))
-            if needed.issubset(ranks_set):
-                return high
-        if {14, 2, 3, 4, 5}.issubset(ranks_set):
-            return 5
-        return None
-
-    # Straight flush
-    if flush:
-        flush_ranks = [card_rank(c) for c in flush]
-        sf_high = straight(flush_ranks)
-        if sf_high is not None:
-            straight_flush_cards = []
-            needed = list(range(sf_high, sf_high - 5, -1)) if sf_high != 5 else [5, 4, 3, 2, 14]
-            for r in needed:
-                for c in flush:
-                    if card_rank(c) == r and c not in straight_flush_cards:
-                        straight_flush_cards.append(c)
-                        break
-            return (8, sf_high), [card_rank(c) for c in straight_flush_cards]
+    """Return (rank_tuple, best_five_ranks_list) for the best hand in `cards` (any count)."""
+    rank = hand_category(cards)
+    return rank, list(best_ranks(rank))
+
+def hand_category(cards):
+    """Return the comparable rank tuple (category, tie-breakers...) for the best hand in `cards`."""
+    if len(cards) > 5:
+        return score_to_rank(_default_evaluator.score(cards))
+    return ck_category([c.ck for c in cards])
+
+def ck_category(cks):
+    """Return the rank tuple for up to five Cactus-Kev ints."""
+    return score_to_rank(ck_score(cks))
+
+# Lowest bit of every rank's 4-bit lane in a rank-count histogram
+RANK_LANES = sum(1 << (4 * r) for r in range(2, 15))
+
+def lanes_desc(lanes, limit=13):
+    """Return up to `limit` ranks flagged in a lane mask, highest first."""
+    ranks = []
+    while lanes and len(ranks) < limit:
+        top = lanes.bit_length() - 1
+        ranks.append(top >> 2)
+        lanes ^= 1 << top
+    return ranks
+
+def top_lane(lanes):
+    """Return the highest rank flagged in a non-empty lane mask."""
+    return (lanes.bit_length() - 1) >> 2
+
+def ck_score(cks):
+    """
+    Return the pack_score() int for the best hand in any number of
+    Cactus-Kev ints, without enumerating 5-card subsets. Exactly five cards
+    are one table lookup. Otherwise one pass over the cards fills a 16-bit
+    rank lane per suit (flushes) and a SWAR rank-count histogram with one
+    4-bit count per rank (everything else), and the category is read off those.
+    """
+    if len(cks) == 5:
+        c0, c1, c2, c3, c4 = cks
+        ranks = (c0 | c1 | c2 | c3 | c4) >> 16
+        if c0 & c1 & c2 & c3 & c4 & CK_SUIT_BITS:
+            return FLUSHES[ranks]
+        return UNIQUE5[ranks] or PRODUCTS[
+            (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+        ]
+
+    lanes = 0
+    hist = 0
+    for c in cks:
+        lanes |= (c >> 16) << SUIT_LANE_SHIFT[(c >> 12) & 0xF]
+        hist += 1 << (4 * (((c >> 8) & 0xF) + 2))
+
+    # A suit lane with five or more bits is a flush
+    flush_score = -1
+    for shift in (0, 16, 32, 48):
+        mask = (lanes >> shift) & 0x1FFF
+        if _popcount(mask) >= 5:
+            high = STRAIGHT_HIGH[mask]
+            if high:
+                score = pack_score(8, high)  # Straight flush
+            else:
+                # Keep the five highest bits, MSB first
+                top5 = 0
+                for _ in range(5):
+                    high_bit = 1 << (mask.bit_length() - 1)
+                    top5 |= high_bit
+                    mask ^= high_bit
+                score = FLUSHES[top5]
+            flush_score = max(flush_score, score)
+    if flush_score >= WORST_STRAIGHT_FLUSH:
+        return flush_score
+
+    # Lane counts: 4 = 0b100, 3 = 0b011, 2 = 0b010, 1 = 0b001
+    quads = (hist >> 2) & RANK_LANES
+    trips = hist & (hist >> 1) & RANK_LANES
+    pairs = (hist >> 1) & ~hist & RANK_LANES
+    singles = hist & ~(hist >> 1) & RANK_LANES
+    present = quads | trips | pairs | singles
 
     # Four of a kind
-    if counts[0] == 4:
-        four_rank = sorted_ranks[0]
-        kicker = max(r for r in ranks if r != four_rank)
-        cards_out = get_cards_by_ranks([four_rank, kicker])
-        return (7, four_rank, kicker), [card_rank(c) for c in cards_out]
-
-    # Full house
-    if counts[0] == 3 and counts[1] >= 2:
-        three_rank = sorted_ranks[0]
-        pair_rank = sorted_ranks[1]
-        cards_out = get_cards_by_ranks([three_rank, pair_rank])
-        return (6, three_rank, pair_rank), [card_rank(c) for c in cards_out]
+    if quads:
+        quad = top_lane(quads)
+        return pack_score(7, quad, *lanes_desc(present & ~(1 << (4 * quad)), 1))
+
+    # Full house (a second set of trips plays as the pair)
+    if trips:
+        trip = top_lane(trips)
+        rest = (trips | pairs) & ~(1 << (4 * trip))
+        if rest:
+            return pack_score(6, trip, top_lane(rest))
 
     # Flush
-    if flush:
-        return (5, *[card_rank(c) for c in flush[:5]]), [card_rank(c) for c in flush[:5]]
+    if flush_score >= 0:
+        return flush_score
 
     # Straight
-    straight_high = straight(ranks)
-    if straight_high is not None:
-        needed = list(range(straight_high, straight_high - 5, -1)) if straight_high != 5 else [5, 4, 3, 2, 14]
-        straight_cards = []
-        used = set()
-        for r in needed:
-            for c in cards:
-                if card_rank(c) == r and c not in used:
-                    straight_cards.append(c)
-                    used.add(c)
-                    break
-        return (4, straight_high), [card_rank(c) for c in straight_cards]
+    high = STRAIGHT_HIGH[(lanes | lanes >> 16 | lanes >> 32 | lanes >> 48) & 0x1FFF]
+    if high:
+        return pack_score(4, high)
 
     # Three of a kind
-    if counts[0] == 3:
-        three_rank = sorted_ranks[0]
-        kickers = sorted([r for r in ranks if r != three_rank], reverse=True)[:2]
-        cards_out = get_cards_by_ranks([three_rank] + kickers)
-        return (3, three_rank, *kickers), [card_rank(c) for c in cards_out]
-
-    # Two pair
-    if counts[0] == 2 and counts[1] == 2:
-        high_pair = sorted_ranks[0]
-        low_pair = sorted_ranks[1]
-        kicker = max(r for r in ranks if r != high_pair and r != low_pair)
-        cards_out = get_cards_by_ranks([high_pair, low_pair, kicker])
-        return (2, high_pair, low_pair, kicker), [card_rank(c) for c in cards_out]
+    if trips:
+        return pack_score(3, trip, *lanes_desc(singles, 2))
+
+    # Two pair (a third pair can play as the kicker)
+    pair_ranks = lanes_desc(pairs, 2)
+    if len(pair_ranks) >= 2:
+        high_pair, low_pair = pair_ranks
+        rest = present & ~(1 << (4 * high_pair)) & ~(1 << (4 * low_pair))
+        return pack_score(2, high_pair, low_pair, *lanes_desc(rest, 1))
 
     # One pair
-    if counts[0] == 2:
-        pair_rank = sorted_ranks[0]
-        kickers = sorted([r for r in ranks if r != pair_rank], reverse=True)[:3]
-        cards_out = get_cards_by_ranks([pair_rank] + kickers)
-        return (1, pair_rank, *kickers), [card_rank(c) for c in cards_out]
+    if pair_ranks:
+        return pack_score(1, pair_ranks[0], *lanes_desc(singles, 3))
 
     # High card
-    return (0, *ranks[:5]), [card_rank(c) for c in sorted(cards, key=card_rank, reverse=True)[:5]]
+    return pack_score(0, *lanes_desc(singles, 5))
@@ -0,0 +1,86 @@
+# poker-ai/engine/hand_ranks_table.py
+
+"""
+Cactus-Kev style lookup tables for 5-card hands, built once on first import.
+
+- FLUSHES: 13-bit rank bitmask (bit i = rank i + 2) -> score of five suited cards
+- UNIQUE5: 13-bit rank bitmask -> score of five distinct ranks, not suited
+  (0 when the mask does not have exactly five bits set)
+- PRODUCTS: product of the rank primes -> score of every hand with a paired rank
+- STRAIGHT_HIGH: 13-bit rank bitmask -> high card of its best straight, or 0
+
+Scores are pack_score() ints, so a higher score is the better hand.
+"""
+
+from array import array
+from itertools import combinations, combinations_with_replacement
+from math import prod
+
+from engine.cards import PRIMES
+
+def straight_high(mask):
+    """Return the high card of the best straight in a rank mask, or None.
+
+    The Ace is folded into bit 1 so the wheel (A-2-3-4-5) falls out of the
+    same shift-AND chain as every other straight.
+    """
+    m = mask | ((mask >> 14) & 1) << 1
+    s = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    if not s:
+        return None
+    return s.bit_length() + 3
+
+# High card (5-14) of the best straight for each 13-bit rank mask (bit i =
+# rank i + 2), 0 when there is none, so finding a straight is one index
+STRAIGHT_HIGH = array('b', [straight_high(mask << 2) or 0 for mask in range(1 << 13)])
+
+def pack_score(category, *ranks):
+    """
+    Pack a category and up to five tie-break ranks into one int,
+    category in bits 20-23 and one 4-bit rank per slot below it, so
+    plain int comparison orders hands the same way rank tuples do.
+    """
+    score = category
+    for i in range(5):
+        score = (score << 4) | (ranks[i] if i < len(ranks) else 0)
+    return score
+
+def score_to_rank(score):
+    """Unpack a pack_score() int back into its (category, ranks...) tuple."""
+    ranks = [(score >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+    while ranks and ranks[-1] == 0:
+        ranks.pop()
+    return (score >> 20, *ranks)
+
+# Category of a paired hand by its group sizes, largest first
+PAIRED_CATEGORIES = {
+    (4, 1): 7,        # Four of a kind
+    (3, 2): 6,        # Full house
+    (3, 1, 1): 3,     # Three of a kind
+    (2, 2, 1): 2,     # Two pair
+    (2, 1, 1, 1): 1,  # One pair
+}
+
+def build_tables():
+    """Return fresh (flushes, unique5, products) tables."""
+    flushes = [0] * (1 << 13)
+    unique5 = [0] * (1 << 13)
+    products = {}
+
+    for five in combinations(range(14, 1, -1), 5):
+        key = sum(1 << (r - 2) for r in five)
+        high = STRAIGHT_HIGH[key]
+        flushes[key] = pack_score(8, high) if high else pack_score(5, *five)
+        unique5[key] = pack_score(4, high) if high else pack_score(0, *five)
+
+    for five in combinations_with_replacement(range(14, 1, -1), 5):
+        counts = {r: five.count(r) for r in five}
+        sizes = tuple(sorted(counts.values(), reverse=True))
+        if sizes not in PAIRED_CATEGORIES:
+            continue  # five distinct ranks, or five of a kind
+        groups = sorted(counts, key=lambda r: (counts[r], r), reverse=True)
+        products[prod(PRIMES[r - 2] for r in five)] = pack_score(PAIRED_CATEGORIES[sizes], *groups)
+
+    return flushes, unique5, products
+
+FLUSHES, UNIQUE5, PRODUCTS = build_tables()
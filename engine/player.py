@@ -1,14 +1,23 @@
 # poker-ai/engine/player.py
 
-
+import copy
 from typing import Optional
 from typing import Optional, List
 from agents.base_agent import BaseAgent
 from engine.cards import Card
 
 class Player:
+    # Fixed attribute set: no per-player __dict__, and attribute access goes
+    # through slot descriptors (subclasses without __slots__ still get a dict)
+    __slots__ = (
+        'name', '_stacks', '_slot', '_stack', 'hole_cards', 'current_bet',
+        'in_hand', 'is_human', 'all_in', 'total_contributed', 'agent',
+    )
+
     def __init__(self, name: str, stack: int = 1000, is_human: bool = False):
         self.name = name
+        self._stacks = None  # env-owned stack array, see bind_stack()
+        self._slot = 0
         self.stack = stack
         self.hole_cards: List[Card] = []
         self.current_bet = 0
@@ -18,25 +27,68 @@ class Player:
         self.total_contributed = 0  # Track total chips put in pot this hand
         self.agent = None  # type: Optional[BaseAgent]
 
+    @property
+    def stack(self) -> int:
+        if self._stacks is None:
+            return self._stack
+        return int(self._stacks[self._slot])
+
+    @stack.setter
+    def stack(self, value: int):
+        if self._stacks is None:
+            self._stack = value
+        else:
+            self._stacks[self._slot] = value
+
+    def reset(self, stack: int):
+        """Restore the state of a player just sat down with `stack` chips, keeping name and agent."""
+        self.stack = stack
+        self.current_bet = 0
+        self.total_contributed = 0
+        self.in_hand = True
+        self.all_in = False
+        self.hole_cards = []
+
+    def bind_stack(self, stacks, slot: int):
+        """Keep this player's stack in stacks[slot] from now on, carrying the current value over."""
+        stacks[slot] = self.stack
+        self._stacks, self._slot = stacks, slot
+
+    def __deepcopy__(self, memo):
+        # Every field is a plain value except the hole cards (immutable Cards,
+        # so a new list is enough), the shared stack array and the agent
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        for name in Player.__slots__:
+            setattr(clone, name, getattr(self, name))
+        if hasattr(self, '__dict__'):
+            clone.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        clone.hole_cards = list(self.hole_cards)
+        clone._stacks = copy.deepcopy(self._stacks, memo)
+        clone.agent = copy.deepcopy(self.agent, memo)
+        return clone
+
     def deal_hole_cards(self, cards):
         if len(cards) != 2:
             raise ValueError("Texas Hold'em players get exactly 2 hole cards.")
         self.hole_cards = cards
 
     def bet_chips(self, amount, suppress_log=False):
+        # stack is a property (env-backed when seated), so read and write it once
         old_stack = self.stack
         old_current_bet = self.current_bet
         old_total_contributed = self.total_contributed
         print(f"[PLAYER bet_chips] {self.name} called bet_chips({amount}, suppress_log={suppress_log})")
-        actual_bet = min(self.stack, amount)
-        self.stack -= actual_bet
+        actual_bet = amount if amount < old_stack else old_stack
+        stack = old_stack - actual_bet
+        self.stack = stack
         self.current_bet += actual_bet
         self.total_contributed += actual_bet  # Track total for side pots
-        if self.stack == 0:
+        if stack == 0:
             self.all_in = True  # Player is all-in if no chips left
-        print(f"[PLAYER bet_chips] {self.name}: amount={amount}, stack: {old_stack}->{self.stack}, current_bet: {old_current_bet}->{self.current_bet}, total_contributed: {old_total_contributed}->{self.total_contributed}")
+        print(f"[PLAYER bet_chips] {self.name}: amount={amount}, stack: {old_stack}->{stack}, current_bet: {old_current_bet}->{self.current_bet}, total_contributed: {old_total_contributed}->{self.total_contributed}")
         if not suppress_log:
-            print(f"[PLAYER] {self.name} bets {actual_bet}. Remaining stack: {self.stack}")
+            print(f"[PLAYER] {self.name} bets {actual_bet}. Remaining stack: {stack}")
         return actual_bet
 
     def post_ante(self, amount, suppress_log=False):
@@ -44,16 +96,17 @@ class Player:
         old_stack = self.stack
         old_total_contributed = self.total_contributed
         print(f"[PLAYER post_ante] {self.name} called post_ante({amount}, suppress_log={suppress_log})")
-        actual_ante = min(self.stack, amount)
-        self.stack -= actual_ante
+        actual_ante = amount if amount < old_stack else old_stack
+        stack = old_stack - actual_ante
+        self.stack = stack
         # NOTE: Ante does NOT count toward current_bet in Texas Hold'em
         # self.current_bet += actual_ante  # <-- This line is intentionally commented out
         self.total_contributed += actual_ante  # Track total for side pots
-        if self.stack == 0:
+        if stack == 0:
             self.all_in = True  # Player is all-in if no chips left
-        print(f"[PLAYER post_ante] {self.name}: amount={amount}, stack: {old_stack}->{self.stack}, total_contributed: {old_total_contributed}->{self.total_contributed}")
+        print(f"[PLAYER post_ante] {self.name}: amount={amount}, stack: {old_stack}->{stack}, total_contributed: {old_total_contributed}->{self.total_contributed}")
         if not suppress_log:
-            print(f"[PLAYER] {self.name} posts ante of {actual_ante}. Remaining stack: {self.stack}")
+            print(f"[PLAYER] {self.name} posts ante of {actual_ante}. Remaining stack: {stack}")
         return actual_ante
 
     def fold(self):
@@ -67,6 +120,14 @@ class Player:
         self.all_in = False  # Reset all-in status at the start of a new hand
         self.total_contributed = 0  # Reset for new hand
 
+    def reset_to(self, **state):
+        """Overwrite player fields directly (e.g. stack=970, current_bet=30) without logging."""
+        for key, value in state.items():
+            if not hasattr(self, key):
+                raise AttributeError(f"Player has no attribute '{key}'")
+            setattr(self, key, value)
+        return self
+
     def decide_action(self, to_call, community_cards):
         # Simple AI logic for testing:
         if to_call == 0:
@@ -1,22 +1,56 @@
 import sys
 import gymnasium as gym
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
 from engine.player import Player
 from engine.game import PokerGame
 from engine.action_validation import validate_raise
 import builtins
+import copy
 import random
 import math
+from collections import Counter, deque
 
 # Suppress print statements for cleaner output
 # builtins.print = lambda *args, **kwargs: None  # TEMPORARILY DISABLED FOR DEBUGGING
 
+# Realistic turbo tournament blind structure (9-hand levels) as (sb, bb, ante
+# flag), used by every env built without a blinds_schedule
+TURBO_BLINDS_SCHEDULE: Tuple[Tuple[int, int, int], ...] = (
+    (10, 20, 0),     # Level 1 - no ante
+    (20, 40, 0),     # Level 2 - no ante
+    (30, 60, 1),     # Level 3 - antes begin
+    (40, 80, 1),     # Level 4 - antes continue
+    (50, 100, 1),    # Level 5 - antes continue
+    (60, 120, 1),    # Level 6 - antes continue
+    (80, 160, 1),    # Level 7 - antes continue
+    (100, 200, 1),   # Level 8 - antes continue
+    (150, 300, 1),   # Level 9 - antes continue
+    (250, 500, 1),   # Level 10 - aggressive escalation for late game
+    (400, 800, 1),   # Level 11 - very aggressive
+    (600, 1200, 1),  # Level 12 - force action
+    (1000, 2000, 1), # Level 13 - extreme pressure
+    (1500, 3000, 1), # Level 14 - tournament should end soon
+    (2500, 5000, 1), # Level 15 - endgame
+    (4000, 8000, 1), # Level 16 - force heads-up conclusion
+    (6000, 12000, 1), # Level 17 - emergency level
+    (10000, 20000, 1), # Level 18 - final emergency level
+)
+_TURBO_BLINDS_ARR = np.array(TURBO_BLINDS_SCHEDULE, dtype=np.int64)
+_TURBO_BLINDS_ARR.flags.writeable = False
+
 class Table:
     """Represents a single poker table in the tournament"""
     def __init__(self, table_id: int, players: List[Player], starting_stack: int, 
-                 small_blind: int = 10, big_blind: int = 20, ante: int = 0):
+                 small_blind: int = 10, big_blind: int = 20, ante: int = 0,
+                 on_active_change: Optional[Callable[[int, bool], None]] = None,
+                 on_seat_change: Optional[Callable[[int, Player, bool], None]] = None):
         self.table_id = table_id
+        # Called with (table_id, is_active) whenever the table opens or closes
+        self.on_active_change = on_active_change
+        # Called with (table_id, player, seated) after add_player/remove_player
+        self.on_seat_change = on_seat_change
+        self._is_active = False
         self.players = players
         self.game = PokerGame(players, starting_stack=starting_stack, 
                             small_blind=small_blind, big_blind=big_blind, ante=ante, table_id=table_id)
@@ -25,6 +59,17 @@ class Table:
         self.hands_played = 0
         self.is_active = len(players) >= 2
         self._last_elimination_signature: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, value: bool):
+        if value != self._is_active:
+            self._is_active = value
+            if self.on_active_change is not None:
+                self.on_active_change(self.table_id, value)
         
     def get_active_player_count(self) -> int:
         """Get number of players with chips remaining"""
@@ -40,6 +85,8 @@ class Table:
             # Invariant check
             if self.players is not self.game.players:
                 print(f"[INVARIANT WARNING] Table {self.table_id}: self.players is not self.game.players after remove_player")
+            if self.on_seat_change is not None:
+                self.on_seat_change(self.table_id, player, False)
             return True
         return False
     
@@ -63,6 +110,8 @@ class Table:
         # Invariant check
         if self.players is not self.game.players:
             print(f"[INVARIANT WARNING] Table {self.table_id}: self.players is not self.game.players after add_player")
+        if self.on_seat_change is not None:
+            self.on_seat_change(self.table_id, player, True)
         return True
     def check_player_list_invariant(self, context=""):
         """Check that self.players is self.game.players"""
@@ -82,7 +131,9 @@ class MultiTableTournamentEnv(gym.Env):
                  starting_stack: int = 1000,
                  blinds_schedule: Optional[List[Tuple[int, int, int]]] = None,
                  hands_per_blind_level: int = 9,
-                 table_balancing_threshold: int = 5):
+                 table_balancing_threshold: int = 5,
+                 verbose: bool = False,
+                 debug: bool = False):
         """
         Initialize multi-table tournament environment.
         
@@ -91,23 +142,17 @@ class MultiTableTournamentEnv(gym.Env):
             max_players_per_table: Maximum players per table
             min_players_per_table: Minimum players before table breaking (2 for heads-up)
             starting_stack: Starting chip stack for each player
-            blinds_schedule: List of (small_blind, big_blind) tuples
+            blinds_schedule: List of (small_blind, big_blind) tuples (TURBO_BLINDS_SCHEDULE if omitted)
             hands_per_blind_level: Hands before blind level increases (9 for turbo)
             table_balancing_threshold: Trigger table balancing when table drops below this (5)
+            verbose: Also print tournament events (eliminations, Sharky's stack) as they happen
+            debug: Print [BALANCE_TABLE]/[DEBUG] traces from table balancing and elimination bookkeeping
         """
         super().__init__()
         
         # Input validation
-        if total_players < 2:
-            raise ValueError("Tournament must have at least 2 players")
-        if max_players_per_table < 2:
-            raise ValueError("Maximum players per table must be at least 2")
-        if starting_stack <= 0:
-            raise ValueError("Starting stack must be positive")
-        if hands_per_blind_level <= 0:
-            raise ValueError("Hands per blind level must be positive")
-        if table_balancing_threshold < 2:
-            raise ValueError("Table balancing threshold must be at least 2")
+        self._check_config(total_players, max_players_per_table, starting_stack,
+                           hands_per_blind_level, table_balancing_threshold)
         
         # Tournament configuration
         self.total_players = total_players
@@ -116,51 +161,59 @@ class MultiTableTournamentEnv(gym.Env):
         self.starting_stack = starting_stack
         self.table_balancing_threshold = table_balancing_threshold
         self.hands_per_blind_level = hands_per_blind_level
+        self.verbose = verbose
+        self.debug = debug
         
-        # Realistic turbo tournament blind structure (9-hand levels)
-        self.blinds_schedule = blinds_schedule or [
-            (10, 20, 0),     # Level 1 - no ante
-            (20, 40, 0),     # Level 2 - no ante
-            (30, 60, 1),     # Level 3 - antes begin
-            (40, 80, 1),     # Level 4 - antes continue
-            (50, 100, 1),    # Level 5 - antes continue
-            (60, 120, 1),    # Level 6 - antes continue
-            (80, 160, 1),    # Level 7 - antes continue
-            (100, 200, 1),   # Level 8 - antes continue
-            (150, 300, 1),   # Level 9 - antes continue
-            (250, 500, 1),   # Level 10 - aggressive escalation for late game
-            (400, 800, 1),   # Level 11 - very aggressive
-            (600, 1200, 1),  # Level 12 - force action
-            (1000, 2000, 1), # Level 13 - extreme pressure
-            (1500, 3000, 1), # Level 14 - tournament should end soon
-            (2500, 5000, 1), # Level 15 - endgame
-            (4000, 8000, 1), # Level 16 - force heads-up conclusion
-            (6000, 12000, 1), # Level 17 - emergency level
-            (10000, 20000, 1), # Level 18 - final emergency level
-        ]
+        # Recent tournament events as (kind, payload) tuples, newest last
+        self.events: Deque[Tuple[str, Dict[str, Any]]] = deque(maxlen=1024)
         
-        # Validate and normalize blind schedule
-        self._validate_blind_schedule()
-        
-        # Validate blind schedule (now all levels are 3-tuples after normalization)
-        if not self.blinds_schedule or len(self.blinds_schedule) == 0:
-            raise ValueError("Blind schedule cannot be empty")
-        for i, blind_level in enumerate(self.blinds_schedule):
-            sb, bb, ante = blind_level  # All levels are 3-tuples after normalization
+        self.blinds_schedule: Sequence[Tuple[int, int, int]]
+        if not blinds_schedule:
+            # The default schedule is checked once at import and shared
+            self.blinds_schedule = TURBO_BLINDS_SCHEDULE
+            self._blinds_arr = _TURBO_BLINDS_ARR
+        else:
+            # Validate and normalize blind schedule (into a new list)
+            self._validate_blind_schedule(blinds_schedule)
             
-            if sb <= 0 or bb <= 0:
-                raise ValueError(f"Invalid blinds at level {i}: ({sb}, {bb})")
-            if bb <= sb:
-                raise ValueError(f"Big blind must be greater than small blind at level {i}: ({sb}, {bb})")
-            if ante < 0:
+            # (levels, 3) array of (sb, bb, ante) so every level is checked at once
+            self._blinds_arr = np.array(self.blinds_schedule, dtype=np.int64)
+            sbs, bbs, antes = self._blinds_arr.T
+            bad_levels = np.flatnonzero((sbs <= 0) | (bbs <= 0) | (bbs <= sbs) | (antes < 0))
+            if len(bad_levels):
+                i = int(bad_levels[0])
+                sb, bb, ante = self.blinds_schedule[i]
+                if sb <= 0 or bb <= 0:
+                    raise ValueError(f"Invalid blinds at level {i}: ({sb}, {bb})")
+                if bb <= sb:
+                    raise ValueError(f"Big blind must be greater than small blind at level {i}: ({sb}, {bb})")
                 raise ValueError(f"Ante cannot be negative at level {i}: {ante}")
+        self._max_blind_level = len(self._blinds_arr) - 1
         
         # Tournament state
         self.current_blind_level = 0
         self.hands_played_this_level = 0
         self.total_hands_played = 0
         self.tables: Dict[int, Table] = {}
+        # Ids of tables with is_active set, kept in step by Table.on_active_change
+        self._active_table_ids: Set[int] = set()
+        self._active_ids_sorted: Optional[List[int]] = None
+        self._active_tables_cache: Optional[List[Table]] = None
+        # Players seated across all tables, kept in step by Table.on_seat_change
+        self._seated_count: int = 0
+        self._player_to_table: Dict[str, int] = {}  # player name -> table_id
+        self._seat_version: int = 0  # bumped on every seat change
+        # State balance_table last ran against; an unchanged state is a no-op
+        self._last_balance_key: Optional[Tuple] = None
+        self._all_player_names: frozenset = frozenset()
         self.all_players: List[Player] = []
+        # Per-player arrays aligned with all_players (see _index_players)
+        self._player_index: Dict[Player, int] = {}
+        self._players_by_name: Dict[str, Player] = {}
+        self.sharky: Optional[Player] = None  # Player_0, the agent being trained
+        self._stacks_arr = np.zeros(0, dtype=np.int64)
+        self._eliminated_mask = np.zeros(0, dtype=bool)
+        self._table_of = np.zeros(0, dtype=np.int64)  # table id per player, -1 when unseated
         self.elimination_order: List[Player] = []
         self.active_table_id: int = 0  # Current table being played
         
@@ -172,6 +225,7 @@ class MultiTableTournamentEnv(gym.Env):
         
         # Initialize players and tables
         self._setup_tournament()
+        self._index_players()
         
         # Gym spaces - observation for current active player
         self.observation_space = gym.spaces.Box(
@@ -180,17 +234,110 @@ class MultiTableTournamentEnv(gym.Env):
         
         self.action_space = gym.spaces.Discrete(3)  # fold, call/check, raise
         
+        # Scratch buffers _get_obs and legal_action_mask fill in place each step
+        self._obs_buf = np.zeros(self.observation_space.shape, dtype=np.float32)
+        self._mask_buf = np.zeros(self.action_space.n, dtype=np.uint8)
+        
         # Track previous stacks for reward calculation
         self.prev_stacks: Dict[str, int] = {}
     
-    def _validate_blind_schedule(self):
-        """Validate and normalize blind schedule to enforce consistent ante logic"""
+    @property
+    def elimination_order(self) -> List[Player]:
+        return self._elimination_order
+    
+    @elimination_order.setter
+    def elimination_order(self, players: List[Player]):
+        self._elimination_order = players
+        self._sync_eliminated_mask()
+    
+    def _index_players(self):
+        """Build the name index and the stack/elimination arrays aligned with all_players (after seating)"""
+        self._player_index = {p: i for i, p in enumerate(self.all_players)}
+        self._players_by_name = {p.name: p for p in self.all_players}
+        self._all_player_names = frozenset(self._players_by_name)
+        self.sharky = self._players_by_name.get("Player_0")
+        # Player.stack reads and writes go straight to this array from here on
+        self._stacks_arr = np.zeros(len(self.all_players), dtype=np.int64)
+        for i, player in enumerate(self.all_players):
+            player.bind_stack(self._stacks_arr, i)
+        self._eliminated_mask = np.zeros(len(self.all_players), dtype=bool)
+        self._sync_eliminated_mask()
+        self._table_of = np.array([self._player_to_table.get(p.name, -1) for p in self.all_players], dtype=np.int64)
+    
+    @property
+    def stacks(self) -> np.ndarray:
+        """Every player's stack, aligned with all_players; writes update the players too"""
+        return self._stacks_arr
+    
+    def _sync_eliminated_mask(self):
+        """Rebuild _eliminated_mask from elimination_order"""
+        self._eliminated_mask[:] = False
+        for player in self._elimination_order:
+            idx = self._player_index.get(player)
+            if idx is not None:
+                self._eliminated_mask[idx] = True
+    
+    def _unmark_eliminated(self, player: Player):
+        """Take a player who still has chips back out of elimination_order"""
+        self._elimination_order.remove(player)
+        idx = self._player_index.get(player)
+        if idx is not None:
+            self._eliminated_mask[idx] = False
+    
+    @staticmethod
+    def _check_config(total_players, max_players_per_table, starting_stack,
+                      hands_per_blind_level, table_balancing_threshold):
+        """Raise ValueError for tournament settings the env cannot run with"""
+        if total_players < 2:
+            raise ValueError("Tournament must have at least 2 players")
+        if max_players_per_table < 2:
+            raise ValueError("Maximum players per table must be at least 2")
+        if max_players_per_table == 2 and total_players % 2:
+            # Heads-up tables only: an odd field always leaves one player alone
+            raise ValueError("An odd number of players cannot be seated at 2-player tables")
+        if starting_stack <= 0:
+            raise ValueError("Starting stack must be positive")
+        if hands_per_blind_level <= 0:
+            raise ValueError("Hands per blind level must be positive")
+        if table_balancing_threshold < 2:
+            raise ValueError("Table balancing threshold must be at least 2")
+    
+    # Settings reconfigure() may change; the blind schedule is fixed per env
+    RECONFIGURABLE = (
+        "total_players", "max_players_per_table", "min_players_per_table", "starting_stack",
+        "hands_per_blind_level", "table_balancing_threshold", "verbose", "debug",
+    )
+    
+    def reconfigure(self, **kwargs):
+        """
+        Change constructor settings (see RECONFIGURABLE) on this env in place
+        and reset it, instead of building a new env. Returns reset()'s (obs, info).
+        """
+        unknown = set(kwargs) - set(self.RECONFIGURABLE)
+        if unknown:
+            raise ValueError(f"Cannot reconfigure: {', '.join(sorted(unknown))}")
+        config = {name: getattr(self, name) for name in self.RECONFIGURABLE}
+        config.update(kwargs)
+        self._check_config(config["total_players"], config["max_players_per_table"], config["starting_stack"],
+                           config["hands_per_blind_level"], config["table_balancing_threshold"])
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+        self.num_tables = math.ceil(self.total_players / self.max_players_per_table)
+        return self.reset()
+    
+    def _validate_blind_schedule(self, blinds_schedule: Sequence[Sequence[int]]) -> None:
+        """
+        Validate and normalize blind schedule to enforce consistent ante logic.
+        The normalized levels go to self.blinds_schedule as a new list; the
+        caller's schedule is left as it was.
+        """
         antes_started = False
+        levels: List[Tuple[int, int, int]] = []
         
-        for i, level in enumerate(self.blinds_schedule):
+        for i, level in enumerate(blinds_schedule):
             if len(level) == 2:
                 # Convert (sb, bb) to (sb, bb, 0)
-                self.blinds_schedule[i] = (level[0], level[1], 0)
+                levels.append((level[0], level[1], 0))
             elif len(level) == 3:
                 sb, bb, ante = level
                 
@@ -198,21 +345,27 @@ class MultiTableTournamentEnv(gym.Env):
                 if ante > 0:
                     antes_started = True
                     # Normalize ante to 1 (flag for antes active)
-                    self.blinds_schedule[i] = (sb, bb, 1)
+                    levels.append((sb, bb, 1))
                 elif antes_started:
                     # Once antes start, they continue for all subsequent levels
                     print(f"Warning: Level {i+1} has ante=0 but antes already started. Setting to 1.")
-                    self.blinds_schedule[i] = (sb, bb, 1)
+                    levels.append((sb, bb, 1))
+                else:
+                    levels.append((sb, bb, ante))
             else:
                 raise ValueError(f"Invalid blind level format at level {i+1}: {level}")
+        
+        self.blinds_schedule = levels
     
     def _setup_tournament(self):
         """Initialize all players and distribute them across tables"""
         # Create all players - can be overridden by subclasses for rule-based opponents
         self.all_players = self._create_players()
-        
-        # Shuffle players for random seating
-        random.shuffle(self.all_players)
+        self._seat_players()
+    
+    def _seat_players(self):
+        """Shuffle all_players and deal them out to freshly built tables"""
+        self._shuffle_players()
         
         # Distribute players across tables
         self._distribute_players_to_tables()
@@ -221,6 +374,12 @@ class MultiTableTournamentEnv(gym.Env):
         self.prev_stacks = {p.name: p.stack for p in self.all_players}
         print(f"Tournament initialized: {len(self.tables)} tables, {self.total_players} players")
     
+    def _shuffle_players(self):
+        """Shuffle all_players for random seating - can be overridden to pin seats"""
+        # From the env's own generator (seeded by reset(seed=...)) rather
+        # than the global random module
+        self.np_random.shuffle(self.all_players)
+    
     def _create_players(self):
         """Create players - can be overridden for different opponent types"""
         return [
@@ -247,28 +406,90 @@ class MultiTableTournamentEnv(gym.Env):
             # Create table with current blind level
             blind_level = self.blinds_schedule[self.current_blind_level]
             sb, bb, ante = blind_level  # All levels are 3-tuples after normalization
-            table = Table(table_id, table_players, self.starting_stack, sb, bb, ante)
+            table = Table(table_id, table_players, self.starting_stack, sb, bb, ante,
+                          on_active_change=self._on_table_active_change,
+                          on_seat_change=self._on_table_seat_change)
             self.tables[table_id] = table
+            self._seated_count += len(table_players)
+            for player in table_players:
+                self._player_to_table[player.name] = table_id
             
             # Initialize the table's game (first hand)
             table.game.reset_for_new_hand(is_first_hand=True)
             # Store starting stacks for first hand
             self._store_starting_stacks(table)
     
+    def _on_table_active_change(self, table_id: int, is_active: bool):
+        """Keep _active_table_ids in step with each table's is_active flag"""
+        if is_active:
+            self._active_table_ids.add(table_id)
+        else:
+            self._active_table_ids.discard(table_id)
+        self._active_ids_sorted = None
+        self._active_tables_cache = None
+    
+    def _on_table_seat_change(self, table_id: int, player: Player, seated: bool):
+        """Keep the seated-player counter and seat index in step with add_player/remove_player"""
+        if seated:
+            self._seated_count += 1
+            self._player_to_table[player.name] = table_id
+        else:
+            self._seated_count -= 1
+            self._player_to_table.pop(player.name, None)
+        self._seat_version += 1
+        idx = self._player_index.get(player)
+        if idx is not None:
+            self._table_of[idx] = table_id if seated else -1
+    
+    @property
+    def total_seated_players(self) -> int:
+        """Number of players seated across all tables, busted players included"""
+        return self._seated_count
+    
+    def current_seated_names(self):
+        """Names of every seated player (a live view of the seat index)"""
+        return self._player_to_table.keys()
+    
+    def assert_players_intact(self):
+        """Raise AssertionError unless every player sits at exactly one table and the seat index agrees"""
+        seats = Counter(p.name for table in self.tables.values() for p in table.players)
+        duplicated = sorted(name for name, n in seats.items() if n > 1)
+        assert not duplicated, f"Players seated more than once: {duplicated}"
+        assert seats.keys() == self._all_player_names, (
+            f"Seated players differ from the roster: missing {sorted(self._all_player_names - seats.keys())}, "
+            f"unknown {sorted(seats.keys() - self._all_player_names)}"
+        )
+        assert self.current_seated_names() == self._all_player_names, "Seat index is out of step with the tables"
+    
+    def _sorted_active_table_ids(self) -> List[int]:
+        """Active table ids in round-robin order, rebuilt only after a table opens or closes"""
+        if self._active_ids_sorted is None:
+            self._active_ids_sorted = sorted(self._active_table_ids)
+        return self._active_ids_sorted
+    
+    def _active_player_counts(self) -> np.ndarray:
+        """Players with chips at each table id, counted off the stack and seat arrays in one pass"""
+        alive = self._table_of[(self._stacks_arr > 0) & (self._table_of >= 0)]
+        return np.bincount(alive, minlength=len(self.tables))
+    
     def _get_active_tables(self) -> List[Table]:
-        """Get all tables that are still active (have 2+ players)"""
-        return [table for table in self.tables.values() if table.is_active]
+        """Get all tables that are still active, in round-robin order (a shared list: don't mutate it)"""
+        if self._active_tables_cache is None:
+            self._active_tables_cache = [self.tables[tid] for tid in self._sorted_active_table_ids()]
+        return self._active_tables_cache
+    
+    def mark_all_hands_over(self, active_only: bool = True):
+        """Mark the hand at every active table (every table with active_only=False) as finished"""
+        for table in (self._get_active_tables() if active_only else self.tables.values()):
+            table.game.hand_over = True
     
     def _select_next_active_table(self) -> Optional[int]:
         """Select the next table that needs to play a hand"""
-        active_tables = self._get_active_tables()
-        if not active_tables:
+        current_active_table_ids = self._sorted_active_table_ids()
+        if not current_active_table_ids:
             return None
         
         # Round-robin table selection
-        current_active_table_ids = [t.table_id for t in active_tables]
-        current_active_table_ids.sort()
-        
         # Find next table after current active table
         try:
             # Type guard: ensure active_table_id is not None before using index
@@ -285,122 +506,146 @@ class MultiTableTournamentEnv(gym.Env):
     
     def balance_table(self, table_id):
         """
-        Rebalance a single table after its hand is finished.
-        If table needs players, move them from other tables with surplus.
-        If table has surplus, move players to tables needing them.
-        Handles multiple players needed/given.
+        Rebalance a single table after its hand is finished, moving as few
+        players as possible. Every table should end up with the floor or
+        ceiling of the average count; only this table's hand is over, so it is
+        the one that gives players (or breaks) while the others keep playing.
         """
 
-        print(f"[BALANCE_TABLE] Entered balance_table for table_id: {table_id}")
         table = self.tables.get(table_id)
+        # Nothing that decides the outcome (seats, stacks, active tables, this
+        # table's hand) changed since the last call for this table: skip it
+        key = (table_id, table is not None and table.game.hand_over, self._seat_version,
+               self._stacks_arr.tobytes(), tuple(self._sorted_active_table_ids()))
+        if key == self._last_balance_key:
+            return
+        self._last_balance_key = key
         # Log all table player counts before balancing
-        print("[BALANCE_TABLE] Table player counts before balancing:")
-        for tid, t in self.tables.items():
-            print(f"[BALANCE_TABLE]  Table {tid}: {len(t.players)} players, active: {t.is_active}, in_hand: {[p.in_hand for p in t.players]}")
+        if self.debug:
+            print(f"[BALANCE_TABLE] Entered balance_table for table_id: {table_id}")
+            print("[BALANCE_TABLE] Table player counts before balancing:")
+            for tid, t in self.tables.items():
+                print(f"[BALANCE_TABLE]  Table {tid}: {len(t.players)} players, active: {t.is_active}, in_hand: {[p.in_hand for p in t.players]}")
         # Never forcibly end a hand due to eliminations; wait for hand to finish naturally
         # If table is in a hand, skip balancing until hand is over
         if not table or not table.is_active:
-            print(f"[BALANCE_TABLE] Table {table_id} is not active; skipping balancing.")
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} is not active; skipping balancing.")
             return
         if not table.game.hand_over:
-            print(f"[BALANCE_TABLE] Table {table_id} is still in a hand; skipping balancing")
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} is still in a hand; skipping balancing")
             return
 
         current = table.get_active_player_count()
         if current < self.min_players_per_table:
-            print(f"[BALANCE_TABLE] Table {table_id} breaking: only {current} active players.")
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} breaking: only {current} active players.")
             self._break_table(table)
-            print(f"[BALANCE_TABLE] Table {table_id} deactivated after breaking.")
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} deactivated after breaking.")
             return
 
-        active_tables = [t for t in self.tables.values() if t.is_active and t.get_active_player_count() > 0]
-        if len(active_tables) <= 1:
-            print(f"[BALANCE_TABLE] Only one active table; no balancing needed.")
+        all_counts = self._active_player_counts()
+        counts = {tid: int(all_counts[tid]) for tid in self._sorted_active_table_ids() if all_counts[tid] > 0}
+        if len(counts) <= 1:
+            if self.debug:
+                print(f"[BALANCE_TABLE] Only one active table; no balancing needed.")
             return
 
-        # Calculate ideal player count per table
-        total_players = sum(t.get_active_player_count() for t in active_tables)
-        num_tables = len(active_tables)
-        ideal = total_players // num_tables
-        extra = total_players % num_tables
-
-        # For each table, calculate target count
-        targets = [ideal + (1 if i < extra else 0) for i in range(num_tables)]
-        table_map = {t.table_id: t for t in active_tables}
-        table_ids_sorted = sorted(table_map.keys())
-        target_map = {tid: targets[i] for i, tid in enumerate(table_ids_sorted)}
-
-        # Log targets
-        print(f"[BALANCE_TABLE] Table targets: {target_map}")
-
-        # How many players does this table need/give?
-        target = target_map[table_id]
-        print(f"[BALANCE_TABLE] Table {table_id} has {current} players, target {target}")
-        if current == target:
-            print(f"[BALANCE_TABLE] Table {table_id} already balanced ({current} players).")
+        total_players = sum(counts.values())
+        num_tables = len(counts)
+        # Steady state: already within one player everywhere and no table to spare
+        if (max(counts.values()) - min(counts.values()) <= 1
+                and math.ceil(total_players / self.max_players_per_table) == num_tables):
+            if self.debug:
+                print(f"[BALANCE_TABLE] Tables already balanced: {counts}")
             return
-        elif current < target:
-            # If table is below min_players_per_table, break and deactivate it
-            print(f"[BALANCE_TABLE] Table {table_id} is below min_players_per_table after breaking; breaking and deactivating.")
+        low = total_players // num_tables
+        high = -(-total_players // num_tables)
+
+        # Break this table when everyone fits at one table fewer, or when it is
+        # short and cannot pull players out of hands still running elsewhere
+        if math.ceil(total_players / self.max_players_per_table) < num_tables or current < low:
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} has {current} players (tables should hold {low}-{high}); breaking and deactivating.")
             self._break_table(table)
-            print(f"[BALANCE_TABLE] Table {table_id} deactivated after breaking (balancing phase).")
-            # Ensure at least one table is active and has a valid hand started
-            active_tables = [t for t in self.tables.values() if t.is_active and t.get_active_player_count() >= 2]
-            if active_tables:
-                # Set active_table_id to a playable table
-                self.active_table_id = active_tables[0].table_id
-                # If the table's hand is over, reset for new hand
-                if active_tables[0].game.hand_over:
-                    try:
-                        blind_level = self.blinds_schedule[self.current_blind_level]
-                        sb, bb, ante = blind_level
-                        active_tables[0].game.small_blind = sb
-                        active_tables[0].game.big_blind = bb
-                        active_tables[0].game.ante = ante
-                        active_tables[0].game.reset_for_new_hand(is_first_hand=False)
-                        # Store starting stacks for new hand after table breaking
-                        self._store_starting_stacks(active_tables[0])
-                        print(f"[BALANCE_TABLE] Started new hand at table {active_tables[0].table_id} after breaking.")
-                    except Exception as e:
-                        print(f"[BALANCE_TABLE] Error resetting hand after breaking: {e}")
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} deactivated after breaking (balancing phase).")
+            self._resume_after_break()
             return
-        else:
-            players_to_give = current - target
-            print(f"[BALANCE_TABLE] Table {table_id} has {players_to_give} surplus player(s) (target {target}).")
-            # Find tables needing players
-            for receiver_id in table_ids_sorted:
-                if receiver_id == table_id:
-                    continue
-                receiver_table = table_map[receiver_id]
-                receiver_current = receiver_table.get_active_player_count()
-                receiver_target = target_map[receiver_id]
-                need = receiver_target - receiver_current
-                while need > 0 and players_to_give > 0:
-                    moveable = [p for p in table.players if p.stack > 0]
-                    if not moveable:
-                        break
-                    player_to_move = moveable[0]
+
+        # Give down to `high`, or further down to `low` while some table is below `low`
+        table_ids = list(counts)
+        pos = table_ids.index(table_id)
+        receiver_ids = table_ids[pos + 1:] + table_ids[:pos]  # Right sibling first
+        short = sum(max(0, low - counts[rid]) for rid in receiver_ids)
+        players_to_give = max(current - high, min(current - low, short))
+        if players_to_give <= 0:
+            if self.debug:
+                print(f"[BALANCE_TABLE] Table {table_id} already balanced ({current} players).")
+            return
+
+        # Fill tables below `low` first, then top up to `high`
+        receives = {rid: 0 for rid in receiver_ids}
+        for cap in (low, high):
+            for rid in receiver_ids:
+                take = min(players_to_give, max(0, cap - counts[rid] - receives[rid]))
+                receives[rid] += take
+                players_to_give -= take
+        receives = {rid: n for rid, n in receives.items() if n}
+        if self.debug:
+            print(f"[BALANCE_TABLE] Table {table_id} giving players: {receives}")
+
+        # Move the most recently seated players to keep the others' positions
+        moveable = [p for p in table.players if p.stack > 0]
+        for receiver_id, need in receives.items():
+            receiver_table = self.tables[receiver_id]
+            for _ in range(need):
+                player_to_move = moveable.pop()
+                if self.debug:
                     print(f"[BALANCE_TABLE] Moving {player_to_move.name} from table {table_id} to table {receiver_id}")
-                    table.remove_player(player_to_move)
-                    receiver_table.add_player(player_to_move)
-                    # Player moved mid-hand joins next hand only
-                    if receiver_table.game.hand_over:
-                        player_to_move.in_hand = True
-                    else:
-                        player_to_move.in_hand = False
-                    print(f"[BALANCE_TABLE] Moved {player_to_move.name} from table {table_id} to table {receiver_id}")
-                    # Invariant check after move
-                    table.check_player_list_invariant(context=f"after removing {player_to_move.name}")
-                    receiver_table.check_player_list_invariant(context=f"after adding {player_to_move.name}")
-                    need -= 1
-                    players_to_give -= 1
+                table.remove_player(player_to_move)
+                # Busted players still hold seats, so the 9-seat check would
+                # drop a player the active counts have room for
+                receiver_table.add_player(player_to_move, emergency=True)
+                # Player moved mid-hand joins next hand only
+                player_to_move.in_hand = receiver_table.game.hand_over
+                # Invariant check after move
+                table.check_player_list_invariant(context=f"after removing {player_to_move.name}")
+                receiver_table.check_player_list_invariant(context=f"after adding {player_to_move.name}")
         # Fix game state for all affected tables
-        print("[BALANCE_TABLE] Table player counts after balancing:")
-        for tid, t in self.tables.items():
-            print(f"  Table {tid}: {len(t.players)} players, active: {t.is_active}, in_hand: {[p.in_hand for p in t.players]}")
-        for t in active_tables:
-            self._fix_game_state_after_eliminations(t)
-        print(f"[BALANCE_TABLE] Table {table_id} balancing complete.")
+        if self.debug:
+            print("[BALANCE_TABLE] Table player counts after balancing:")
+            for tid, t in self.tables.items():
+                print(f"  Table {tid}: {len(t.players)} players, active: {t.is_active}, in_hand: {[p.in_hand for p in t.players]}")
+        for tid in counts:
+            self._fix_game_state_after_eliminations(self.tables[tid])
+        if self.debug:
+            print(f"[BALANCE_TABLE] Table {table_id} balancing complete.")
+
+    def _resume_after_break(self):
+        """Point play at a table that can still play and deal it a hand if it is between hands"""
+        active_tables = [t for t in self._get_active_tables() if t.get_active_player_count() >= 2]
+        if not active_tables:
+            return
+        # Set active_table_id to a playable table
+        self.active_table_id = active_tables[0].table_id
+        # If the table's hand is over, reset for new hand
+        if active_tables[0].game.hand_over:
+            try:
+                blind_level = self.blinds_schedule[self.current_blind_level]
+                sb, bb, ante = blind_level
+                active_tables[0].game.small_blind = sb
+                active_tables[0].game.big_blind = bb
+                active_tables[0].game.ante = ante
+                active_tables[0].game.reset_for_new_hand(is_first_hand=False)
+                # Store starting stacks for new hand after table breaking
+                self._store_starting_stacks(active_tables[0])
+                if self.debug:
+                    print(f"[BALANCE_TABLE] Started new hand at table {active_tables[0].table_id} after breaking.")
+            except Exception as e:
+                print(f"[BALANCE_TABLE] Error resetting hand after breaking: {e}")
     
     def _fix_game_state_after_eliminations(self, table: Table):
         """Fix game state after manual eliminations (e.g., setting stack=0)"""
@@ -422,12 +667,14 @@ class MultiTableTournamentEnv(gym.Env):
         for player in table.players:
             if player.stack > 0 and not player.in_hand:
                 player.in_hand = True
-                print(f"[DEBUG] Restored {player.name} to active status (stack: {player.stack})")
+                if self.debug:
+                    print(f"[DEBUG] Restored {player.name} to active status (stack: {player.stack})")
                 
                 # CRITICAL FIX: Remove from elimination_order if player was incorrectly eliminated
                 if player in self.elimination_order:
-                    self.elimination_order.remove(player)
-                    print(f"[DEBUG] Removed {player.name} from elimination_order (stack restored: {player.stack})")
+                    self._unmark_eliminated(player)
+                    if self.debug:
+                        print(f"[DEBUG] Removed {player.name} from elimination_order (stack restored: {player.stack})")
         
         # Find active players
         active_players = [p for p in table.players if p.stack > 0]
@@ -437,7 +684,8 @@ class MultiTableTournamentEnv(gym.Env):
             in_hand_players = [p for p in table.players if p.stack > 0 and p.in_hand]
             if len(in_hand_players) == 1:
                 table.game.hand_over = True
-                print(f"[DEBUG] Hand ended early at table {table.table_id} due to only one player remaining after eliminations ({in_hand_players[0].name})")
+                if self.debug:
+                    print(f"[DEBUG] Hand ended early at table {table.table_id} due to only one player remaining after eliminations ({in_hand_players[0].name})")
                 # Optionally, award the pot to the last player (if not already handled by PokerGame)
                 # You may want to call a PokerGame method here if needed
 
@@ -460,13 +708,15 @@ class MultiTableTournamentEnv(gym.Env):
                         table.game.phase_idx = 0
                         # Only print if this is a new elimination state
                         if elimination_signature != last_signature:
-                            print(f"[DEBUG] Fixed game state for table {table.table_id} with {len(active_players)} active players")
+                            if self.debug:
+                                print(f"[DEBUG] Fixed game state for table {table.table_id} with {len(active_players)} active players")
                             table._last_elimination_signature = elimination_signature
                     else:
                         # Hand is in progress, don't reset pot/bets, just remove eliminated players
                         # Only print if this is a new elimination state
                         if elimination_signature != last_signature:
-                            print(f"[DEBUG] Removed {len(eliminated_players)} eliminated players from table {table.table_id}")
+                            if self.debug:
+                                print(f"[DEBUG] Removed {len(eliminated_players)} eliminated players from table {table.table_id}")
                             table._last_elimination_signature = elimination_signature
             except Exception as e:
                 print(f"Error fixing game state for table {table.table_id}: {e}")
@@ -505,7 +755,7 @@ class MultiTableTournamentEnv(gym.Env):
         moveable_players = [p for p in source_table.players if p.stack > 0]
         
         if moveable_players and len(target_table.players) < self.max_players_per_table:
-            player_to_move = random.choice(moveable_players)
+            player_to_move = moveable_players[self.np_random.integers(len(moveable_players))]
             source_table.remove_player(player_to_move)
             # State reset now handled in add_player
             target_table.add_player(player_to_move)
@@ -514,7 +764,7 @@ class MultiTableTournamentEnv(gym.Env):
     def _increase_blinds_if_needed(self):
         """Check if blinds should increase and apply to all tables"""
         if self.hands_played_this_level >= self.hands_per_blind_level:
-            if self.current_blind_level < len(self.blinds_schedule) - 1:
+            if self.current_blind_level < self._max_blind_level:
                 self.current_blind_level += 1
                 self.hands_played_this_level = 0
                 
@@ -548,29 +798,27 @@ class MultiTableTournamentEnv(gym.Env):
     
     def _clean_elimination_order(self):
         """Remove players from elimination_order if they have chips (shouldn't be eliminated)"""
-        players_to_remove = []
-        for player in self.elimination_order:
-            if player.stack > 0:
-                players_to_remove.append(player)
+        # Only players flagged eliminated are checked, straight off the arrays
+        for i in np.flatnonzero(self._eliminated_mask & (self._stacks_arr > 0)):
+            player = self.all_players[i]
+            if self.debug:
                 print(f"[DEBUG] Removing {player.name} from elimination_order (stack: {player.stack})")
-        
-        for player in players_to_remove:
-            self.elimination_order.remove(player)
+            self._unmark_eliminated(player)
     
     def _update_elimination_order(self):
         """Update elimination order with players who just busted"""
         # Find all newly eliminated players (stack == 0 but not in elimination_order)
-        newly_eliminated = []
-        for table in self.tables.values():
-            for player in table.players:
-                if player.stack == 0 and player not in self.elimination_order:
-                    # Mark eliminated player as out of hand immediately
-                    player.in_hand = False
-                    newly_eliminated.append(player)
-        
-        if not newly_eliminated:
+        # in one pass over the stack array instead of a list lookup per player
+        newly_idx = np.flatnonzero((self._stacks_arr == 0) & ~self._eliminated_mask)
+        if not len(newly_idx):
             return  # No new eliminations
         
+        self._eliminated_mask[newly_idx] = True
+        newly_eliminated = [self.all_players[i] for i in newly_idx]
+        for player in newly_eliminated:
+            # Mark eliminated player as out of hand immediately
+            player.in_hand = False
+        
         # For simultaneous eliminations, sort by starting stack size (higher stack gets better placement)
         # In real poker tournaments, the player with the larger starting stack when the hand began
         # gets the higher placement when eliminated on the same hand
@@ -584,26 +832,40 @@ class MultiTableTournamentEnv(gym.Env):
             self.elimination_order.append(player)
             elimination_position = len(self.elimination_order)
             final_placement = self.total_players - elimination_position + 1
-            print(f"Player {player.name} eliminated ({self._get_ordinal(elimination_position)} elimination, finishes {self._get_ordinal(final_placement)} place)")
+            self.events.append(("eliminated", {
+                "player": player.name, "elimination": elimination_position, "placement": final_placement,
+            }))
+            if self.verbose:
+                print(f"Player {player.name} eliminated ({self._get_ordinal(elimination_position)} elimination, finishes {self._get_ordinal(final_placement)} place)")
         
         # Show Sharky's stack after eliminations (only once if multiple eliminations)
-        if newly_eliminated:
-            sharky_player = None
-            for t in self.tables.values():
-                for p in t.players:
-                    if p.name == "Player_0" and p.stack > 0:
-                        sharky_player = p
-                        break
-                if sharky_player:
-                    break
-            
-            if sharky_player:
-                print(f"🦈 Sharky (Player_0) stack: {sharky_player.stack} chips")
+        if self.sharky is not None and self.sharky.stack > 0:
+            self.events.append(("sharky_stack", {"stack": self.sharky.stack}))
+            if self.verbose:
+                print(f"🦈 Sharky (Player_0) stack: {self.sharky.stack} chips")
+    
+    def eliminate_players(self, players: List[Player], finish_hands: bool = True) -> List[int]:
+        """
+        Bust `players` in one go: zero their stacks in a single array store and
+        record the eliminations. With finish_hands the hands at their tables are
+        marked over, as if the busting hand just ended. Returns the ids of the
+        tables they sat at, ready for balance_table.
+        """
+        idx = np.fromiter((self._player_index[p] for p in players), dtype=np.int64, count=len(players))
+        self._stacks_arr[idx] = 0
+        tids = np.unique(self._table_of[idx])
+        table_ids = [int(tid) for tid in tids[tids >= 0]]
+        if finish_hands:
+            for tid in table_ids:
+                self.tables[tid].game.hand_over = True
+        self._update_elimination_order()
+        return table_ids
     
     def _tournament_finished(self) -> bool:
         """Check if tournament is finished (2 or fewer players remain - heads-up should be tested separately)"""
-        remaining_players = [p for p in self.all_players if p.stack > 0]
-        return len(remaining_players) <= 2
+        # Read straight from the stack array: stacks also change through
+        # Player.stack and env.stacks, so a memo here would go stale
+        return bool(np.count_nonzero(self._stacks_arr > 0) <= 2)
     
     def _calculate_reward(self, player, prev_stack):
         """Calculate comprehensive tournament reward"""
@@ -669,23 +931,62 @@ class MultiTableTournamentEnv(gym.Env):
         """Reset the tournament to initial state"""
         super().reset(seed=seed, options=options)
         
-        # Seed the random number generator if provided
+        # Seating uses self.np_random (seeded above); the card decks still
+        # shuffle with the global generators, so seed those too
         if seed is not None:
             random.seed(seed)
             np.random.seed(seed)
         
-        # Reset tournament state
+        self._clear_tournament_state()
+        
+        # Reinitialize tournament
+        self._setup_tournament()
+        return self._start_tournament()
+    
+    def clone(self) -> "MultiTableTournamentEnv":
+        """
+        Return an independent copy of the env in its current state (tables,
+        hands in progress, stacks, eliminations, RNG). Cheaper than
+        building and resetting a new env; the blind schedule, gym spaces and
+        the immutable Card objects are shared with the original.
+        """
+        memo = {id(obj): obj for obj in (self.blinds_schedule, self._blinds_arr,
+                                         self.observation_space, self.action_space)}
+        return copy.deepcopy(self, memo)
+    
+    def _soft_reset(self):
+        """
+        Reset like reset(), but keep the existing Player objects (and their
+        agents): stacks and per-hand state are restored and everyone is
+        reseated at new tables. Useful when many short runs share one env.
+        """
+        self._clear_tournament_state()
+        for player in self.all_players:
+            player.reset(self.starting_stack)
+        self._seat_players()
+        return self._start_tournament()
+    
+    def _clear_tournament_state(self):
+        """Drop tables, eliminations and counters ahead of a (soft) reset"""
         self.current_blind_level = 0
         self.hands_played_this_level = 0
         self.total_hands_played = 0
         self.elimination_order = []
         self.active_table_id = 0
+        self._last_balance_key = None
+        self.events.clear()
         
         # Clear existing tables
         self.tables.clear()
-        
-        # Reinitialize tournament
-        self._setup_tournament()
+        self._active_table_ids.clear()
+        self._active_ids_sorted = None
+        self._active_tables_cache = None
+        self._seated_count = 0
+        self._player_to_table.clear()
+    
+    def _start_tournament(self):
+        """Index the seated players and point play at the first table; returns (obs, info)"""
+        self._index_players()
         
         # Select first active table
         self.active_table_id = self._select_next_active_table() or 0
@@ -695,54 +996,60 @@ class MultiTableTournamentEnv(gym.Env):
         return obs, info
     
     def _get_obs(self) -> np.ndarray:
-        """Get observation for current active player"""
+        """
+        Get observation for current active player.
+        Filled into a buffer reused on every call: copy it to keep it past the next step.
+        """
+        obs = self._obs_buf
         if self.active_table_id not in self.tables:
             # No active table, return zero observation
-            return np.zeros(8, dtype=np.float32)
+            obs.fill(0)
+            return obs
         
         table = self.tables[self.active_table_id]
         if not table.players or table.game.current_player_idx is None or table.game.current_player_idx >= len(table.players):
-            return np.zeros(8, dtype=np.float32)
+            obs.fill(0)
+            return obs
         
         current_player = table.players[table.game.current_player_idx]
         
         # Ensure all values are valid
-        stack = max(0, current_player.stack)
-        to_call = max(0, table.game.current_bet - current_player.current_bet)
-        pot = max(0, table.game.pot)
-        current_bet = max(0, current_player.current_bet)
-        in_hand = 1 if current_player.in_hand else 0
-        table_id = max(0, table.table_id)
-        players_at_table = max(0, len(table.players))
-        blind_level = max(0, self.current_blind_level)
-        
-        obs = np.array([
-            stack, to_call, pot, current_bet, in_hand, 
-            table_id, players_at_table, blind_level
-        ], dtype=np.float32)
+        obs[0] = max(0, current_player.stack)  # stack
+        obs[1] = max(0, table.game.current_bet - current_player.current_bet)  # to_call
+        obs[2] = max(0, table.game.pot)  # pot
+        obs[3] = max(0, current_player.current_bet)  # current_bet
+        obs[4] = 1 if current_player.in_hand else 0  # in_hand
+        obs[5] = max(0, table.table_id)  # table_id
+        obs[6] = max(0, len(table.players))  # players_at_table
+        obs[7] = max(0, self.current_blind_level)  # blind_level
         
         # Sanity check - replace any invalid values with 0
-        obs = np.nan_to_num(obs, nan=0.0, posinf=0.0, neginf=0.0)
+        np.nan_to_num(obs, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         
         return obs
     
     def legal_action_mask(self) -> np.ndarray:
-        """Generate legal action mask for current player"""
+        """
+        Generate legal action mask for current player, as a uint8 array of
+        0/1 flags. Like _get_obs, this reuses one buffer: copy it to keep it
+        past the next call.
+        """
+        mask = self._mask_buf  # [fold, call/check, raise]
+        mask.fill(0)
         if self.active_table_id not in self.tables:
-            return np.array([False, False, False], dtype=bool)
+            return mask
         
         table = self.tables[self.active_table_id]
         if not table.players or table.game.current_player_idx is None or table.game.current_player_idx >= len(table.players):
-            return np.array([False, False, False], dtype=bool)
+            return mask
         
         player = table.players[table.game.current_player_idx]
         
         # If player is all-in or eliminated, no legal actions
         if player.stack == 0 or not player.in_hand or getattr(player, "all_in", False):
-            return np.array([False, False, False], dtype=bool)
+            return mask
         
         to_call = table.game.current_bet - player.current_bet
-        mask = [False, False, False]  # [fold, call/check, raise]
         
         # Fold: only legal if player is in hand and to_call > 0
         mask[0] = player.in_hand and to_call > 0
@@ -760,7 +1067,7 @@ class MultiTableTournamentEnv(gym.Env):
             max_possible_raise > max(min_raise_to, player.current_bet + 1)  # Must be above current bet
         )
         
-        return np.array(mask, dtype=bool)
+        return mask
     
     def step(self, action: int):
         """Execute one step in the tournament"""
@@ -998,6 +1305,21 @@ class MultiTableTournamentEnv(gym.Env):
         
         return obs, reward, terminated, False, info
     
+    def play_until_finished(self, max_steps: int = 1000) -> Tuple[int, bool]:
+        """
+        Drive the tournament by always taking the first legal action, until it
+        terminates or max_steps steps have been taken.
+        Returns (steps_taken, terminated).
+        """
+        mask = self.legal_action_mask()
+        for steps in range(1, max_steps + 1):
+            # First legal action; all-False masks give 0, which step() treats as "advance"
+            _, _, terminated, _, info = self.step(int(np.argmax(mask)))
+            if terminated:
+                return steps, True
+            mask = info["action_mask"]
+        return max_steps, False
+    
     def render(self, mode="human"):
         """Render current tournament state"""
         print(f"\n=== Multi-Table Tournament Status ===")
@@ -1022,7 +1344,7 @@ class MultiTableTournamentEnv(gym.Env):
             "eliminated_players": len(self.elimination_order),
             "active_tables": len(active_tables),
             "current_blind_level": self.current_blind_level + 1,
-            "blinds": self.blinds_schedule[self.current_blind_level],
+            "blinds": tuple(int(x) for x in self._blinds_arr[self.current_blind_level]),
             "hands_played": self.total_hands_played,
             "average_stack": np.mean([p.stack for p in remaining_players]) if remaining_players else 0,
             "chip_leader": max(remaining_players, key=lambda p: p.stack).name if remaining_players else None,
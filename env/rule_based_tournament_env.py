@@ -17,16 +17,11 @@ class RuleBasedTournamentEnv(MultiTableTournamentEnv):
     Simple extension of MultiTableTournamentEnv that uses rule-based opponents
     """
     
-    def _setup_tournament(self):
-        """Initialize all players and distribute them across tables, preserving Player_0 position"""
-        # Create all players - overridden to create rule-based opponents
-        self.all_players = self._create_players()
-        
-        # Preserve Player_0 at index 0, shuffle only the opponents
+    def _shuffle_players(self):
+        """Shuffle only the opponents, keeping Player_0 at index 0"""
         if len(self.all_players) > 1 and self.all_players[0].name == "Player_0":
             opponents = self.all_players[1:]
-            import random
-            random.shuffle(opponents)
+            self.np_random.shuffle(opponents)
             self.all_players = [self.all_players[0]] + opponents
         else:
             # Fallback: ensure Player_0 is at index 0
@@ -37,17 +32,9 @@ class RuleBasedTournamentEnv(MultiTableTournamentEnv):
                     player_0 = player
                 else:
                     others.append(player)
-            import random
-            random.shuffle(others)
+            self.np_random.shuffle(others)
             if player_0:
                 self.all_players = [player_0] + others
-        
-        # Distribute players across tables
-        self._distribute_players_to_tables()
-        
-        # Initialize tracking
-        self.prev_stacks = {p.name: p.stack for p in self.all_players}
-        print(f"Tournament initialized: {len(self.tables)} tables, {self.total_players} players")
     
     def step(self, action: int):
         """Execute one step, using rule-based agents for non-RL players"""
@@ -6,7 +6,7 @@ import sys
 def run_tests():
     print("🔍 Running all tests in the 'test/' folder...\n")
     result = subprocess.run(
-        ['pytest', 'test/', '-v', '--cov=.', '--cov-report=term-missing'],
+        ['pytest', 'test/', '-v', '-n', 'auto', '--dist=loadfile', '--cov=.', '--cov-report=term-missing'],
         stdout=sys.stdout,
         stderr=sys.stderr,
     )
@@ -0,0 +1,59 @@
+import random
+import numpy as np
+import pytest
+from env.multi_table_tournament_env import MultiTableTournamentEnv
+
+# Seed for the cached module envs, so their seating and first hand do not
+# depend on which tests (or xdist worker) ran before them
+FIXTURE_SEED = 0
+
+@pytest.fixture(autouse=True)
+def _seed_global_rngs():
+    """Card decks and rule-based agents draw from the global RNGs; seed them per test."""
+    random.seed(FIXTURE_SEED)
+    np.random.seed(FIXTURE_SEED)
+
+def _reset_env(total_players, max_players_per_table=9):
+    env = MultiTableTournamentEnv(total_players=total_players, max_players_per_table=max_players_per_table)
+    env.reset(seed=FIXTURE_SEED)
+    return env
+
+# Shared, freshly reset tournaments for tests that only read state. Anything
+# that eliminates players, steps or rebalances should use tourney_env_factory.
+@pytest.fixture(scope="module")
+def env_9_9():
+    return _reset_env(9)
+
+@pytest.fixture(scope="module")
+def env_18_9():
+    return _reset_env(18)
+
+@pytest.fixture(scope="module")
+def env_27_9():
+    return _reset_env(27)
+
+@pytest.fixture(scope="module")
+def tourney_env_factory():
+    """
+    Return a callable giving a fresh env per (total_players, max per table,
+    min per table, any other constructor keywords such as starting_stack).
+    One env per configuration is built and reset for the module; every call
+    returns a clone() of it, so tests may mutate their env freely and all
+    start from the same seating and first hand. Keyword values must be
+    hashable.
+    """
+    envs = {}
+
+    def factory(total_players, max_players_per_table=9, min_players_per_table=2, **config):
+        key = (total_players, max_players_per_table, min_players_per_table, tuple(sorted(config.items())))
+        if key not in envs:
+            envs[key] = MultiTableTournamentEnv(
+                total_players=total_players,
+                max_players_per_table=max_players_per_table,
+                min_players_per_table=min_players_per_table,
+                **config,
+            )
+            envs[key].reset(seed=FIXTURE_SEED)
+        return envs[key].clone()
+
+    return factory
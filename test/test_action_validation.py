@@ -1,5 +1,9 @@
 import pytest
-from engine.action_validation import validate_raise, validate_call, validate_check, validate_fold, ActionValidationError
+from engine.action_validation import (
+    validate_raise, validate_call, validate_check, validate_fold, validate_action, ActionValidationError,
+    ERR_CALL_NOTHING_TO_CALL, ERR_CHECK_FACING_BET, ERR_FOLD_CAN_CHECK, ERR_MIN_RAISE,
+)
+from utils.enums import ActionId
 
 # --- validate_check tests ---
 
@@ -10,8 +14,9 @@ def test_check_when_to_call_zero():
 
 def test_check_when_to_call_positive_fails():
     """Player cannot check if to_call is greater than zero."""
-    with pytest.raises(ActionValidationError, match="Cannot check when there is a bet to call."):
+    with pytest.raises(ActionValidationError) as ei:
         validate_check(to_call=10)
+    assert ei.value.code == ERR_CHECK_FACING_BET
 
 def test_check_with_negative_to_call_fails():
     """Negative to_call should fail."""
@@ -32,8 +37,9 @@ def test_fold_when_in_hand_and_to_call_positive():
 
 def test_fold_when_in_hand_and_to_call_zero_fails():
     """Player cannot fold if they are in hand and to_call is zero (must check)."""
-    with pytest.raises(ActionValidationError, match="Cannot fold when you can check"):
+    with pytest.raises(ActionValidationError) as ei:
         validate_fold(in_hand=True, to_call=0)
+    assert ei.value.code == ERR_FOLD_CAN_CHECK
 
 def test_fold_when_not_in_hand_fails():
     """Player cannot fold if they are not in hand."""
@@ -93,6 +99,12 @@ def test_call_with_negative_to_call_fails():
     with pytest.raises(ActionValidationError):
         validate_call(player_stack=100, to_call=-5)
 
+def test_call_with_nothing_to_call_fails():
+    """Calling with nothing to call is rejected by the shared action table."""
+    with pytest.raises(ActionValidationError) as ei:
+        validate_call(player_stack=100, to_call=0)
+    assert ei.value.code == ERR_CALL_NOTHING_TO_CALL
+
 # --- validate_raise tests ---
 
 def test_raise_just_above_min_raise_pass():
@@ -185,8 +197,9 @@ def test_raise_exceeds_stack_fails():
 
 def test_raise_smaller_than_min_raise_fails():
     """Raise smaller than min_raise (normal raise) should fail."""
-    with pytest.raises(ActionValidationError, match="Must raise by at least 20 chips"):
+    with pytest.raises(ActionValidationError) as ei:
         validate_raise(raise_to=65, player_stack=100, to_call=20, current_bet=50, min_raise=20, big_blind=20, player_current_bet=30)
+    assert ei.value.code == ERR_MIN_RAISE
 
 def test_valid_raise_exact_min_raise_pass():
     """Raise equal to min_raise should pass."""
@@ -195,8 +208,9 @@ def test_valid_raise_exact_min_raise_pass():
 
 def test_opening_bet_less_than_big_blind_fails():
     """Opening bet less than big blind should fail unless all-in."""
-    with pytest.raises(ActionValidationError, match="Opening bet must raise by at least the big blind"):
+    with pytest.raises(ActionValidationError) as ei:
         validate_raise(raise_to=10, player_stack=100, to_call=0, current_bet=0, min_raise=20, big_blind=20, player_current_bet=0)
+    assert ei.value.code == ERR_MIN_RAISE
 
 def test_opening_bet_equal_to_big_blind_pass():
     """Opening bet equal to big blind should pass."""
@@ -331,4 +345,26 @@ def test_player_stack_zero_fails():
             min_raise=20,
             big_blind=20,
             player_current_bet=0
-        )
\ No newline at end of file
+        )
+def test_error_message_is_formatted_lazily():
+    """A %-format message is only filled in when the error is shown."""
+    err = ActionValidationError("Must raise by at least %d chips.", 40)
+    assert err.args == ("Must raise by at least %d chips.",)
+    assert str(err) == "Must raise by at least 40 chips."
+    assert str(ActionValidationError("100% legal")) == "100% legal"
+
+@pytest.mark.parametrize("action_id, has_bet, message", [
+    (ActionId.FOLD, False, "Cannot fold when you can check"),
+    (ActionId.CHECK, True, "Cannot check when there is a bet to call"),
+    (ActionId.CALL, False, "Cannot call when to_call is zero"),
+])
+def test_validate_action_rejects_illegal_actions(action_id, has_bet, message):
+    with pytest.raises(ActionValidationError, match=message) as ei:
+        validate_action(action_id, has_bet)
+    assert ei.value.code
+
+@pytest.mark.parametrize("action_id, has_bet", [
+    (ActionId.FOLD, True), (ActionId.CHECK, False), (ActionId.CALL, True), (ActionId.RAISE, False), (ActionId.RAISE, True),
+])
+def test_validate_action_allows_legal_actions(action_id, has_bet):
+    validate_action(action_id, has_bet)
@@ -164,6 +164,14 @@ class TestAnteInMultiTableTournament:
         for i in range(2, min(len(schedule), 6)):
             assert schedule[i][2] > 0, f"Level {i+1} should have ante"
     
+    def test_custom_schedule_normalized_into_new_list(self):
+        """Two-level entries and ante amounts are normalized without touching the caller's list"""
+        custom_schedule = [(10, 20), (25, 50, 0), (50, 100, 25), (100, 200, 0)]
+        env = MultiTableTournamentEnv(total_players=18, blinds_schedule=custom_schedule)
+        
+        assert env.blinds_schedule == [(10, 20, 0), (25, 50, 0), (50, 100, 1), (100, 200, 1)]
+        assert custom_schedule == [(10, 20), (25, 50, 0), (50, 100, 25), (100, 200, 0)]
+    
     def test_ante_applied_to_all_tables(self):
         """Test that ante increases are applied to all active tables"""
         env = MultiTableTournamentEnv(
@@ -1,4 +1,7 @@
-from engine.cards import Card, Deck
+import random
+
+import numpy as np
+from engine.cards import Card, Deck, get_card
 import pytest
 
 valid_ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
@@ -10,6 +13,42 @@ def test_card_creation():
     assert card.suit == "♠"
     assert str(card) == "A♠"
 
+def test_card_int_fields():
+    card = Card("A", "♠")
+    assert card.rank_idx == 14
+    assert card.suit_idx == 0
+    assert Card("2", "♣").rank_idx == 2
+    assert Card("T", "♦").rank_idx == 10
+    assert Card("T", "♦").suit_idx == 2
+    assert card.packed == (14 << 2) | 0
+    assert Card("2", "♣").packed == (2 << 2) | 3
+
+def test_card_cactus_kev_encoding():
+    # K♦ from the Cactus-Kev write-up: 00001000 00000000 01001011 00100101
+    card = Card("K", "♦")
+    assert card.ck == 0b00001000_00000000_01001011_00100101
+    ace = Card("A", "♠")
+    assert (ace.ck >> 16) == 1 << 12  # rank bit
+    assert (ace.ck >> 12) & 0xF == 1  # suit bit
+    assert (ace.ck >> 8) & 0xF == 12  # rank index
+    assert ace.ck & 0x3F == 41  # rank prime
+
+def test_card_is_immutable_value():
+    card = Card("K", "♥")
+    assert card == Card("K", "♥")
+    assert hash(card) == hash(Card("K", "♥"))
+    with pytest.raises(AttributeError):
+        card.rank = "Q"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        card.rank_idx = 12
+
+def test_get_card_returns_shared_instance():
+    card = get_card("Q", "♣")
+    assert card is get_card("Q", "♣")
+    assert card == Card("Q", "♣")
+    with pytest.raises(ValueError):
+        get_card("X", "♠")
+
 def test_invalid_card_creation():
     with pytest.raises(ValueError):
         Card("X", "♠")
@@ -80,3 +119,33 @@ def test_deck_reset():
     deck.draw(5)
     deck.reset()
     assert len(deck.cards) == 52
+
+def test_deck_reset_across_order_batches():
+    deck = Deck()
+    orders = set()
+    for _ in range(Deck.DECK_ORDER_BATCH + 2):
+        deck.draw(9)
+        deck.reset()
+        assert len(set(deck.cards)) == 52
+        orders.add(tuple(deck.cards))
+    assert len(orders) == Deck.DECK_ORDER_BATCH + 2
+
+def test_deck_order_follows_random_seed():
+    random.seed(7)
+    first = Deck().cards
+    random.seed(7)
+    assert Deck().cards == first
+
+def test_deck_uses_injected_generator():
+    first = Deck(rng=np.random.default_rng(3)).cards
+    assert Deck(rng=np.random.default_rng(3)).cards == first
+
+def test_partial_shuffle_uses_injected_generator():
+    decks = []
+    for seed in (1, 2):
+        random.seed(seed)  # must not matter: the deck only draws from rng
+        deck = Deck(rng=np.random.default_rng(5))
+        deck.draw(5)
+        deck.shuffle()
+        decks.append(deck.cards)
+    assert decks[0] == decks[1]
@@ -1,7 +1,11 @@
 import pytest
 from engine.game import PokerGame
 from engine.player import Player
-from engine.action_validation import validate_raise, validate_call, ActionValidationError
+from utils.enums import ActionId
+from engine.action_validation import (
+    validate_raise, validate_call, ActionValidationError, ActionResult,
+    OK, ERR_CALL_NOTHING_TO_CALL, ERR_CHECK_FACING_BET, ERR_FOLD_CAN_CHECK, ERR_MIN_RAISE, ERR_UNKNOWN_ACTION, ERROR_MESSAGES,
+)
 
 def setup_game():
     alice = Player("Alice")
@@ -20,6 +24,16 @@ def setup_game():
 # --- 3-player BB ante setup and tests ---
 def setup_game_3p_bb_ante():
     # Dealer = Alice (pos 0), SB = Bob (pos 1), BB = Carol (pos 2)
+    # Jump straight to the post-blinds state: Carol paid ante (60) + BB (60), Bob paid SB (30)
+    alice = Player("Alice").reset_to(stack=1000)
+    bob = Player("Bob").reset_to(stack=970, current_bet=30, total_contributed=30)
+    carol = Player("Carol").reset_to(stack=880, current_bet=60, total_contributed=120)
+    game = PokerGame([alice, bob, carol], small_blind=30, big_blind=60, ante=1)
+    game.reset_to(pot=150, current_bet=60, last_raise_amount=60, current_player_idx=0)  # Alice (UTG) acts first
+    return game, alice, bob, carol
+
+def post_game_3p_bb_ante():
+    # Same state as setup_game_3p_bb_ante, reached through the real posting path
     alice = Player("Alice")
     bob = Player("Bob")
     carol = Player("Carol")
@@ -111,9 +125,10 @@ def test_check_when_to_call_positive_fails():
     game.current_bet = 50
     alice.current_bet = 0
     to_call = game.current_bet - alice.current_bet
-    # to_call = 50, cannot check
-    with pytest.raises(ActionValidationError, match="Cannot check when there is a bet to call."):
+    # to_call = 50, cannot check; the validator's code survives handle_check re-raising
+    with pytest.raises(ActionValidationError) as ei:
         game.handle_check(alice, to_call)
+    assert ei.value.code == ERR_CHECK_FACING_BET
 
 def test_check_with_negative_to_call_fails():
     game, alice, _ = setup_game()
@@ -276,12 +291,14 @@ def test_handle_raise_returns_structured_result():
     game, alice, _ = setup_game()
     to_call = game.current_bet - alice.current_bet
     result = game.handle_raise(alice, raise_to=150, to_call=to_call)
-    assert isinstance(result, dict)
-    assert "raise_to" in result
-    assert "is_all_in" in result
+    assert isinstance(result, ActionResult)
+    assert result.kind == "raise"
+    assert result.raise_to == 150
+    assert result["raise_to"] == result.raise_to  # dict-style access still supported
+    assert not result.is_all_in
 
 def test_bb_ante_posting():
-    game, alice, bob, carol = setup_game_3p_bb_ante()
+    game, alice, bob, carol = post_game_3p_bb_ante()
     # Only Carol (BB) should have posted ante
     assert alice.total_contributed == 0
     assert bob.total_contributed == 30
@@ -289,6 +306,87 @@ def test_bb_ante_posting():
     assert game.pot == 30 + 60 + 60
     assert carol.stack == 1000 - 60 - 60
 
+def test_3p_bb_ante_reset_to_matches_posting():
+    # Guard against drift between the reset_to shortcut and the real posting path
+    fields = ("stack", "current_bet", "total_contributed", "in_hand", "all_in")
+    posted = post_game_3p_bb_ante()
+    jumped = setup_game_3p_bb_ante()
+    for key in ("pot", "current_bet", "last_raise_amount", "current_player_idx"):
+        assert getattr(jumped[0], key) == getattr(posted[0], key)
+    for p_jumped, p_posted in zip(jumped[1:], posted[1:]):
+        assert [getattr(p_jumped, f) for f in fields] == [getattr(p_posted, f) for f in fields]
+
+def test_reset_to_rejects_unknown_fields():
+    game, alice, _, _ = setup_game_3p_bb_ante()
+    with pytest.raises(AttributeError):
+        game.reset_to(pott=150)
+    with pytest.raises(AttributeError):
+        alice.reset_to(stak=1000)
+
+def test_player_has_fixed_slots():
+    alice = Player("Alice")
+    assert not hasattr(alice, "__dict__")
+    with pytest.raises(AttributeError):
+        alice.stak = 1000
+
+def test_player_reset_restores_fresh_state():
+    alice = Player("Alice")
+    alice.bet_chips(300, suppress_log=True)
+    alice.in_hand = False
+    alice.hole_cards = ["As", "Kd"]
+    alice.reset(500)
+    assert (alice.stack, alice.current_bet, alice.total_contributed) == (500, 0, 0)
+    assert alice.in_hand and not alice.all_in and alice.hole_cards == []
+
+def test_step_checked_reports_illegal_actions_without_raising():
+    game = PokerGame([Player("Alice", stack=1000), Player("Bob", stack=1000)], small_blind=20, big_blind=40)
+    game.reset_for_new_hand(is_first_hand=True)
+    player = game.players[game.current_player_idx]
+    pot, stack = game.pot, player.stack
+    assert game.step_checked("check") == (False, ERR_CHECK_FACING_BET)
+    assert game.step_checked("limp") == (False, ERR_UNKNOWN_ACTION)
+    assert game.step_checked("raise", 50) == (False, ERR_MIN_RAISE)
+    # Rejected actions leave the game untouched
+    assert (game.pot, player.stack) == (pot, stack)
+    assert game.players[game.current_player_idx] is player
+    assert ERROR_MESSAGES[ERR_CHECK_FACING_BET] == "Cannot check when there is a bet to call."
+    assert game.step_checked("call") == (True, OK)
+    assert game.pot == pot + 20
+
+def test_step_checked_reports_illegal_actions_post_flop():
+    game = PokerGame([Player("Alice", stack=1000), Player("Bob", stack=1000)], small_blind=20, big_blind=40)
+    game.reset_for_new_hand(is_first_hand=True)
+    game.step("call")
+    game.step("check")
+    # A new betting round starts with players_to_act empty
+    assert game.phase_idx == PokerGame.FLOP and not game.players_to_act
+    pot = game.pot
+    assert game.step_checked("call") == (False, ERR_CALL_NOTHING_TO_CALL)
+    assert game.step_checked("fold") == (False, ERR_FOLD_CAN_CHECK)
+    assert game.pot == pot and game.phase_idx == PokerGame.FLOP
+    assert game.step_checked("check") == (True, OK)
+
+def test_step_int_matches_action_names():
+    assert [PokerGame.ACTION_NAMES[a] for a in ActionId] == [a.name.lower() for a in ActionId]
+    game = PokerGame([Player("Alice", stack=1000), Player("Bob", stack=1000)], small_blind=20, big_blind=40)
+    game.reset_for_new_hand(is_first_hand=True)
+    pot = game.pot
+    game.step_int(ActionId.CALL)
+    assert game.pot == pot + 20
+    with pytest.raises(ActionValidationError):
+        game.step_int(ActionId.FOLD)
+
+def test_to_call_tracks_bets():
+    game, alice, bob = setup_game()
+    assert (game.to_call(0), game.to_call(1)) == (20, 0)
+    game.handle_raise(alice, raise_to=120, to_call=20)
+    assert (game.to_call(0), game.to_call(1)) == (0, 80)
+
+def test_reset_to_rejects_pot_out_of_sync():
+    game, _, _, _ = setup_game_3p_bb_ante()
+    with pytest.raises(RuntimeError):
+        game.reset_to(pot=999)
+
 def test_3p_bb_ante_action_flow():
     game, alice, bob, carol = setup_game_3p_bb_ante()
     # Alice (UTG) calls 60
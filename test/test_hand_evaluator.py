@@ -1,124 +1,99 @@
-import pytest
-from engine.cards import Card
-from engine.hand_evaluator import evaluate_hand
-
-def make_cards(ranks_suits):
-    """Helper: create Card objects from list of (rank, suit)."""
-    return [Card(rank, suit) for rank, suit in ranks_suits]
-
-def test_high_card():
-    cards = make_cards([("A", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 0  # High card
-    assert best == [14, 13, 12, 11, 9]
-
-def test_one_pair():
-    cards = make_cards([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 1  # One pair
-    assert rank[1] == 13  # Pair of Kings
-    assert best is not None
-    assert best.count(13) == 2
-
-def test_two_pair():
-    cards = make_cards([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 2  # Two pair
-    assert rank[1] == 13  # High pair Kings
-    assert len(rank) > 2
-    assert rank[2] == 12  # Low pair Queens
-    assert best is not None
-    assert best.count(13) == 2
-    assert best.count(12) == 2
-
-def test_three_of_a_kind():
-    cards = make_cards([("K", "♠"), ("K", "♣"), ("K", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 3
-    assert rank[1] == 13
-    assert best is not None
-    assert best.count(13) == 3
+import functools
 
-def test_straight_normal():
-    cards = make_cards([("9", "♠"), ("8", "♣"), ("7", "♦"), ("6", "♥"), ("5", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 4  # Straight
-    assert rank[1] == 9   # Highest card 9
-    assert best == [9, 8, 7, 6, 5]
-
-def test_straight_wheel():
-    cards = make_cards([("A", "♠"), ("2", "♣"), ("3", "♦"), ("4", "♥"), ("5", "♠"), ("9", "♦"), ("7", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 4  # Straight
-    assert rank[1] == 5  # Highest card 5 for wheel straight
-    assert best == [5, 4, 3, 2, 14]
-
-def test_flush():
-    cards = make_cards([("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 5
-    # All best cards should be spades
-    spade_ranks = [card_rank(c) for c in cards if c.suit == "♠"]
-    assert best is not None
-    assert all(r in spade_ranks for r in best)
-    assert best == sorted(spade_ranks, reverse=True)[:5]
-
-def test_full_house():
-    cards = make_cards([("K", "♠"), ("K", "♣"), ("K", "♦"), ("J", "♥"), ("J", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert len(rank) > 2
-    assert rank[0] == 6
-    assert rank[1] == 13  # Trips Kings
-    assert len(rank) > 2
-    assert rank[2] == 11  # Pair Jacks
-    assert best is not None
-    assert best is not None
-    assert best.count(13) == 3
-    assert best.count(11) == 2
+import pytest
+from engine.cards import get_card
+from engine.hand_evaluator import Evaluator, evaluate_hand, evaluate_hand_nibbles, evaluate_hand_packed, hand_rank, hand_score, ncount, best_as_tuple, pack_cards, pack_score, score_to_rank
+from engine.hand_ranks_table import FLUSHES, PRODUCTS, UNIQUE5
+from engine._jit_warmup import warm_up
 
-def test_four_of_a_kind():
-    cards = make_cards([("K", "♠"), ("K", "♣"), ("K", "♦"), ("K", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert len(rank) > 1
-    assert rank[0] == 7
-    assert rank[1] == 13  # Quads Kings
-    assert best is not None
-    assert best is not None
-    assert best.count(13) == 4
+@pytest.fixture(scope="module")
+def evaluator():
+    # Evaluation is read-only, so one instance (and its tables) serves the whole module
+    return Evaluator()
 
-def test_straight_flush():
-    cards = make_cards([("9", "♠"), ("8", "♠"), ("7", "♠"), ("6", "♠"), ("5", "♠"), ("3", "♦"), ("2", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 8
-    assert rank[1] == 9
-    assert best is not None
-    assert best == [9, 8, 7, 6, 5]
+@functools.cache
+def _cards_for(ranks_suits):
+    return tuple(get_card(rank, suit) for rank, suit in ranks_suits)
 
-def test_best_hand_from_seven_cards():
-    cards = make_cards([("9", "♠"), ("8", "♠"), ("7", "♠"), ("6", "♠"), ("5", "♠"), ("A", "♦"), ("A", "♣")])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 8  # Straight flush beats pair of aces
-    assert rank[1] == 9
-    assert best is not None
-    assert best == [9, 8, 7, 6, 5]
+@functools.cache
+def _packed_for(ranks_suits):
+    return pack_cards(_cards_for(ranks_suits))
 
-def test_tie_breakers():
+def make_cards(ranks_suits):
+    """Helper: the shared Card objects for a list of (rank, suit), built once per hand."""
+    return _cards_for(tuple(ranks_suits))
+
+def make_cards_packed(ranks_suits):
+    """Helper: pack a list of (rank, suit) into bytes, one card per byte, built once per hand."""
+    return _packed_for(tuple(ranks_suits))
+
+# (cards, expected_category, expected_best_ranks) for single-hand evaluations
+HAND_CASES = [
+    pytest.param([("A", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 0, [14, 13, 12, 11, 9], id="high_card"),
+    pytest.param([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 1, [13, 13, 12, 11, 9], id="one_pair"),
+    pytest.param([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 2, [13, 13, 12, 12, 9], id="two_pair"),
+    pytest.param([("K", "♠"), ("K", "♣"), ("K", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 3, [13, 13, 13, 11, 9], id="three_of_a_kind"),
+    pytest.param([("9", "♠"), ("8", "♣"), ("7", "♦"), ("6", "♥"), ("5", "♠"), ("3", "♦"), ("2", "♣")],
+                 4, [9, 8, 7, 6, 5], id="straight_normal"),
+    pytest.param([("A", "♠"), ("2", "♣"), ("3", "♦"), ("4", "♥"), ("5", "♠"), ("9", "♦"), ("7", "♣")],
+                 4, [5, 4, 3, 2, 14], id="straight_wheel"),
+    pytest.param([("A", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("T", "♠"), ("3", "♦"), ("2", "♣")],
+                 4, [14, 13, 12, 11, 10], id="straight_broadway"),
+    # K-A-2-3-4 is not a straight; the Ace only plays low as the bottom of the wheel
+    pytest.param([("K", "♠"), ("A", "♣"), ("2", "♦"), ("3", "♥"), ("4", "♠"), ("9", "♦"), ("7", "♣")],
+                 0, [14, 13, 9, 7, 4], id="no_wraparound_straight"),
+    pytest.param([("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 5, [14, 13, 12, 11, 9], id="flush"),
+    pytest.param([("A", "♠"), ("J", "♠"), ("9", "♠"), ("6", "♠"), ("3", "♠"), ("2", "♦"), ("4", "♣")],
+                 5, [14, 11, 9, 6, 3], id="ace_low_flush"),
+    pytest.param([("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"), ("7", "♠"), ("6", "♠")],
+                 5, [14, 13, 12, 11, 9], id="flush_selects_top_five"),
+    pytest.param([("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"),
+                  ("A", "♥"), ("K", "♥"), ("Q", "♥"), ("J", "♥"), ("9", "♥"), ("2", "♦")],
+                 5, [14, 13, 12, 11, 9], id="multiple_flushes"),
+    pytest.param([("K", "♠"), ("K", "♣"), ("K", "♦"), ("J", "♥"), ("J", "♠"), ("3", "♦"), ("2", "♣")],
+                 6, [13, 13, 13, 11, 11], id="full_house"),
+    pytest.param([("3", "♠"), ("3", "♣"), ("3", "♦"), ("5", "♠"), ("5", "♥"), ("5", "♦"), ("7", "♣")],
+                 6, [5, 5, 5, 3, 3], id="full_house_multiple_triplets"),
+    pytest.param([("K", "♠"), ("K", "♣"), ("K", "♦"), ("K", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+                 7, [13, 13, 13, 13, 9], id="four_of_a_kind"),
+    pytest.param([("7", "♠"), ("7", "♣"), ("7", "♦"), ("7", "♥"), ("A", "♠"), ("K", "♠"), ("Q", "♣")],
+                 7, [7, 7, 7, 7, 14], id="four_of_a_kind_kicker"),
+    pytest.param([("9", "♠"), ("8", "♠"), ("7", "♠"), ("6", "♠"), ("5", "♠"), ("3", "♦"), ("2", "♣")],
+                 8, [9, 8, 7, 6, 5], id="straight_flush"),
+    # Straight flush beats the pair of aces also on the board
+    pytest.param([("9", "♠"), ("8", "♠"), ("7", "♠"), ("6", "♠"), ("5", "♠"), ("A", "♦"), ("A", "♣")],
+                 8, [9, 8, 7, 6, 5], id="best_hand_from_seven_cards"),
+    pytest.param([("A", "♠"), ("2", "♠"), ("3", "♠"), ("4", "♠"), ("5", "♠"), ("9", "♦"), ("7", "♣")],
+                 8, [5, 4, 3, 2, 14], id="straight_flush_wheel"),
+    # The wheel is met first in rank order but the six-high straight flush beats it
+    pytest.param([("A", "♠"), ("2", "♠"), ("3", "♠"), ("4", "♠"), ("5", "♠"), ("6", "♠"), ("7", "♣")],
+                 8, [6, 5, 4, 3, 2], id="straight_flush_over_wheel"),
+]
+
+@pytest.mark.parametrize("cards, expected_category, expected_best_ranks", HAND_CASES)
+def test_hand_categories(evaluator, cards, expected_category, expected_best_ranks):
+    rank, best = evaluator.evaluate_packed(make_cards_packed(cards))
+    assert rank is not None
+    assert rank[0] == expected_category
+    assert best == expected_best_ranks
+    # The nibble form carries the same five ranks
+    nibble_rank, nibbles = evaluator.evaluate_nibbles(make_cards_packed(cards))
+    assert nibble_rank == rank
+    assert best_as_tuple(nibbles) == tuple(expected_best_ranks)
+    for r in set(expected_best_ranks):
+        assert ncount(nibbles, r) == expected_best_ranks.count(r)
+
+def test_tie_breakers(evaluator):
     # Compare two pair with different kickers
     cards1 = make_cards([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")])
     cards2 = make_cards([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("8", "♠"), ("3", "♦"), ("2", "♣")])
-    rank1, best1 = evaluate_hand(cards1)
-    rank2, best2 = evaluate_hand(cards2)
+    rank1, best1 = evaluator.evaluate(cards1)
+    rank2, best2 = evaluator.evaluate(cards2)
     assert rank1 is not None
     assert best1 is not None
     assert rank2 is not None
@@ -128,85 +103,15 @@ def test_tie_breakers():
     # Compare one pair with different kickers
     cards3 = make_cards([("K", "♠"), ("K", "♣"), ("J", "♦"), ("9", "♥"), ("8", "♠"), ("3", "♦"), ("2", "♣")])
     cards4 = make_cards([("K", "♠"), ("K", "♣"), ("J", "♦"), ("7", "♥"), ("6", "♠"), ("3", "♦"), ("2", "♣")])
-    rank3, best3 = evaluate_hand(cards3)
-    rank4, best4 = evaluate_hand(cards4)
+    rank3, best3 = evaluator.evaluate(cards3)
+    rank4, best4 = evaluator.evaluate(cards4)
     assert rank3 is not None
     assert best3 is not None
     assert rank4 is not None
     assert best4 is not None
     assert rank3 > rank4
 
-def test_ace_low_flush():
-    cards = make_cards([
-        ("A", "♠"), ("J", "♠"), ("9", "♠"), ("6", "♠"), ("3", "♠"),
-        ("2", "♦"), ("4", "♣")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 5  # Flush
-    spade_ranks = [card_rank(c) for c in cards if c.suit == "♠"]
-    assert best is not None
-    assert all(r in spade_ranks for r in best)
-    assert 14 in best  # Ace present
-
-def test_multiple_flushes():
-    cards = make_cards([
-        ("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"),
-        ("A", "♥"), ("K", "♥"), ("Q", "♥"), ("J", "♥"), ("9", "♥"),
-        ("2", "♦")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 5
-    spade_ranks = [card_rank(c) for c in cards if c.suit == "♠"]
-    assert best is not None
-    assert all(r in spade_ranks for r in best)
-    assert 14 in best  # Ace present
-
-def test_full_house_multiple_triplets():
-    cards = make_cards([
-        ("3", "♠"), ("3", "♣"), ("3", "♦"),
-        ("5", "♠"), ("5", "♥"), ("5", "♦"),
-        ("7", "♣")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert len(rank) > 0
-    assert rank[0] == 6  # Full house
-    assert best is not None
-    assert len(best) > 0
-    assert best is not None
-    assert best.count(5) == 3
-    assert best.count(3) == 2
-
-def test_four_of_a_kind_kicker():
-    cards = make_cards([
-        ("7", "♠"), ("7", "♣"), ("7", "♦"), ("7", "♥"),
-        ("A", "♠"), ("K", "♠"), ("Q", "♣")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert len(rank) > 1
-    assert rank[0] == 7
-    assert rank[1] == 7
-    assert best is not None
-    assert best is not None
-    assert best.count(7) == 4
-    assert 14 in best  # Ace kicker
-
-def test_straight_flush_wheel():
-    cards = make_cards([
-        ("A", "♠"), ("2", "♠"), ("3", "♠"), ("4", "♠"), ("5", "♠"),
-        ("9", "♦"), ("7", "♣")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 8
-    assert rank[1] == 5  # Ace-low straight flush highest card is 5
-    assert best is not None
-    assert best == [5, 4, 3, 2, 14]
-
-def test_tie_breakers_kickers():
+def test_tie_breakers_kickers(evaluator):
     # Hand 1: Full house, Kings over Jacks
     cards1 = make_cards([
         ("K", "♠"), ("K", "♣"), ("K", "♦"),
@@ -217,8 +122,8 @@ def test_tie_breakers_kickers():
         ("Q", "♠"), ("Q", "♣"), ("Q", "♦"),
         ("J", "♥"), ("J", "♠"), ("3", "♦"), ("2", "♣")
     ])
-    rank1, best1 = evaluate_hand(cards1)
-    rank2, best2 = evaluate_hand(cards2)
+    rank1, best1 = evaluator.evaluate(cards1)
+    rank2, best2 = evaluator.evaluate(cards2)
     assert rank1 is not None
     assert rank2 is not None
     assert rank1 > rank2  # Kings over Jacks beats Queens over Jacks
@@ -232,7 +137,7 @@ def test_tie_breakers_kickers():
     assert best2.count(12) == 3
     assert best2.count(11) == 2
 
-def test_flush_tie_breaker():
+def test_flush_tie_breaker(evaluator):
     # Hand 1: Ace-high flush
     cards1 = make_cards([
         ("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"),
@@ -243,15 +148,15 @@ def test_flush_tie_breaker():
         ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"), ("8", "♠"),
         ("3", "♦"), ("2", "♣")
     ])
-    rank1, best1 = evaluate_hand(cards1)
-    rank2, best2 = evaluate_hand(cards2)
+    rank1, best1 = evaluator.evaluate(cards1)
+    rank2, best2 = evaluator.evaluate(cards2)
     assert rank1 is not None and rank2 is not None
     assert rank1 > rank2  # Ace-high flush beats King-high flush
     assert best1 is not None and best2 is not None
     assert best1[0] == 14  # Ace
     assert best2[0] == 13  # King
 
-def test_straight_tie_breaker():
+def test_straight_tie_breaker(evaluator):
     # Hand 1: 9-high straight
     cards1 = make_cards([
         ("9", "♠"), ("8", "♣"), ("7", "♦"), ("6", "♥"), ("5", "♠"),
@@ -262,29 +167,76 @@ def test_straight_tie_breaker():
         ("8", "♠"), ("7", "♣"), ("6", "♦"), ("5", "♥"), ("4", "♠"),
         ("3", "♦"), ("2", "♣")
     ])
-    rank1, best1 = evaluate_hand(cards1)
-    rank2, best2 = evaluate_hand(cards2)
+    rank1, best1 = evaluator.evaluate(cards1)
+    rank2, best2 = evaluator.evaluate(cards2)
     assert rank1 is not None and rank2 is not None
     assert rank1 > rank2  # 9-high straight beats 8-high straight
     assert best1 is not None and best2 is not None
     assert best1[0] == 9
     assert best2[0] == 8
 
-def test_flush_selects_top_five():
-    cards = make_cards([
-        ("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"),
-        ("7", "♠"), ("6", "♠")
-    ])
-    rank, best = evaluate_hand(cards)
-    assert rank is not None
-    assert rank[0] == 5
-    assert best is not None
-    assert best == [14, 13, 12, 11, 9]
-
-# Helper for rank conversion
-def card_rank(card):
-    RANK_MAP = {
-        '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
-        'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14,
-    }
-    return RANK_MAP[card.rank]
\ No newline at end of file
+def test_hand_rank_returns_best_five_list():
+    # hand_rank is what showdown uses on hole + community cards
+    cards = make_cards([("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("9", "♠"), ("9", "♦"), ("2", "♣")])
+    rank, best = hand_rank(cards)
+    assert rank == (2, 13, 12, 9)
+    assert best == [13, 13, 12, 12, 9]
+
+def test_score_compares_like_rank_tuples(evaluator):
+    # Kings full of Jacks beat Queens full of Jacks; a plain int compare agrees
+    cards1 = make_cards([("K", "♠"), ("K", "♣"), ("K", "♦"), ("J", "♥"), ("J", "♠"), ("3", "♦"), ("2", "♣")])
+    cards2 = make_cards([("Q", "♠"), ("Q", "♣"), ("Q", "♦"), ("J", "♥"), ("J", "♠"), ("3", "♦"), ("2", "♣")])
+    score1 = evaluator.score(cards1)
+    score2 = evaluator.score(cards2)
+    assert isinstance(score1, int)
+    assert score1 > score2
+    assert score_to_rank(score1) == evaluator.evaluate(cards1)[0]
+    assert evaluator.score_packed(pack_cards(cards1)) == score1
+    assert hand_score(cards2) == score2
+    assert evaluator.score(cards1[:4]) is None
+
+def test_packed_input_matches_card_list(evaluator):
+    cards = make_cards([("A", "♠"), ("2", "♠"), ("3", "♠"), ("4", "♠"), ("5", "♠"), ("9", "♦"), ("7", "♣")])
+    packed = pack_cards(cards)
+    assert isinstance(packed, bytes)
+    assert len(packed) == 7
+    assert evaluator.evaluate(packed) == evaluator.evaluate(cards)
+    assert evaluator.evaluate(bytearray(packed)) == evaluator.evaluate(cards)
+    assert evaluator.evaluate_packed(packed) == evaluator.evaluate(cards)
+    # Module-level evaluate_hand goes through the shared default Evaluator
+    assert evaluate_hand(packed) == evaluator.evaluate(cards)
+    assert evaluate_hand_packed(packed) == evaluator.evaluate(cards)
+    assert evaluate_hand_nibbles(packed) == evaluator.evaluate_nibbles(cards)
+
+def test_score_orders_like_rank_tuples():
+    ranks = [(6, 13, 11), (6, 12, 11), (2, 13, 12, 9), (2, 13, 12, 8), (1, 13, 11, 9, 8), (0, 14, 13, 12, 11, 9)]
+    scores = [pack_score(*rank) for rank in ranks]
+    assert scores == sorted(scores, reverse=True)
+    assert [score_to_rank(score) for score in scores] == ranks
+
+def test_rank_tables_cover_every_five_card_class():
+    # 1287 rank sets each for flushes and unsuited distinct ranks, 4888 paired
+    # prime products: 7462 equivalence classes in all, each with its own score
+    flushes = [s for s in FLUSHES if s]
+    unique5 = [s for s in UNIQUE5 if s]
+    assert len(flushes) == len(unique5) == 1287
+    assert len(PRODUCTS) == 4888
+    assert len(set(flushes) | set(unique5) | set(PRODUCTS.values())) == 7462
+
+@pytest.mark.parametrize("ranks_suits", [
+    [("A", "♠"), ("K", "♣"), ("Q", "♦"), ("J", "♥"), ("9", "♠"), ("3", "♦"), ("2", "♣")],
+    [("K", "♠"), ("K", "♣"), ("Q", "♦"), ("Q", "♥"), ("9", "♠"), ("9", "♦"), ("2", "♣")],
+    [("3", "♠"), ("3", "♣"), ("3", "♦"), ("5", "♠"), ("5", "♥"), ("5", "♦"), ("7", "♣")],
+    [("A", "♠"), ("2", "♠"), ("3", "♠"), ("4", "♠"), ("5", "♠"), ("9", "♦"), ("7", "♣")],
+    [("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♠"), ("7", "♠"), ("6", "♠")],
+    [("7", "♠"), ("7", "♣"), ("7", "♦"), ("7", "♥"), ("A", "♠"), ("K", "♠"), ("Q", "♣")],
+    [("A", "♠"), ("2", "♣"), ("3", "♦"), ("4", "♥"), ("5", "♠"), ("9", "♦"), ("7", "♣")],
+])
+def test_jit_kernel_matches_python_path(ranks_suits):
+    # Runs the kernel compiled when Numba is installed, as plain Python otherwise
+    cards = make_cards(ranks_suits)
+    assert Evaluator(use_jit=True).evaluate(cards) == Evaluator(use_jit=False).evaluate(cards)
+
+def test_jit_warm_up_runs_every_kernel():
+    # Works with or without Numba; with it, it populates the on-disk cache
+    warm_up()
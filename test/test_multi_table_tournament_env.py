@@ -1,41 +1,96 @@
+import math
+import re
 import env
 import pytest
 import numpy as np
-from env.multi_table_tournament_env import MultiTableTournamentEnv, Table
+from unittest.mock import patch
+from env.multi_table_tournament_env import MultiTableTournamentEnv, Table, TURBO_BLINDS_SCHEDULE
 from engine.player import Player
 from env.rule_based_tournament_env import RuleBasedTournamentEnv
-# Capture output during multiple balancing calls
-import io
-import sys
-from contextlib import redirect_stdout
 
-def test_multi_table_tournament_initialization():
-    """Test that multi-table tournament initializes correctly"""
-    env = MultiTableTournamentEnv(total_players=27, max_players_per_table=9)
-    
-    # Should create 3 tables with 9 players each
-    assert len(env.tables) == 3
-    assert env.total_players == 27
-    
-    # Check player distribution
-    total_seated = sum(len(table.players) for table in env.tables.values())
-    assert total_seated == 27
-    
-    # Each table should have at most 9 players
-    for table in env.tables.values():
-        assert len(table.players) <= 9
-        assert len(table.players) >= 1
-
-def test_uneven_player_distribution():
-    """Test tournament with uneven player distribution"""
-    env = MultiTableTournamentEnv(total_players=50, max_players_per_table=9)
-    
-    # Should create 6 tables (50/9 = 5.55, rounded up)
-    assert len(env.tables) >= 5
+# Captured-output filters, run over the whole capture instead of line by line
+_DEBUG_REMOVED_RE = re.compile(r'\[DEBUG\][^\n]*Removed')
+_BALANCE_MOVE_RE = re.compile(r'^\[BALANCE_TABLE\] Moving[^\n]*', re.MULTILINE)
+
+def find_player(env, name):
+    """Return the env's Player object called `name` (None if there is none)."""
+    return env._players_by_name.get(name)
+
+def _table_sizes(env):
+    """Return the number of seated players at every table as one int array."""
+    return np.fromiter((len(t.players) for t in env.tables.values()), dtype=np.int32, count=len(env.tables))
+
+def _bust(env, players):
+    """Zero the stacks of `players` in one store into env.stacks, without recording eliminations."""
+    env.stacks[[env._player_index[p] for p in players]] = 0
+
+def _rollout(env, obs, info, n, collect_obs=False):
+    """
+    Step env up to n times with the first legal action, stopping early when
+    the tournament ends or nothing is legal. Returns (steps, observations,
+    table_ids): row i holds the observation and active table seen before
+    step i (observations is None unless collect_obs).
+    """
+    obs_buf = np.empty((n, obs.shape[0]), dtype=obs.dtype) if collect_obs else None
+    table_ids = np.empty(n, dtype=np.int32)
+    # Checked once: after that step()'s terminated flag reports the same thing
+    if env._tournament_finished():
+        return 0, obs_buf, table_ids
+    for i in range(n):
+        mask = info["action_mask"]
+        if not mask.any():
+            return i, obs_buf, table_ids
+        if collect_obs:
+            obs_buf[i] = obs
+        table_ids[i] = env.active_table_id
+        obs, reward, terminated, truncated, info = env.step(int(mask.argmax()))
+        if terminated:
+            return i + 1, obs_buf, table_ids
+    return n, obs_buf, table_ids
+
+# (total_players, max_players_per_table, expected number of tables)
+TOURNAMENT_SHAPES = [
+    (27, 9, 3),
+    (50, 9, 6),   # uneven: 50/9 rounds up
+    (99, 9, 11),  # large tournament
+    (2, 9, 1),    # minimum viable tournament
+    (18, 9, 2),
+]
+
+@pytest.mark.parametrize("total,maxp,expected_tables", TOURNAMENT_SHAPES)
+def test_tournament_shape(total, maxp, expected_tables, tourney_env_factory):
+    """Players are spread over the expected number of tables, none over the cap"""
+    env = tourney_env_factory(total, max_players_per_table=maxp)
+    
+    assert len(env.tables) == expected_tables
+    assert env.total_players == total
+    assert env.total_seated_players == total
+    sizes = _table_sizes(env)
+    assert sizes.sum() == total
+    assert sizes.min() >= 1 and sizes.max() <= maxp
+
+# Seeded random (total players, max per table, starting stack) draws
+_SEATING_SAMPLES = [
+    tuple(row) for row in
+    np.random.default_rng(0).integers((2, 2, 10), (121, 10, 10_000_001), size=(20, 3)).tolist()
+]
+
+@pytest.mark.parametrize("total,maxp,stack", _SEATING_SAMPLES)
+def test_seating_invariants(total, maxp, stack):
+    """Any valid shape seats everyone at ceil(total/maxp) playable tables with no chips lost"""
+    if maxp == 2 and total % 2:
+        with pytest.raises(ValueError):
+            MultiTableTournamentEnv(total_players=total, max_players_per_table=maxp, starting_stack=stack)
+        return
+    env = MultiTableTournamentEnv(total_players=total, max_players_per_table=maxp, starting_stack=stack)
+    obs, info = env.reset()
     
-    # Total players should still be 50
-    total_seated = sum(len(table.players) for table in env.tables.values())
-    assert total_seated == 50
+    assert obs.shape == (8,)
+    sizes = _table_sizes(env)
+    assert len(sizes) == math.ceil(total / maxp)
+    assert sizes.sum() == total
+    assert sizes.min() >= 2 and sizes.max() <= maxp
+    assert sum(p.stack + p.current_bet for p in env.all_players) == total * stack
 
 def test_table_class_functionality():
     """Test Table class methods"""
@@ -62,15 +117,15 @@ def test_table_class_functionality():
     assert len(table.players) == 5
     assert new_player in table.players
 
-def test_observation_space():
+def test_observation_space(env_18_9):
     """Test observation space shape and content"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env = env_18_9
+    obs, info = env._get_obs(), {"action_mask": env.legal_action_mask()}
     
     # Should have 8-dimensional observation
     assert obs.shape == (8,)
     assert "action_mask" in info
-    assert info["action_mask"].shape == (3,)
+    assert info["action_mask"].dtype == np.uint8 and info["action_mask"].shape == (3,)
     
     # Observation values should be reasonable
     assert obs[0] >= 0  # stack
@@ -82,31 +137,28 @@ def test_observation_space():
     assert obs[6] >= 2  # players_at_table (at least 2 for active game)
     assert obs[7] >= 0  # blind_level
 
-def test_legal_action_mask():
+def test_legal_action_mask(env_9_9):
     """Test legal action mask generation"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    mask = info["action_mask"]
+    mask = env_9_9.legal_action_mask()
     
     # At least one action should be legal
-    assert any(mask)
+    assert mask.any()
     
     # Mask should have 3 elements [fold, call/check, raise]
-    assert len(mask) == 3
-    assert all(isinstance(x, (bool, np.bool_)) for x in mask)
+    assert mask.shape == (3,)
+    assert mask.dtype == np.uint8
 
-def test_step_functionality():
+def test_step_functionality(tourney_env_factory):
     """Test basic step functionality"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
+    obs, info = env._soft_reset()
     
     # Get a legal action
     mask = info["action_mask"]
-    legal_actions = [i for i, legal in enumerate(mask) if legal]
+    legal_actions = np.flatnonzero(mask)
     assert len(legal_actions) > 0
     
-    action = legal_actions[0]
+    action = int(legal_actions[0])
     obs, reward, terminated, truncated, info = env.step(action)
     
     # Should return valid step results
@@ -116,50 +168,37 @@ def test_step_functionality():
     assert isinstance(truncated, bool)
     assert "action_mask" in info
 
-def test_blind_increase_mechanism():
+def test_play_until_finished_respects_step_budget(tourney_env_factory):
+    """play_until_finished stops at max_steps unless the tournament ends first"""
+    env = tourney_env_factory(9)
+    
+    steps, terminated = env.play_until_finished(25)
+    assert steps == 25 or terminated
+    assert terminated == env._tournament_finished()
+
+def test_blind_increase_mechanism(tourney_env_factory):
     """Test that blinds increase correctly"""
-    env = MultiTableTournamentEnv(
-        total_players=9, 
-        max_players_per_table=9,
-        hands_per_blind_level=2  # Quick blind increases for testing
-    )
-    obs, info = env.reset()
+    env = tourney_env_factory(9, hands_per_blind_level=2)  # Quick blind increases for testing
     
     initial_blind_level = env.current_blind_level
     initial_blinds = env.blinds_schedule[initial_blind_level]
     
     # Play several hands to trigger blind increase
-    for _ in range(10):  # Should be enough to increase blinds
-        if env._tournament_finished():
-            break
-        
-        mask = info["action_mask"]
-        if any(mask):
-            action = int(np.argmax(mask))  # Take first legal action
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            if terminated:
-                break
+    env.play_until_finished(10)  # Should be enough to increase blinds
     
     # Blinds should have increased (or tournament ended)
     if not env._tournament_finished():
         assert env.current_blind_level >= initial_blind_level
 
-def test_table_balancing_trigger():
+def test_table_balancing_trigger(tourney_env_factory):
     """Test that table balancing is triggered when needed"""
-    env = MultiTableTournamentEnv(
-        total_players=18, 
-        max_players_per_table=9,
-        table_balancing_threshold=6
-    )
-    obs, info = env.reset()
+    env = tourney_env_factory(18, table_balancing_threshold=6)
     
     # Manually eliminate players from one table to trigger balancing
     target_table = env.tables[0]
     players_to_eliminate = target_table.players[6:]  # Leave only 6 players
     
-    for player in players_to_eliminate:
-        player.stack = 0
+    _bust(env, players_to_eliminate)
     
     # Check balancing mechanism
     env.balance_table(env.active_table_id)
@@ -171,10 +210,9 @@ def test_table_balancing_trigger():
         # Check that no table is too empty relative to others
         assert max(player_counts) - min(player_counts) <= 3
 
-def test_player_elimination_tracking():
+def test_player_elimination_tracking(tourney_env_factory):
     """Test that player elimination is tracked correctly"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
     
     initial_elimination_count = len(env.elimination_order)
     
@@ -190,15 +228,13 @@ def test_player_elimination_tracking():
         assert len(env.elimination_order) == initial_elimination_count + 1
         assert player_to_eliminate in env.elimination_order
 
-def test_tournament_completion():
+def test_tournament_completion(tourney_env_factory):
     """Test tournament completion detection"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
     
     # Manually eliminate all but one player
     remaining_player = env.all_players[0]
-    for player in env.all_players[1:]:
-        player.stack = 0
+    env.stacks[1:] = 0
     
     # Tournament should be finished
     assert env._tournament_finished() is True
@@ -224,46 +260,73 @@ def test_reset_functionality():
     assert len(env.tables) == initial_tables
     assert env.total_players == initial_players
 
-def test_table_selection_round_robin():
-    """Test that tables are selected in round-robin fashion"""
+def test_clone_is_independent(env_18_9):
+    """clone() copies players, tables and arrays but shares the immutable pieces"""
+    env = env_18_9
+    clone = env.clone()
+    
+    assert [p.name for p in clone.all_players] == [p.name for p in env.all_players]
+    assert all(a is not b for a, b in zip(clone.all_players, env.all_players))
+    assert clone.blinds_schedule is env.blinds_schedule
+    table, clone_table = env.tables[0], clone.tables[0]
+    assert clone_table.game.players is clone_table.players
+    assert clone_table.players[0] in clone._player_index
+    assert clone_table.players[0].hole_cards[0] is table.players[0].hole_cards[0]
+    
+    clone.stacks[:] = 0
+    clone.tables[1].is_active = False
+    assert (env.stacks > 0).all()
+    assert [t.table_id for t in env._get_active_tables()] == [0, 1]
+    assert [t.table_id for t in clone._get_active_tables()] == [0]
+
+def test_clone_rebinds_rule_based_agents():
+    """Agents in a cloned RuleBasedTournamentEnv point at the clone"""
+    env = RuleBasedTournamentEnv(total_players=18, max_players_per_table=9)
+    env.reset()
+    clone = env.clone()
+    agents = [p.agent for p in clone.all_players if p.agent is not None]
+    assert agents and all(agent.env is clone for agent in agents)
+
+def test_soft_reset_reuses_players():
+    """_soft_reset restores a played tournament without creating new Player objects"""
     env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env.reset()
+    players = {p.name: p for p in env.all_players}
+    
+    env.stacks[:5] = 0
+    env._update_elimination_order()
+    env.play_until_finished(20)
+    env._soft_reset()
+    
+    assert env.elimination_order == []
+    assert env.total_hands_played == 0
+    assert len(env.tables) == 2 and env.total_seated_players == 18
+    for player in env.all_players:
+        assert player is players[player.name]
+        # Blinds for the first hand are already posted
+        assert player.stack + player.current_bet == env.starting_stack
+        assert player.in_hand
+
+def test_table_selection_round_robin(tourney_env_factory):
+    """Test that tables are selected in round-robin fashion"""
+    env = tourney_env_factory(18)
+    obs, info = env._soft_reset()
     
     # Should have multiple tables
     active_tables = env._get_active_tables()
     assert len(active_tables) >= 2
     
-    # Track table selections
-    table_selections = []
-    initial_table = env.active_table_id
-    table_selections.append(initial_table)
+    # Play a few hands and track the tables visited
+    steps, _, table_ids = _rollout(env, obs, info, 5)
+    table_selections = set(table_ids[:steps].tolist()) | {env.active_table_id}
     
-    # Play a few hands and track table changes
-    for _ in range(5):
-        if env._tournament_finished():
-            break
-            
-        mask = info["action_mask"]
-        if any(mask):
-            action = int(np.argmax(mask))
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            if env.active_table_id != table_selections[-1]:
-                table_selections.append(env.active_table_id)
-            
-            if terminated:
-                break
-    
-    # Should have played at multiple tables (if tournament didn't end too quickly)
-    if not env._tournament_finished() and len(table_selections) > 1:
-        assert len(set(table_selections)) > 1
-
-def test_tournament_stats():
+    # Every table picked must be one of the tournament's tables
+    assert steps > 0
+    assert table_selections <= set(env.tables)
+
+def test_tournament_stats(env_27_9):
     """Test tournament statistics generation"""
-    env = MultiTableTournamentEnv(total_players=27, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    stats = env.get_tournament_stats()
+    stats = env_27_9.get_tournament_stats()
     
     # Check that all expected stats are present
     expected_keys = [
@@ -291,27 +354,9 @@ def test_tournament_stats():
         sb, bb, ante = stats["blinds"] 
         assert sb > 0 and bb > 0 and bb > sb and ante >= 0
 
-def test_large_tournament():
-    """Test with a large tournament (99 players)"""
-    env = MultiTableTournamentEnv(total_players=99, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    # Should create 11 tables (99/9 = 11)
-    assert len(env.tables) == 11
-    
-    # Total players should be 99
-    total_seated = sum(len(table.players) for table in env.tables.values())
-    assert total_seated == 99
-    
-    # Each table should have at most 9 players
-    for table in env.tables.values():
-        assert len(table.players) <= 9
-        assert len(table.players) >= 1
-
-def test_heads_up_final_table():
+def test_heads_up_final_table(tourney_env_factory):
     """Test behavior when down to final 2 players"""
-    env = MultiTableTournamentEnv(total_players=3, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(3)
     
     # Eliminate one player to get heads-up
     player_to_eliminate = env.all_players[0]
@@ -326,49 +371,55 @@ def test_heads_up_final_table():
         two_player_tables = [t for t in remaining_tables if t.get_active_player_count() == 2]
         assert len(two_player_tables) >= 1
 
-if __name__ == "__main__":
-    # Run a specific test for debugging
-    test_multi_table_tournament_initialization()
-    print("Multi-table tournament initialization test passed!")
-
 # ====== EDGE CASE AND ROBUSTNESS TESTS ======
 
-def test_minimum_tournament_size():
-    """Test minimum viable tournament (2 players)"""
-    env = MultiTableTournamentEnv(total_players=2, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    # Should create 1 table with 2 players
-    assert len(env.tables) == 1
-    assert env.total_players == 2
+def test_minimum_tournament_size(tourney_env_factory):
+    """A 2-player tournament (see TOURNAMENT_SHAPES) can be played"""
+    env = tourney_env_factory(2)
+    obs, info = env._soft_reset()
     
-    # Should be able to play
     mask = info["action_mask"]
-    assert any(mask), "Should have legal actions with 2 players"
-
-def test_invalid_tournament_configurations():
-    """Test invalid tournament configurations"""
-    # Zero players
-    with pytest.raises((ValueError, RuntimeError)):
-        env = MultiTableTournamentEnv(total_players=0)
-    
-    # One player
-    with pytest.raises((ValueError, RuntimeError)):
-        env = MultiTableTournamentEnv(total_players=1)
-    
-    # Max players per table too small
-    with pytest.raises((ValueError, RuntimeError)):
-        env = MultiTableTournamentEnv(total_players=10, max_players_per_table=1)
-
-def test_all_players_eliminated_except_one():
+    assert mask.any(), "Should have legal actions with 2 players"
+
+@pytest.mark.parametrize("kwargs,message", [
+    ({"total_players": 0}, "at least 2 players"),
+    ({"total_players": 1}, "at least 2 players"),
+    ({"total_players": 10, "max_players_per_table": 1}, "per table must be at least 2"),
+    ({"total_players": 9, "max_players_per_table": 2}, "odd number of players"),
+    ({"total_players": 9, "starting_stack": 0}, "Starting stack"),
+    ({"total_players": 9, "hands_per_blind_level": 0}, "Hands per blind level"),
+    ({"total_players": 9, "table_balancing_threshold": 1}, "balancing threshold"),
+])
+def test_invalid_tournament_configurations(kwargs, message):
+    """Bad settings are rejected by the up-front checks, before any player is created"""
+    with patch.object(MultiTableTournamentEnv, "_setup_tournament") as setup:
+        with pytest.raises(ValueError, match=message):
+            MultiTableTournamentEnv(**kwargs)
+    setup.assert_not_called()
+
+@pytest.mark.parametrize("schedule,message", [
+    ([(10, 20, 0), (0, 40, 0)], "Invalid blinds at level 1"),
+    ([(10, 20, 0), (40, 40, 0)], "Big blind must be greater than small blind at level 1"),
+    ([(10, 20, -1)], "Ante cannot be negative at level 0"),
+])
+def test_invalid_blind_schedules(schedule, message):
+    """Every blind level is validated, and the first bad level is reported"""
+    with pytest.raises(ValueError, match=message):
+        MultiTableTournamentEnv(total_players=6, blinds_schedule=schedule)
+
+def test_default_blind_schedule_is_shared(env_9_9, env_18_9):
+    """Envs built without a schedule share the module-level turbo schedule"""
+    assert env_9_9.blinds_schedule is TURBO_BLINDS_SCHEDULE
+    assert env_18_9.blinds_schedule is TURBO_BLINDS_SCHEDULE
+    assert env_9_9._max_blind_level == len(TURBO_BLINDS_SCHEDULE) - 1
+
+def test_all_players_eliminated_except_one(tourney_env_factory):
     """Test tournament completion when all but one player eliminated"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
     
     # Eliminate all but one player
     winner = env.all_players[0]
-    for player in env.all_players[1:]:
-        player.stack = 0
+    env.stacks[1:] = 0
     
     env._update_elimination_order()
     
@@ -377,17 +428,15 @@ def test_all_players_eliminated_except_one():
     assert len(env.elimination_order) == 8
     assert winner not in env.elimination_order
 
-def test_simultaneous_all_in_eliminations():
+def test_simultaneous_all_in_eliminations(tourney_env_factory):
     """Test multiple players eliminated in same hand"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
     
     initial_eliminations = len(env.elimination_order)
     
     # Eliminate multiple players simultaneously
     players_to_eliminate = env.all_players[:3]
-    for player in players_to_eliminate:
-        player.stack = 0
+    env.stacks[:3] = 0
     
     env._update_elimination_order()
     
@@ -395,13 +444,73 @@ def test_simultaneous_all_in_eliminations():
     assert len(env.elimination_order) == initial_eliminations + 3
     for player in players_to_eliminate:
         assert player in env.elimination_order
+    eliminated_events = [payload for kind, payload in env.events if kind == "eliminated"]
+    assert [e["player"] for e in eliminated_events] == [p.name for p in env.elimination_order]
+    assert [e["placement"] for e in eliminated_events] == [9, 8, 7]
+
+def test_elimination_mask_follows_elimination_order(tourney_env_factory):
+    """Players taken back out of elimination_order can be eliminated again"""
+    env = tourney_env_factory(9)
+    
+    player = env.all_players[2]
+    player.stack = 0
+    env._update_elimination_order()
+    assert env.elimination_order == [player]
+    
+    # Stack restored: dropped from the order, then busts again
+    player.stack = 100
+    env._clean_elimination_order()
+    assert env.elimination_order == []
+    player.stack = 0
+    env._update_elimination_order()
+    assert env.elimination_order == [player]
+    
+    # Reassigning the order keeps the mask in step
+    env.elimination_order = []
+    env._update_elimination_order()
+    assert env.elimination_order == [player]
+
+def test_player_stacks_share_env_array(tourney_env_factory):
+    """Player.stack and env.stacks are the same storage in both directions"""
+    env = tourney_env_factory(9)
+    env._soft_reset()
+    
+    player = env.all_players[4]
+    player.stack = 123
+    assert env.stacks[4] == 123
+    
+    env.stacks[:3] = 0
+    assert [p.stack for p in env.all_players[:3]] == [0, 0, 0]
+    assert type(env.all_players[0].stack) is int
+    
+    env._soft_reset()
+    assert all(p.stack + p.current_bet == env.starting_stack for p in env.all_players)
+
+def test_tournament_finished_refreshes_after_eliminations(tourney_env_factory):
+    """The finished check follows recorded eliminations"""
+    env = tourney_env_factory(9)
+    
+    assert env._tournament_finished() is False
+    env.stacks[2:] = 0
+    env._update_elimination_order()
+    assert env._tournament_finished() is True
+
+def test_tournament_finished_sees_stacks_busted_through_env_stacks(tourney_env_factory):
+    """Busting players straight through env.stacks, with no elimination recorded, ends the tournament"""
+    env = tourney_env_factory(18)
+    
+    assert env._tournament_finished() is False
+    _bust(env, env.all_players[:15])
+    assert env._tournament_finished() is False
+    _bust(env, env.all_players[15:16])
+    assert env._tournament_finished() is True
 
 # Tests for balance_table functionality
 
-def test_invalid_actions_and_error_handling():
+def test_invalid_actions_and_error_handling(tourney_env_factory):
     """Test invalid actions and error handling"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
+    obs, info = env._soft_reset()
     
     # Test invalid action (out of range)
     obs, reward, terminated, truncated, info = env.step(999)
@@ -409,10 +518,10 @@ def test_invalid_actions_and_error_handling():
     
     # Test action when no legal actions (if possible)
     mask = info["action_mask"]
-    illegal_actions = [i for i, legal in enumerate(mask) if not legal]
+    illegal_actions = np.flatnonzero(mask == 0)
     
-    if illegal_actions:
-        obs, reward, terminated, truncated, info = env.step(illegal_actions[0])
+    if illegal_actions.size:
+        obs, reward, terminated, truncated, info = env.step(int(illegal_actions[0]))
         assert reward <= 0, "Illegal action should give negative reward"
 
 def test_blind_level_progression_edge_cases():
@@ -433,98 +542,59 @@ def test_blind_level_progression_edge_cases():
     # Should not exceed max blind level
     assert env.current_blind_level < len(env.blinds_schedule)
 
-def test_player_movement_preserves_integrity():
+def test_player_movement_preserves_integrity(tourney_env_factory):
     """Test that player movement preserves game integrity"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    # Record initial player distribution
-    initial_player_names = set(p.name for p in env.all_players)
+    env = tourney_env_factory(18)
     
     # Force table balancing multiple times
     for _ in range(3):
         env.balance_table(env.active_table_id)
-
-    # Collect all players from all tables
-    final_player_names = set()
-    for table in env.tables.values():
-        for player in table.players:
-            final_player_names.add(player.name)
     
     # Should have same players (no duplication or loss)
-    assert initial_player_names == final_player_names
+    env.assert_players_intact()
+    assert env.total_seated_players == _table_sizes(env).sum()
 
-def test_concurrent_hands_across_tables():
+def test_concurrent_hands_across_tables(tourney_env_factory):
     """Test that hands progress correctly across multiple tables"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(18)
     
     # Track hands played at each table
     initial_hands = {table_id: table.hands_played for table_id, table in env.tables.items()}
     
     # Play several steps
-    for _ in range(20):
-        if env._tournament_finished():
-            break
-        
-        mask = info["action_mask"]
-        if any(mask):
-            action = int(np.argmax(mask))
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            if terminated:
-                break
+    env.play_until_finished(20)
     
     # At least some tables should have progressed
-    hands_progressed = False
-    for table_id, table in env.tables.items():
-        if table.hands_played > initial_hands[table_id]:
-            hands_progressed = True
-            break
+    hands_progressed = any(table.hands_played > initial_hands[table_id] for table_id, table in env.tables.items())
     
     if not env._tournament_finished():
         assert hands_progressed, "No hands progressed across tables"
 
-def test_observation_consistency_across_tables():
+def test_observation_consistency_across_tables(tourney_env_factory):
     """Test observation consistency when switching between tables"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
-    
-    observations = []
-    table_ids = []
+    env = tourney_env_factory(18)
+    obs, info = env._soft_reset()
     
     # Collect observations from multiple tables
-    for _ in range(10):
-        if env._tournament_finished():
-            break
-        
-        observations.append(obs.copy())
-        table_ids.append(env.active_table_id)
-        
-        mask = info["action_mask"]
-        if any(mask):
-            action = int(np.argmax(mask))
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            if terminated:
-                break
+    steps, observations, table_ids = _rollout(env, obs, info, 10, collect_obs=True)
     
     # Verify observations are valid for their respective tables
-    for i, (obs_vec, table_id) in enumerate(zip(observations, table_ids)):
+    for i, (obs_vec, table_id) in enumerate(zip(observations[:steps], table_ids[:steps])):
         # Table ID should match
         assert obs_vec[5] == table_id, f"Observation {i}: table_id mismatch"
         
         # All values should be non-negative and reasonable
-        assert all(val >= 0 for val in obs_vec), f"Observation {i}: negative values"
+        assert (obs_vec >= 0).all(), f"Observation {i}: negative values"
         assert obs_vec[4] in [0, 1], f"Observation {i}: invalid in_hand value"
 
-def test_memory_and_state_consistency():
+@pytest.mark.parametrize("reset_num", range(5))
+def test_memory_and_state_consistency(reset_num):
     """Test memory management and state consistency"""
     env = MultiTableTournamentEnv(total_players=27, max_players_per_table=9)
     
-    # Multiple resets should not cause memory leaks or state issues
-    for reset_num in range(5):
-        obs, info = env.reset()
+    # Resetting after play should not cause memory leaks or state issues
+    for seed in (reset_num, reset_num + 100):
+        obs, info = env.reset(seed=seed)
         
         # Verify clean state after reset
         assert len(env.elimination_order) == 0
@@ -532,33 +602,50 @@ def test_memory_and_state_consistency():
         assert env.total_hands_played == 0
         
         # Play a few steps
-        for _ in range(10):
-            mask = info["action_mask"]
-            if any(mask):
-                action = int(np.argmax(mask))
-                obs, reward, terminated, truncated, info = env.step(action)
-                if terminated:
-                    break
-
-def test_extreme_stack_scenarios():
+        env.play_until_finished(10)
+
+def test_reset_seed_reproduces_seating():
+    """The same seed gives the same seating, independent of the global random module"""
+    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
+    env.reset(seed=7)
+    seating = [[p.name for p in t.players] for t in env.tables.values()]
+    
+    env.reset(seed=7)
+    assert [[p.name for p in t.players] for t in env.tables.values()] == seating
+
+def test_extreme_stack_scenarios(tourney_env_factory):
     """Test extreme stack scenarios (very large/small stacks)"""
-    env = MultiTableTournamentEnv(total_players=9, starting_stack=1000000)  # Large stacks
-    obs, info = env.reset()
+    env = tourney_env_factory(9, starting_stack=1000000)  # Large stacks
+    obs = env._get_obs()
     
     # Should handle large stacks
     assert obs[0] == 1000000  # Player stack
     
-    # Test with very small stacks
-    env2 = MultiTableTournamentEnv(total_players=9, starting_stack=10)
-    obs2, info2 = env2.reset()
+    # Test with very small stacks, reusing the same env
+    obs2, info2 = env.reconfigure(starting_stack=10)
     
     # Should handle small stacks
     assert obs2[0] == 10
 
-def test_action_mask_edge_cases():
-    """Test action mask generation in edge cases"""
+def test_reconfigure_changes_settings_in_place():
+    """reconfigure() applies new settings, reseats players and rejects bad ones"""
     env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env.reset()
+    
+    env.reconfigure(total_players=18)
+    assert len(env.tables) == 2
+    assert env.total_seated_players == 18
+    assert len(env._players_by_name) == 18
+    
+    with pytest.raises(ValueError):
+        env.reconfigure(starting_stack=0)
+    with pytest.raises(ValueError):
+        env.reconfigure(blinds_schedule=[(5, 10, 0)])
+    assert env.starting_stack == 1000
+
+def test_action_mask_edge_cases(tourney_env_factory):
+    """Test action mask generation in edge cases"""
+    env = tourney_env_factory(9)
     
     # Test mask when player has exactly enough to call
     table = env.tables[env.active_table_id]
@@ -576,10 +663,9 @@ def test_action_mask_edge_cases():
     else:
         pytest.skip("No current player to test action mask edge case.")
 
-def test_tournament_stats_edge_cases():
+def test_tournament_stats_edge_cases(tourney_env_factory):
     """Test tournament statistics in edge cases"""
-    env = MultiTableTournamentEnv(total_players=2, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(2)
     
     stats = env.get_tournament_stats()
     
@@ -590,124 +676,160 @@ def test_tournament_stats_edge_cases():
     assert stats["chip_leader"] is not None
     assert stats["chip_leader_stack"] > 0
 
-def test_rapid_elimination_scenario():
+def test_rapid_elimination_scenario(tourney_env_factory):
     """Test rapid elimination scenario (players bust quickly)"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(18)
     
     # Eliminate players rapidly to stress test the system
-    players_to_eliminate = env.all_players[:15]  # Leave only 3 players
+    env.stacks[:15] = 0  # Leave only 3 players
+    env._update_elimination_order()
+    
+    assert np.count_nonzero(env.stacks > 0) == 3
+    assert set(env.elimination_order) == set(env.all_players[:15])
+    assert env._tournament_finished() is False
 
 # ====== TESTS FOR RECENTLY FIXED ISSUES ======
-def test_balance_table_even_distribution():
-    """Test that balance_table evenly distributes players across tables after eliminations."""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+@pytest.mark.parametrize("total,cut,target,all_hands_over", [
+    (18, 6, 0, True),   # even distribution after eliminations
+    (18, 6, 0, False),  # rebalance after a hand at one table, others still playing
+    (27, 6, 0, True),   # short table breaks
+    (27, 4, 2, True),
+])
+def test_balance_invariant(total, cut, target, all_hands_over, tourney_env_factory):
+    """After eliminations at one table, balancing it leaves active tables within one player of each other."""
+    env = tourney_env_factory(total)
 
     # Eliminate players from one table to create imbalance
-    target_table = env.tables[0]
-    for player in target_table.players[6:]:
-        player.stack = 0
-
-    for table in env.tables.values():
-        table.game.hand_over = True
+    env.eliminate_players(env.tables[target].players[cut:])
+    if all_hands_over:
+        env.mark_all_hands_over()
 
-    env.balance_table(env.active_table_id)
+    env.balance_table(target)
 
-    # After balancing, tables should differ by at most 1 player
-    active_tables = env._get_active_tables()
-    player_counts = [t.get_active_player_count() for t in active_tables]
+    player_counts = [t.get_active_player_count() for t in env._get_active_tables()]
     assert max(player_counts) - min(player_counts) <= 1, f"Player counts not balanced: {player_counts}"
-    print(f"[DEBUG] test_balance_table_even_distribution: player counts after balancing: {player_counts}")
+    env.assert_players_intact()
+
+def test_balance_table_returns_early_when_balanced(tourney_env_factory, monkeypatch, capsys):
+    """Even tables are left alone, but even tables that fit at fewer tables still consolidate"""
+    env = tourney_env_factory(27)
+    monkeypatch.setattr(env, "debug", True)
+    env.mark_all_hands_over()
 
-def test_balance_table_no_movement_during_hand():
+    capsys.readouterr()
+    env.balance_table(0)
+    assert "Tables already balanced" in capsys.readouterr().out
+    assert all(len(t.players) == 9 for t in env.tables.values())
+
+    # 3 + 3 + 3 players fit at one table: table 0 breaks despite the even spread
+    for table in env.tables.values():
+        _bust(env, table.players[3:])
+    env.balance_table(0)
+    assert not env.tables[0].is_active
+    counts = env._active_player_counts()
+    assert [int(counts[t.table_id]) for t in env.tables.values()] == [t.get_active_player_count() for t in env.tables.values()]
+    env.assert_players_intact()
+
+def test_balance_table_moves_fewest_players(tourney_env_factory, monkeypatch, capsys):
+    """Balancing 6 vs 9 active players takes a single move and loses nobody."""
+    env = tourney_env_factory(18)
+    monkeypatch.setattr(env, "debug", True)
+
+    _bust(env, env.tables[0].players[6:])
+    env.mark_all_hands_over()
+
+    capsys.readouterr()
+    env.balance_table(1)
+
+    moves = _BALANCE_MOVE_RE.findall(capsys.readouterr().out)
+    assert len(moves) == 1, f"Expected one move, got {moves}"
+    assert sorted(t.get_active_player_count() for t in env.tables.values()) == [7, 8]
+    seated = {p.name: tid for tid, t in env.tables.items() for p in t.players}
+    assert set(seated) == env._all_player_names
+    assert env.total_seated_players == len(seated)
+    assert env._player_to_table == seated
+
+def test_balance_table_no_movement_during_hand(tourney_env_factory, monkeypatch, capsys):
     """Test that balance_table does not move players during a hand."""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(18)
+    monkeypatch.setattr(env, "debug", True)
     
     # Eliminate players from one table to create imbalance (so balancing is needed)
     target_table = env.tables[0]
-    for player in target_table.players[6:]:
-        player.stack = 0
+    _bust(env, target_table.players[6:])
     
     # Simulate a hand in progress on all tables
     for table in env.tables.values():
         table.game.hand_over = False
     
-    captured_output = io.StringIO()
-    sys_stdout = sys.stdout
-    sys.stdout = captured_output
+    capsys.readouterr()
     env.balance_table(env.active_table_id)
-    sys.stdout = sys_stdout
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
     assert "is still in a hand; skipping balancing" in output, f"Should skip balancing during hand. Output was: {output.strip()}"
     print(f"[DEBUG] test_balance_table_no_movement_during_hand: output: {output.strip()}")
 
-def test_balance_table_preserves_player_integrity():
-    """Test that balance_table does not duplicate or lose players."""
-    env = MultiTableTournamentEnv(total_players=27, max_players_per_table=9)
-    obs, info = env.reset()
+def test_balance_table_silent_without_debug(tourney_env_factory, capsys):
+    """Balancing prints nothing unless the env was built with debug=True"""
+    env = tourney_env_factory(18)
+    
+    _bust(env, env.tables[0].players[6:])
+    env.mark_all_hands_over()
+    
+    capsys.readouterr()
+    env.balance_table(1)
+    assert "[BALANCE_TABLE]" not in capsys.readouterr().out
+    assert sorted(t.get_active_player_count() for t in env.tables.values()) == [7, 8]
 
-    initial_player_names = set(p.name for p in env.all_players)
-    env.balance_table(env.active_table_id)
-    final_player_names = set()
+def test_balance_table_skips_repeat_calls(tourney_env_factory, monkeypatch, capsys):
+    """Repeating balance_table on an unchanged tournament does no work; any change re-runs it"""
+    env = tourney_env_factory(18)
+    monkeypatch.setattr(env, "debug", True)
     for table in env.tables.values():
-        for player in table.players:
-            final_player_names.add(player.name)
-    assert initial_player_names == final_player_names, "Player set changed after balancing"
-    print(f"[DEBUG] test_balance_table_preserves_player_integrity: player names preserved")
-    """Test that rebalancing occurs after a hand at any table, not all tables."""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
-
-    # Eliminate players from table 0 to create imbalance
-    target_table = env.tables[0]
-    for player in target_table.players[6:]:
-        player.stack = 0
-
-    # Simulate hand finished at table 0
-    target_table.game.hand_over = True
-
+        table.game.hand_over = False
+    
+    capsys.readouterr()
+    for _ in range(3):
+        env.balance_table(0)
+    assert capsys.readouterr().out.count("Entered balance_table") == 1
+    
+    env.tables[0].players[-1].stack = 0
     env.balance_table(0)
+    assert capsys.readouterr().out.count("Entered balance_table") == 1
 
-    # After balancing, tables should differ by at most 1 player
-    active_tables = env._get_active_tables()
-    player_counts = [t.get_active_player_count() for t in active_tables]
-    assert max(player_counts) - min(player_counts) <= 1, f"Player counts not balanced: {player_counts}"
-    print(f"[DEBUG] test_rebalance_after_hand: player counts after balancing: {player_counts}")
+def test_balance_table_preserves_player_integrity(tourney_env_factory):
+    """Test that balance_table does not duplicate or lose players."""
+    env = tourney_env_factory(27)
+
+    env.balance_table(env.active_table_id)
+    env.assert_players_intact()
+    print(f"[DEBUG] test_balance_table_preserves_player_integrity: player names preserved")
 
-def test_table_breaking_moves_players_immediately():
+def test_table_breaking_moves_players_immediately(tourney_env_factory):
     """Test that table breaking moves all players immediately after hand is finished."""
-    env = MultiTableTournamentEnv(total_players=10, max_players_per_table=9, min_players_per_table=4)
-    obs, info = env.reset()
+    env = tourney_env_factory(10, min_players_per_table=4)
 
-    # Eliminate players from table 0 to trigger breaking
+    # Eliminate players from table 0 to trigger breaking; its hand is finished
     target_table = env.tables[0]
-    for player in target_table.players[4:]:
-        player.stack = 0
-
-    # Simulate hand finished at table 0
-    target_table.game.hand_over = True
+    assert env.eliminate_players(target_table.players[4:]) == [0]
+    survivors = {p.name for p in target_table.players[:4]}
 
     env.balance_table(0)
 
     # Table 0 should be deactivated and all players moved
     assert not target_table.is_active, "Table should be deactivated after breaking"
-    moved_names = [p.name for t in env.tables.values() for p in t.players]
-    for player in target_table.players:
-        if player.stack > 0:
-            assert player.name in moved_names, f"Player {player.name} not found after table breaking"
+    assert 0 not in env._active_table_ids, "Broken table should leave the active set"
+    moved_names = {p.name for tid, t in env.tables.items() if tid != 0 for p in t.players}
+    missing = survivors - moved_names
+    assert not missing, f"Players not found after table breaking: {sorted(missing)}"
     print(f"[DEBUG] test_table_breaking_moves_players_immediately: table 0 deactivated, players moved")
 
-def test_moved_players_join_current_hand():
+def test_moved_players_join_current_hand(tourney_env_factory):
     """Test that moved players join the current hand at the new table."""
-    env = MultiTableTournamentEnv(total_players=10, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(10)
 
     # Eliminate players from table 0 to trigger breaking
     target_table = env.tables[0]
-    for player in target_table.players[4:]:
-        player.stack = 0
+    _bust(env, target_table.players[4:])
 
     # Simulate hand finished at table 0
     target_table.game.hand_over = True
@@ -720,18 +842,43 @@ def test_moved_players_join_current_hand():
             assert player.in_hand is True, f"Player {player.name} not in hand after moving"
     print(f"[DEBUG] test_moved_players_join_current_hand: all moved players joined current hand")
     """Test that balance_table does not duplicate or lose players."""
-    env = MultiTableTournamentEnv(total_players=27, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(27)
 
-    initial_player_names = set(p.name for p in env.all_players)
     env.balance_table(env.active_table_id)
-    final_player_names = set()
-    for table in env.tables.values():
-        for player in table.players:
-            final_player_names.add(player.name)
-    assert initial_player_names == final_player_names, "Player set changed after balancing"
+    env.assert_players_intact()
     print(f"[DEBUG] test_balance_table_preserves_player_integrity: player names preserved")
 
+def test_active_tables_list_refreshes_when_a_table_closes(tourney_env_factory):
+    """_get_active_tables reuses one list until a table's is_active flag flips"""
+    env = tourney_env_factory(27)
+    
+    tables = env._get_active_tables()
+    assert env._get_active_tables() is tables
+    assert [t.table_id for t in tables] == [0, 1, 2]
+    
+    env.tables[1].is_active = False
+    assert [t.table_id for t in env._get_active_tables()] == [0, 2]
+    
+    for table in env.tables.values():
+        table.game.hand_over = False
+    env.mark_all_hands_over()
+    assert [t.game.hand_over for t in env.tables.values()] == [True, False, True]
+
+def test_assert_players_intact_catches_duplicates_and_losses(tourney_env_factory):
+    """assert_players_intact flags a player seated twice or missing from every table"""
+    env = tourney_env_factory(18)
+    env.assert_players_intact()
+    
+    player = env.tables[0].players[0]
+    env.tables[1].players.append(player)
+    with pytest.raises(AssertionError, match="more than once"):
+        env.assert_players_intact()
+    
+    env.tables[1].players.pop()
+    env.tables[0].players.remove(player)
+    with pytest.raises(AssertionError, match="missing"):
+        env.assert_players_intact()
+
 def test_sharky_stack_tracking_accuracy():
     """Test that Sharky's stack is accurately tracked and reported after eliminations"""
     
@@ -739,14 +886,7 @@ def test_sharky_stack_tracking_accuracy():
     obs, info = env.reset()
     
     # Find Sharky (Player_0) and modify their stack
-    sharky = None
-    for table in env.tables.values():
-        for player in table.players:
-            if player.name == "Player_0":
-                sharky = player
-                break
-        if sharky:
-            break
+    sharky = find_player(env, "Player_0")
     
     assert sharky is not None, "Sharky (Player_0) should exist in tournament"
     
@@ -756,14 +896,7 @@ def test_sharky_stack_tracking_accuracy():
     
     # Test the core functionality: Sharky should be findable with the updated stack
     # This is what the _update_elimination_order method actually looks for
-    found_sharky = None
-    for t in env.tables.values():
-        for p in t.players:
-            if p.name == "Player_0" and p.stack > 0:
-                found_sharky = p
-                break
-        if found_sharky:
-            break
+    found_sharky = env.sharky
     
     assert found_sharky is not None, "Should be able to find Sharky with stack > 0"
     assert found_sharky.stack == 1500, f"Sharky's stack should be 1500, got {found_sharky.stack}"
@@ -772,14 +905,8 @@ def test_sharky_stack_tracking_accuracy():
     # Now test elimination triggering - ensure elimination order is clean
     env.elimination_order = []
     
-    # Find a different player to eliminate
-    other_player = None
-    for player in env.all_players:
-        if player.name != "Player_0":
-            other_player = player
-            break
-
-    assert other_player is not None, "Should find a player to eliminate"
+    # Any player other than Sharky will do
+    other_player = next(p for p in env.all_players if p is not sharky)
     
     # Reset the other player's state to ensure clean elimination
     other_player.stack = 100  # First give them chips
@@ -807,32 +934,29 @@ def test_sharky_stack_tracking_accuracy():
         print(f"ℹ️  No elimination triggered, but Sharky's stack tracking works: {sharky.stack}")
         assert sharky.stack == 1500, "Sharky's stack should still be correctly tracked"
 
-def test_elimination_message_spam_prevention():
+def test_elimination_message_spam_prevention(tourney_env_factory, monkeypatch, capsys):
     """Test that elimination messages don't spam repeatedly"""
-    env = MultiTableTournamentEnv(total_players=9, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(9)
+    monkeypatch.setattr(env, "debug", True)
     
     # Eliminate players to trigger the fix
     players_to_eliminate = env.all_players[1:4]  # Eliminate 3 players
-    for player in players_to_eliminate:
-        player.stack = 0
+    env.stacks[1:4] = 0
     
-    captured_output = io.StringIO()
-    with redirect_stdout(captured_output):
-        # Call table balancing multiple times (this used to cause spam)
-        for _ in range(5):
-            env.balance_table(env.active_table_id)
+    capsys.readouterr()
+    # Call table balancing multiple times (this used to cause spam)
+    for _ in range(5):
+        env.balance_table(env.active_table_id)
 
-    output = captured_output.getvalue()
-    debug_lines = [line for line in output.split('\n') if '[DEBUG]' in line and 'Removed' in line]
+    output = capsys.readouterr().out
+    debug_lines = _DEBUG_REMOVED_RE.findall(output)
     
     # Should not have excessive debug messages
     assert len(debug_lines) <= 2, f"Too many debug messages: {len(debug_lines)}"
 
-def test_raise_amount_validation_fix():
+def test_raise_amount_validation_fix(tourney_env_factory):
     """Test that raise amounts are properly validated and don't create betting errors"""
-    env = MultiTableTournamentEnv(total_players=6, max_players_per_table=6)
-    obs, info = env.reset()
+    env = tourney_env_factory(6, max_players_per_table=6)
     
     # Get current table and player
     table = env.tables[env.active_table_id]
@@ -859,10 +983,9 @@ def test_raise_amount_validation_fix():
     else:
         pytest.skip("No current player to test raise amount validation.")
 
-def test_all_in_raise_logic():
+def test_all_in_raise_logic(tourney_env_factory):
     """Test that all-in raises are handled correctly when player can't make minimum raise"""
-    env = MultiTableTournamentEnv(total_players=6, max_players_per_table=6)
-    obs, info = env.reset()
+    env = tourney_env_factory(6, max_players_per_table=6)
     
     # Create scenario for all-in logic testing
     table = env.tables[env.active_table_id]
@@ -893,20 +1016,18 @@ def test_all_in_raise_logic():
     else:
         pytest.skip("No current player to test all-in raise logic.")
 
-def test_debug_message_prefixes():
+def test_debug_message_prefixes(tourney_env_factory, capsys):
     """Test that debug messages have proper [DEBUG] prefixes for filtering"""
-    env = MultiTableTournamentEnv(total_players=6, max_players_per_table=6)
-    obs, info = env.reset()
+    env = tourney_env_factory(6, max_players_per_table=6, debug=True)
     
     # Eliminate a player to trigger debug messages
     player_to_eliminate = env.all_players[1]
     player_to_eliminate.stack = 0
     
-    captured_output = io.StringIO()
-    with redirect_stdout(captured_output):
-        env.balance_table(env.active_table_id)
+    capsys.readouterr()
+    env.balance_table(env.active_table_id)
     
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
     
     # Check that elimination-related messages have [DEBUG] prefix
     lines = output.split('\n')
@@ -916,35 +1037,23 @@ def test_debug_message_prefixes():
         if line.strip():  # Ignore empty lines
             assert '[DEBUG]' in line, f"Missing [DEBUG] prefix in line: '{line}'"
 
-def test_betting_error_debug_prefix():
+def test_betting_error_debug_prefix(tourney_env_factory, capsys):
     """Test that betting error messages have [DEBUG] prefix"""
-    env = MultiTableTournamentEnv(total_players=6, max_players_per_table=6)
-    obs, info = env.reset()
+    env = tourney_env_factory(6, max_players_per_table=6)
     
     # Force an error in game step (this is tricky to do cleanly)
     table = env.tables[env.active_table_id]
     game = table.game
     
-    # Create an invalid state that might cause an error
-    original_step = game.step
-    
-    def mock_step_with_error(*args, **kwargs):
-        raise ValueError("Opening bet must be at least the big blind (40).")
-    
-    # Temporarily replace step method
-    game.step = mock_step_with_error
-    
-    captured_output = io.StringIO()
-    with redirect_stdout(captured_output):
+    # Make the game's step fail; patch restores it when the block exits
+    capsys.readouterr()
+    with patch.object(game, "step", side_effect=ValueError("Opening bet must be at least the big blind (40).")):
         try:
             obs, reward, terminated, truncated, info = env.step(2)  # This should trigger error
-        except:
+        except Exception:
             pass  # Expected to have some handling
     
-    # Restore original method
-    game.step = original_step
-    
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
     
     # Check for [DEBUG] prefix on error messages
     error_lines = [line for line in output.split('\n') if 'Error in game step' in line]
@@ -958,16 +1067,7 @@ def test_player_reference_consistency():
     obs, info = env.reset()
     
     # Find Sharky in initial setup
-    sharky_initial = None
-    initial_table_id = None
-    for table_id, table in env.tables.items():
-        for player in table.players:
-            if player.name == "Player_0":
-                sharky_initial = player
-                initial_table_id = table_id
-                break
-        if sharky_initial:
-            break
+    sharky_initial = find_player(env, "Player_0")
     
     assert sharky_initial is not None, "Sharky should be found initially"
     
@@ -978,28 +1078,19 @@ def test_player_reference_consistency():
     env.balance_table(env.active_table_id)
     
     # Find Sharky again after operations
-    sharky_after = None
-    for table in env.tables.values():
-        for player in table.players:
-            if player.name == "Player_0":
-                sharky_after = player
-                break
-        if sharky_after:
-            break
+    sharky_after = find_player(env, "Player_0")
     
-    assert sharky_after is not None, "Sharky should still exist after table operations"
+    assert sharky_after.name in env.current_seated_names(), "Sharky should still be seated after table operations"
     assert sharky_after.stack == 2000, "Sharky's stack should be preserved"
     assert sharky_after is sharky_initial, "Should be the same object reference"
 
-def test_table_balancing_threshold_configuration():
+def test_table_balancing_threshold_configuration(tourney_env_factory):
     """Test that the new table balancing threshold (5) works correctly"""
-    env = MultiTableTournamentEnv(
-        total_players=18, 
-        max_players_per_table=9,
+    env = tourney_env_factory(
+        18,
         table_balancing_threshold=5,  # New threshold
         min_players_per_table=2  # New minimum
     )
-    obs, info = env.reset()
     
     # Verify configuration was applied
     assert env.table_balancing_threshold == 5
@@ -1009,8 +1100,7 @@ def test_table_balancing_threshold_configuration():
     target_table = env.tables[0]
     # Eliminate players to get to 4 players (below threshold of 5)
     players_to_eliminate = target_table.players[4:]
-    for player in players_to_eliminate:
-        player.stack = 0
+    _bust(env, players_to_eliminate)
     
     # Check that this table needs balancing
     active_count = target_table.get_active_player_count()
@@ -1025,20 +1115,18 @@ def test_table_balancing_threshold_configuration():
     
     assert target_table in tables_needing_balance, "Table with 4 players should need balancing"
 
-def test_heads_up_capability():
+def test_heads_up_capability(tourney_env_factory):
     """Test that tables can play heads-up (2 players) with new minimum"""
-    env = MultiTableTournamentEnv(
-        total_players=6,
+    env = tourney_env_factory(
+        6,
         max_players_per_table=6,
         min_players_per_table=2  # Should allow heads-up
     )
-    obs, info = env.reset()
     
     # Eliminate players to get to heads-up
     table = env.tables[0]
     players_to_eliminate = table.players[2:]  # Leave only 2 players
-    for player in players_to_eliminate:
-        player.stack = 0
+    _bust(env, players_to_eliminate)
     
     # Check that table is still active with 2 players
     active_count = table.get_active_player_count()
@@ -1049,13 +1137,9 @@ def test_heads_up_capability():
     assert table.is_active, "Heads-up table should remain active"
     assert table.get_active_player_count() == 2, "Should still have 2 players after balancing"
 
-def test_turbo_blind_structure():
+def test_turbo_blind_structure(tourney_env_factory):
     """Test the new turbo blind structure (10-hand levels, antes start at level 2)"""
-    env = MultiTableTournamentEnv(
-        total_players=9,
-        hands_per_blind_level=10  # Turbo format
-    )
-    obs, info = env.reset()
+    env = tourney_env_factory(9, hands_per_blind_level=10)  # Turbo format
     
     # Check turbo configuration
     assert env.hands_per_blind_level == 10
@@ -1081,18 +1165,15 @@ def test_turbo_blind_structure():
     assert env.current_blind_level > initial_level, "Blinds should increase after 10 hands"
 
 
-def test_rapid_elimination_scenario_completion():
+def test_rapid_elimination_scenario_completion(tourney_env_factory):
     """Test rapid elimination scenario (players bust quickly) - completion"""
-    env = MultiTableTournamentEnv(total_players=18, max_players_per_table=9)
-    obs, info = env.reset()
+    env = tourney_env_factory(18)
     
     # Eliminate players rapidly to stress test the system
     players_to_eliminate = env.all_players[:15]  # Leave only 3 players
-    
-    for player in players_to_eliminate:
-        player.stack = 0
-    
-    env._update_elimination_order()
+    touched = env.eliminate_players(players_to_eliminate, finish_hands=False)
+    assert touched == [0, 1]
+    assert len(env.elimination_order) == 15
     # Ensure the game engine ends the hand if only one player remains after eliminations
     for table in env.tables.values():
         env._fix_game_state_after_eliminations(table)
@@ -1100,7 +1181,7 @@ def test_rapid_elimination_scenario_completion():
     
     # Should handle rapid eliminations gracefully
     active_tables = env._get_active_tables()
-    remaining_players = len([p for p in env.all_players if p.stack > 0])
+    remaining_players = np.count_nonzero(env.stacks > 0)
     
     assert remaining_players == 3
     assert len(active_tables) >= 1
@@ -1108,7 +1189,7 @@ def test_rapid_elimination_scenario_completion():
     # Should still be able to continue tournament
     if not env._tournament_finished():
         mask = env.legal_action_mask()
-        assert any(mask), "Should have legal actions with remaining players"
+        assert mask.any(), "Should have legal actions with remaining players"
 
 def test_tournament_state_isolation_and_cleanup():
     """Test that tournament state is properly isolated between test runs"""
@@ -1123,14 +1204,7 @@ def test_tournament_state_isolation_and_cleanup():
     env1.current_blind_level = 3
     
     # Find Player_0 (Sharky) and modify their stack
-    sharky1 = None
-    for table in env1.tables.values():
-        for player in table.players:
-            if player.name == "Player_0":
-                sharky1 = player
-                break
-        if sharky1:
-            break
+    sharky1 = find_player(env1, "Player_0")
     
     assert sharky1 is not None
     sharky1.stack = 2500  # Modified stack
@@ -1144,14 +1218,7 @@ def test_tournament_state_isolation_and_cleanup():
     assert env2.current_blind_level == 0, "Blind level should be 0 in new tournament"
     
     # Find Player_0 (Sharky) in second tournament
-    sharky2 = None
-    for table in env2.tables.values():
-        for player in table.players:
-            if player.name == "Player_0":
-                sharky2 = player
-                break
-        if sharky2:
-            break
+    sharky2 = find_player(env2, "Player_0")
     
     assert sharky2 is not None
     assert sharky2.stack == 1000, f"Sharky should have starting stack (1000), got {sharky2.stack}"
@@ -1161,11 +1228,10 @@ def test_tournament_state_isolation_and_cleanup():
     sharky1.stack = 3000
     assert sharky2.stack == 1000, "Second tournament player should be unaffected"
 
-def test_robust_state_tracking_across_operations():
+def test_robust_state_tracking_across_operations(tourney_env_factory):
     """Test that player state tracking works correctly across table operations"""
     # This tests the robustness improvements we made to state tracking
-    env = MultiTableTournamentEnv(total_players=12, max_players_per_table=6)
-    obs, info = env.reset()
+    env = tourney_env_factory(12, max_players_per_table=6)
     
     # Find a specific player and track them
     target_player = env.all_players[5]  # Pick player 5
@@ -1179,15 +1245,9 @@ def test_robust_state_tracking_across_operations():
     env._update_elimination_order()
     
     # Player should still be trackable with correct stack
-    found_player = None
-    for table in env.tables.values():
-        for player in table.players:
-            if player.name == target_player.name:
-                found_player = player
-                break
-        if found_player:
-            break
+    found_player = find_player(env, target_player.name)
     
     assert found_player is not None, f"Should be able to find player {target_player.name}"
+    assert target_player.name in env.current_seated_names(), "Player should still be seated"
     assert found_player.stack == 1337, f"Player stack should be preserved, got {found_player.stack}"
     assert found_player is target_player, "Should be the same object reference"
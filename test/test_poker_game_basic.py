@@ -1,63 +1,62 @@
 # test/test_poker_game_basic.py
+# run_tests.py runs the suite under pytest-xdist (see pytest.ini), and
+# loadfile keeps this module on one worker so its module fixtures are built
+# once; every test restores or builds its own game, and monkeypatching is
+# per test.
+import numpy as np
 import pytest
+from engine._game_jit import CALL, FOLD, RAISE, apply_actions, table_arrays
+from engine.cards import RANKS, SUITS, get_card
+from engine.hand_evaluator import ck_score
+from engine.hand_ranks_table import pack_score
 from engine.game import PokerGame
 from engine.player import Player
 from utils.enums import GameMode
-from engine.action_validation import ActionValidationError
+from engine.action_validation import ActionValidationError, ERR_MIN_RAISE
 
-def test_nine_player_preflop_all_call_one_raise():
+@pytest.fixture
+def nine_player_game():
+    """A new 10/20 game over nine new 1000-chip players."""
     players = [Player(f"P{i}", stack=1000) for i in range(9)]
-    game = PokerGame(players, small_blind=10, big_blind=20)
+    return PokerGame(players, small_blind=10, big_blind=20), players
+
+def _check_or(game, i, action):
+    """Act for seat i: check when there is nothing to call, otherwise take `action`."""
+    game.current_player_idx = i
+    game.step(action if game.to_call(i) else "check", 0)
+
+def test_nine_player_preflop_all_call_one_raise(nine_player_game):
+    game, players = nine_player_game
     game.reset_for_new_hand(is_first_hand=True)
     # All call except P5, who raises to 100
     for i in range(9):
-        game.current_player_idx = i
-        to_call = game.current_bet - players[i].current_bet
         if i == 5:
+            game.current_player_idx = i
             game.step("raise", 100)
-        elif to_call == 0:
-            game.step("check", 0)
         else:
-            game.step("call", 0)
+            _check_or(game, i, "call")
     step_limit = 20
-    while game.phase_idx == game.PHASES.index("preflop") and step_limit > 0 and game.players_to_act:
-        player = game.players_to_act[0]
-        idx = game.players.index(player)
-        game.current_player_idx = idx
-        to_call = game.current_bet - player.current_bet
-        if to_call == 0:
-            game.step("check", 0)
-        else:
-            game.step("call", 0)
+    seat_of = {p: i for i, p in enumerate(players)}
+    while game.phase_idx == PokerGame.PREFLOP and step_limit > 0 and game.players_to_act:
+        _check_or(game, seat_of[game.players_to_act[0]], "call")
         step_limit -= 1
-    assert game.phase_idx == game.PHASES.index("flop")
+    assert game.phase_idx == PokerGame.FLOP
     expected_pot = 100 * 9
     assert game.pot == expected_pot
 
-def test_nine_player_flop_all_in_and_folds():
-    players = [Player(f"P{i}", stack=1000) for i in range(9)]
-    game = PokerGame(players, small_blind=10, big_blind=20)
+def test_nine_player_flop_all_in_and_folds(nine_player_game):
+    game, players = nine_player_game
     game.reset_for_new_hand(is_first_hand=True)
     for i in range(9):
-        game.current_player_idx = i
-        to_call = game.current_bet - players[i].current_bet
-        if to_call == 0:
-            game.step("check", 0)
-        else:
-            game.step("call", 0)
-    game.phase_idx = game.PHASES.index("flop")
+        _check_or(game, i, "call")
+    game.phase_idx = PokerGame.FLOP
     game.current_player_idx = 0
     game.step("raise", players[0].stack)
     for i in range(1, 5):
         game.current_player_idx = i
         game.step("call", 0)
     for i in range(5, 9):
-        game.current_player_idx = i
-        to_call = game.current_bet - players[i].current_bet
-        if to_call == 0:
-            game.step("check", 0)
-        else:
-            game.step("fold", 0)
+        _check_or(game, i, "fold")
         if game.hand_over:
             break
     assert game.hand_over
@@ -75,7 +74,6 @@ def test_nine_player_sequential_elimination():
     while hands_played < max_hands:
         # Check how many players have chips
         remaining_players = [p for p in players if p.stack > 0]
-        print(f"Hand {hands_played + 1}: Players with chips: {[p.name for p in remaining_players]} (stacks: {[p.stack for p in remaining_players]})")
         
         if len(remaining_players) <= 1:
             break
@@ -105,7 +103,6 @@ def test_nine_player_sequential_elimination():
         game.current_player_idx = all_in_idx
         # To go all-in, raise to current_bet + remaining_stack
         all_in_raise_to = players[all_in_idx].current_bet + players[all_in_idx].stack
-        print(f"[TEST DEBUG] Player {players[all_in_idx].name}: stack={players[all_in_idx].stack}, current_bet={players[all_in_idx].current_bet}, all_in_raise_to={all_in_raise_to}")
         game.step("raise", all_in_raise_to)
         
         game.current_player_idx = call_idx
@@ -114,12 +111,7 @@ def test_nine_player_sequential_elimination():
         # All other players fold
         for i in range(9):
             if i not in (all_in_idx, call_idx) and players[i].stack > 0:
-                game.current_player_idx = i
-                to_call = game.current_bet - players[i].current_bet
-                if to_call == 0:
-                    game.step("check", 0)
-                else:
-                    game.step("fold", 0)
+                _check_or(game, i, "fold")
                 if game.hand_over:
                     break
                     
@@ -127,7 +119,6 @@ def test_nine_player_sequential_elimination():
     
     # At the end, we should have at most one player with chips
     final_remaining = [p for p in players if p.stack > 0]
-    print(f"Final result: Players with chips: {[p.name for p in final_remaining]}")
     
     # The test passes if we successfully eliminated players down to 1 or 0
     assert len(final_remaining) <= 1
@@ -142,7 +133,7 @@ def test_hand_ends_when_all_players_all_in():
     game.current_player_idx = 1
     game.step("call", 0)
     assert game.hand_over
-    assert game.phase_idx == game.PHASES.index("showdown")
+    assert game.phase_idx == PokerGame.SHOWDOWN
     assert alice.stack + bob.stack == 200
 
 def test_hand_ends_when_all_but_one_fold():
@@ -183,83 +174,123 @@ def test_hand_ends_when_all_players_have_zero_stack():
     with pytest.raises(RuntimeError, match="Not enough players with chips to continue."):
         PokerGame([alice, bob, carol]).reset_for_new_hand(is_first_hand=True)
 
-def test_three_player_full_hand_flow(monkeypatch):
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    carol = Player("Carol", stack=1000)
-    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    game.current_player_idx = 0
-    game.step("call", 0)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 0
-    game.step("raise", 40)
-    game.current_player_idx = 1
-    game.step("fold")
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 0
-    game.step("check", 0)
-    game.current_player_idx = 2
-    game.step("raise", 100)
-    game.current_player_idx = 0
-    game.step("call", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 0
-    game.step("raise", 200)
-    game.current_player_idx = 2
-    game.step("fold")
-    assert game.hand_over is True
-    assert alice.stack > carol.stack
-
-def test_full_hand_simulation_with_showdown(monkeypatch):
+def test_showdown_awards_pot_to_higher_score():
     alice = Player("Alice", stack=1000)
     bob = Player("Bob", stack=1000)
     game = PokerGame([alice, bob], small_blind=10, big_blind=20)
     game.reset_for_new_hand(is_first_hand=True)
     game.current_player_idx = 0
     game.step("call", 0)
-    game.current_player_idx = 1
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 0
-    game.step("raise", 40)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 0
-    game.step("check", 0)
-    game.current_player_idx = 1
-    game.step("check", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 0
-    game.step("raise", 100)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    assert game.phase_idx == 4 or game.hand_over
-    total_stack = alice.stack + bob.stack
-    assert total_stack == 2000
+    pot = game.pot
+    # Board pairs nothing; Alice's pocket kings beat Bob's ace-high
+    game.community_cards = [get_card(r, s) for r, s in (("2", "♠"), ("7", "♥"), ("9", "♦"), ("J", "♣"), ("3", "♠"))]
+    alice.hole_cards = [get_card("K", "♠"), get_card("K", "♥")]
+    bob.hole_cards = [get_card("A", "♦"), get_card("Q", "♣")]
+    alice_stack = alice.stack
+    game.showdown()
+    assert alice.stack == alice_stack + pot
+    assert alice.stack + bob.stack == 2000
 
-def test_split_pot(monkeypatch):
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    game = PokerGame([alice, bob], small_blind=10, big_blind=20)
+def test_showdown_scores_each_hand_once_and_skips_uncontested_pots(monkeypatch):
+    # Alice is all-in for 100, Bob and Carol put in 300 each and Carol folded:
+    # pot 1 (300) is contested by Alice and Bob, pot 2 (400) goes to Bob alone
+    alice = Player("Alice").reset_to(stack=0, all_in=True, total_contributed=100)
+    bob = Player("Bob").reset_to(stack=700, total_contributed=300)
+    carol = Player("Carol").reset_to(stack=700, in_hand=False, total_contributed=300)
+    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
+    game.reset_to(pot=700)
+    game.community_cards = [get_card(r, s) for r, s in (("2", "♠"), ("7", "♥"), ("9", "♦"), ("J", "♣"), ("3", "♠"))]
+    alice.hole_cards = [get_card("K", "♠"), get_card("K", "♥")]
+    bob.hole_cards = [get_card("A", "♦"), get_card("Q", "♣")]
+    calls = []
+    monkeypatch.setattr("engine.game.ck_score", lambda cks: calls.append(cks) or ck_score(cks))
+    game.showdown()
+    assert len(calls) == 2
+    assert (alice.stack, bob.stack, carol.stack) == (300, 1100, 700)
+
+def test_game_deals_from_injected_generator():
+    def deal(seed):
+        game = PokerGame([Player("Alice", stack=1000), Player("Bob", stack=1000)], rng=np.random.default_rng(seed))
+        game.reset_for_new_hand(is_first_hand=True)
+        return [p.hole_cards for p in game.players]
+
+    assert deal(11) == deal(11)
+
+def test_shared_engine_tables_are_immutable():
+    # Class and module level state is shared by every game in a worker
+    assert all(isinstance(t, tuple) for t in (PokerGame.PHASES, PokerGame.ACTION_NAMES, RANKS, SUITS))
+    phases = (PokerGame.PREFLOP, PokerGame.FLOP, PokerGame.TURN, PokerGame.RIVER, PokerGame.SHOWDOWN)
+    assert [PokerGame.PHASES[i] for i in phases] == ["preflop", "flop", "turn", "river", "showdown"]
+
+# Scripted hands: (starting stacks, every hand ties at showdown, steps, final
+# check). A step is (seat, action, amount) or ("phase", n, None) to assert the phase.
+HAND_SCRIPTS = {
+    "2p_fold_on_river": ((1000, 1000), False, [
+        (0, "call", 0), (1, "check", 0), ("phase", 1, None),
+        (0, "raise", 40), (1, "call", 0), ("phase", 2, None),
+        (0, "check", 0), (1, "check", 0), ("phase", 3, None),
+        (0, "raise", 100), (1, "fold", 0),
+    ], lambda game, p: game.hand_over and p[0].stack > p[1].stack),
+    "2p_showdown": ((1000, 1000), False, [
+        (0, "call", 0), (1, "check", 0), ("phase", 1, None),
+        (0, "raise", 40), (1, "call", 0), ("phase", 2, None),
+        (0, "check", 0), (1, "check", 0), ("phase", 3, None),
+        (0, "raise", 100), (1, "call", 0),
+    ], lambda game, p: game.phase_idx == 4 or game.hand_over),
+    "2p_split_pot": ((1000, 1000), True, [
+        (0, "call", 0), (1, "check", 0), ("phase", 1, None),
+        (0, "check", 0), (1, "check", 0), ("phase", 2, None),
+        (0, "check", 0), (1, "check", 0), ("phase", 3, None),
+        (0, "check", 0), (1, "check", 0),
+    ], lambda game, p: abs(p[0].stack - p[1].stack) <= 1),
+    "3p_fold_on_river": ((1000, 1000, 1000), False, [
+        (0, "call", 0), (1, "call", 0), (2, "check", 0), ("phase", 1, None),
+        (0, "raise", 40), (1, "fold", 0), (2, "call", 0), ("phase", 2, None),
+        (0, "check", 0), (2, "raise", 100), (0, "call", 0), ("phase", 3, None),
+        (0, "raise", 200), (2, "fold", 0),
+    ], lambda game, p: game.hand_over and p[0].stack > p[2].stack),
+    "3p_showdown": ((1000, 1000, 1000), False, [
+        (0, "call", 0), (1, "call", 0), (2, "check", 0), ("phase", 1, None),
+        (0, "raise", 40), (1, "fold", 0), (2, "call", 0), ("phase", 2, None),
+        (0, "check", 0), (2, "raise", 100), (0, "call", 0), ("phase", 3, None),
+        (0, "raise", 200), (2, "call", 0),
+    ], lambda game, p: game.phase_idx == 4 or game.hand_over),
+    "3p_one_folds_preflop": ((1000, 1000, 1000), False, [
+        (0, "fold", 0), (1, "call", 0), (2, "check", 0), ("phase", 1, None),
+        (1, "raise", 40), (2, "call", 0), ("phase", 2, None),
+        (1, "check", 0), (2, "check", 0), ("phase", 3, None),
+        (1, "raise", 100), (2, "fold", 0),
+    ], lambda game, p: game.hand_over and p[1].stack > p[2].stack),
+    "3p_all_in_side_pot": ((100, 500, 1000), False, [
+        (0, "raise", 100), (1, "call", 0), (2, "call", 0), ("phase", 1, None),
+        (1, "raise", 300), (2, "call", 0), ("phase", 2, None),
+        (1, "check", 0), (2, "check", 0), ("phase", 3, None),
+        (1, "check", 0), (2, "raise", 600), (1, "fold", 0),
+    ], lambda game, p: game.hand_over and p[0].all_in),
+    "3p_split_pot": ((1000, 1000, 1000), True, [
+        (0, "call", 0), (1, "call", 0), (2, "check", 0), ("phase", 1, None),
+        (0, "raise", 40), (1, "call", 0), (2, "fold", 0), ("phase", 2, None),
+        (0, "check", 0), (1, "check", 0), ("phase", 3, None),
+        (0, "raise", 100), (1, "call", 0),
+    ], lambda game, p: abs(p[0].stack - p[1].stack) <= 1),
+}
+
+@pytest.mark.parametrize("stacks, tie, steps, check", HAND_SCRIPTS.values(), ids=HAND_SCRIPTS.keys())
+def test_hand_flow(monkeypatch, stacks, tie, steps, check):
+    players = [Player(f"P{i}", stack=stack) for i, stack in enumerate(stacks)]
+    game = PokerGame(players, small_blind=10, big_blind=20)
     game.reset_for_new_hand(is_first_hand=True)
-    monkeypatch.setattr("engine.hand_evaluator.hand_rank", lambda *args, **kwargs: (1, [14, 13, 12, 11, 10]))
-    monkeypatch.setattr("engine.game.hand_rank", lambda *args, **kwargs: (1, [14, 13, 12, 11, 10]))
-    for phase in range(4):
-        game.current_player_idx = 0
-        game.step("check" if phase > 0 else "call", 0)
-        game.current_player_idx = 1
-        game.step("check", 0)
-        if phase < 3:
-            assert game.phase_idx == phase + 1
-    assert abs(alice.stack - bob.stack) <= 1
+    if tie:
+        monkeypatch.setattr("engine.game.ck_score", lambda *args, **kwargs: pack_score(1, 14, 13, 12, 11))
+    for seat, action, amount in steps:
+        if seat == "phase":
+            assert game.phase_idx == action
+            continue
+        game.current_player_idx = seat
+        game.step(action, amount)
+    # Chips only move between the players and the pot
+    assert sum(p.stack for p in players) + game.pot == sum(stacks)
+    assert check(game, players)
 
 def test_all_players_all_in_before_river(monkeypatch):
     alice = Player("Alice", stack=100)
@@ -274,7 +305,7 @@ def test_all_players_all_in_before_river(monkeypatch):
     game.step("raise", 80)
     game.current_player_idx = 1
     game.step("call", 0)
-    assert game.hand_over or game.phase_idx == game.PHASES.index("showdown")
+    assert game.hand_over or game.phase_idx == PokerGame.SHOWDOWN
     assert alice.stack + bob.stack == 200
 
 def test_player_eliminated_not_in_next_hand():
@@ -327,163 +358,6 @@ def test_dealer_button_skips_eliminated_players():
     game.rotate_dealer()
     assert game.players[game.dealer_position].stack > 0
 
-def test_three_player_full_hand_showdown(monkeypatch):
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    carol = Player("Carol", stack=1000)
-    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    game.current_player_idx = 0
-    game.step("call", 0)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 0
-    game.step("raise", 40)
-    game.current_player_idx = 1
-    game.step("fold")
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 0
-    game.step("check", 0)
-    game.current_player_idx = 2
-    game.step("raise", 100)
-    game.current_player_idx = 0
-    game.step("call", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 0
-    game.step("raise", 200)
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert game.phase_idx == 4 or game.hand_over
-    total_stack = alice.stack + bob.stack + carol.stack
-    assert total_stack == 3000
-
-def test_three_player_one_folds_preflop(monkeypatch):
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    carol = Player("Carol", stack=1000)
-    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    game.current_player_idx = 0
-    game.step("fold")
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 1
-    game.step("raise", 40)
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 1
-    game.step("check", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 1
-    game.step("raise", 100)
-    game.current_player_idx = 2
-    game.step("fold")
-    assert game.hand_over is True
-    assert bob.stack > carol.stack
-
-def test_three_player_all_in_side_pot(monkeypatch):
-    alice = Player("Alice", stack=100)
-    bob = Player("Bob", stack=500)
-    carol = Player("Carol", stack=1000)
-    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    game.current_player_idx = 0
-    game.step("raise", 100)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert alice.all_in
-    assert game.phase_idx == 1
-    game.current_player_idx = 1
-    game.step("raise", 300)
-    game.current_player_idx = 2
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 1
-    game.step("check", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 1
-    game.step("check", 0)
-    game.current_player_idx = 2
-    game.step("raise", 600)
-    game.current_player_idx = 1
-    game.step("fold")
-    assert game.hand_over is True
-
-def test_three_player_split_pot(monkeypatch):
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    carol = Player("Carol", stack=1000)
-    game = PokerGame([alice, bob, carol], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    monkeypatch.setattr("engine.hand_evaluator.hand_rank", lambda *args, **kwargs: (1, [14, 13, 12, 11, 10]))
-    monkeypatch.setattr("engine.game.hand_rank", lambda *args, **kwargs: (1, [14, 13, 12, 11, 10]))
-    game.current_player_idx = 0
-    game.step("call", 0)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 0
-    game.step("raise", 40)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    game.current_player_idx = 2
-    game.step("fold")
-    assert game.phase_idx == 2
-    game.current_player_idx = 0
-    game.step("check", 0)
-    game.current_player_idx = 1
-    game.step("check", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 0
-    game.step("raise", 100)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    assert abs(alice.stack - bob.stack) <= 1
-
-def test_full_hand_simulation():
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    game = PokerGame([alice, bob], small_blind=10, big_blind=20)
-    game.reset_for_new_hand(is_first_hand=True)
-    game.current_player_idx = 0
-    game.step("call", 0)
-    game.current_player_idx = 1
-    game.step("check", 0)
-    assert game.phase_idx == 1
-    game.current_player_idx = 0
-    game.step("raise", 40)
-    game.current_player_idx = 1
-    game.step("call", 0)
-    assert game.phase_idx == 2
-    game.current_player_idx = 0
-    game.step("check", 0)
-    game.current_player_idx = 1
-    game.step("check", 0)
-    assert game.phase_idx == 3
-    game.current_player_idx = 0
-    game.step("raise", 100)
-    game.current_player_idx = 1
-    game.step("fold")
-    assert game.hand_over is True
-    assert alice.stack > bob.stack
-
 def test_last_raise_amount_consistency_after_multiple_raises():
     alice = Player("Alice", stack=1000)
     bob = Player("Bob", stack=1000)
@@ -503,8 +377,10 @@ def test_last_raise_amount_consistency_after_multiple_raises():
     assert game.current_bet == 300
     assert game.last_raise_amount == 180
     game.current_player_idx = 0
-    with pytest.raises(ActionValidationError, match="Must raise by at least 180 chips"):
+    with pytest.raises(ActionValidationError) as ei:
         game.step("raise", 450)
+    assert ei.value.code == ERR_MIN_RAISE
+    assert str(ei.value) == "Must raise by at least 180 chips (big blind or last raise)."
 
 def test_raise_below_min_not_all_in_raises_error():
     alice = Player("Alice", stack=1000)
@@ -512,8 +388,9 @@ def test_raise_below_min_not_all_in_raises_error():
     game = PokerGame([alice, bob], small_blind=10, big_blind=20)
     game.reset_for_new_hand(is_first_hand=True)
     game.current_player_idx = 0
-    with pytest.raises(ActionValidationError, match="Must raise by at least .* chips"):
+    with pytest.raises(ActionValidationError) as ei:
         game.step("raise", 30)
+    assert ei.value.code == ERR_MIN_RAISE
 
 def test_all_in_below_minimum_raise_is_allowed():
     alice = Player("Alice", stack=1000)
@@ -557,8 +434,7 @@ def test_call_exact_stack_triggers_all_in():
     to_call = game.current_bet - game.players[game.current_player_idx].current_bet
     assert to_call == 10
     game.step("call", 10)
-    print(f"[TEST DEBUG] Pot: {game.pot}, Alice stack: {game.players[0].stack}, Bob stack: {game.players[1].stack}")
-    assert game.hand_over is True or game.phase_idx == game.PHASES.index("showdown")
+    assert game.hand_over is True or game.phase_idx == PokerGame.SHOWDOWN
     assert game.players[0].stack == 1020
     assert game.players[1].stack == 0
 
@@ -567,15 +443,9 @@ def test_check_when_not_allowed_raises_error():
     bob = Player("Bob", stack=1000)
     game = PokerGame([alice, bob], small_blind=10, big_blind=20)
     game.reset_for_new_hand(is_first_hand=True)
-    print(f"SB current_bet: {game.players[game.dealer_position].current_bet}")
-    print(f"BB current_bet: {game.players[(game.dealer_position + 1) % 2].current_bet}")
-    print(f"Table current_bet: {game.current_bet}")
     sb_pos = game.dealer_position
-    print(f"current_player_idx: {game.current_player_idx}, dealer_position: {game.dealer_position}")
-    print(f"current_bet: {game.current_bet}, SB current_bet: {game.players[sb_pos].current_bet}")
     game.current_player_idx = sb_pos
     to_call = game.current_bet - game.players[sb_pos].current_bet
-    print(f"to_call: {to_call}")
     assert to_call == 10
 
 def test_betting_round_does_not_skip_big_blind():
@@ -667,24 +537,18 @@ def test_players_to_act_resets_each_betting_round():
     game.reset_for_new_hand(is_first_hand=True)
     game.current_player_idx = 0
     game.step("call", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     game.current_player_idx = 1
     game.step("call", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     game.current_player_idx = 2
     game.step("check", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     assert game.players_to_act == []
     assert game.phase_idx == 1
     game.current_player_idx = 0
     game.step("check", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     game.current_player_idx = 1
     game.step("check", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     game.current_player_idx = 2
     game.step("check", 0)
-    print(f"After action: phase_idx={game.phase_idx}, players_to_act={[p.name for p in game.players_to_act]}")
     assert game.players_to_act == []
     assert game.phase_idx == 2
 
@@ -812,7 +676,6 @@ def test_big_blind_raises_to_100():
     assert game.hand_over is True
     assert bb.stack == 1040
     assert game.pot == 0
-    print("Test passed: BB raise to 100 with correct bet and stack updates.")
 
 def test_raise_to_100_from_small_blind_position():
     dealer = Player("Dealer", stack=1000, is_human=False)
@@ -837,7 +700,6 @@ def test_raise_to_100_from_small_blind_position():
     assert game.hand_over is True
     assert sb.stack == 1040
     assert game.pot == 0
-    print("Test passed: SB raise to 100 with correct bet and stack updates.")
 
 def test_raise_to_100_sets_correct_current_bet():
     alice = Player("Alice", stack=1000, is_human=False)
@@ -929,17 +791,31 @@ def test_blinds_posting_three_players():
     assert sb_player.stack == 990
     assert bb_player.stack == 980
 
-def test_basic_game_flow():
-    alice = Player("Alice", stack=1000)
-    bob = Player("Bob", stack=1000)
-    game = PokerGame([alice, bob], game_mode=GameMode.AI_VS_AI)
-    game.play_hand()
-    total_stack_after = alice.stack + bob.stack
-    assert total_stack_after == 2000
-    if alice.stack == 1000 and bob.stack == 1000:
-        pass
-    else:
-        assert alice.stack != 1000 or bob.stack != 1000
+@pytest.fixture
+def heads_up_game():
+    """A new 1000-chip heads-up AI_VS_AI game."""
+    players = [Player("Alice", stack=1000), Player("Bob", stack=1000)]
+    return PokerGame(players, game_mode=GameMode.AI_VS_AI), players
+
+def test_basic_game_flow(heads_up_game):
+    game, (alice, bob) = heads_up_game
+    for _ in range(20):
+        game.play_hand()
+        # Chips are only ever moved between the players
+        assert alice.stack + bob.stack == 2000
+        if min(alice.stack, bob.stack) == 0:
+            break
+
+def test_game_reuses_its_deck_across_hands(heads_up_game):
+    game, players = heads_up_game
+    game.reset_for_new_hand()
+    deck = game.deck
+    assert len(deck) == 48
+    game.reset_for_new_hand(is_first_hand=False)
+    assert game.deck is deck
+    assert len(deck) == 48
+    dealt = [c for p in players for c in p.hole_cards] + deck.cards
+    assert len(set(dealt)) == 52
 
 def test_player_fold_behavior():
     player = Player("TestPlayer", stack=1000)
@@ -1062,5 +938,33 @@ def test_texas_holdem_rules_compliance_verification():
     assert bob_bet_after_raise == 60, "Bob should have raised to 60"
     assert game.players_to_act == [], "No players should have pending actions after betting completion"
 
+def test_game_kernel_matches_engine_chip_movement():
+    players = [Player(f"P{i}", stack=1000) for i in range(4)]
+    game = PokerGame(players, small_blind=10, big_blind=20)
+    game.reset_for_new_hand(is_first_hand=True)
+    stacks, bets, in_hand = table_arrays(players)
+    pot_before, current_bet = game.pot, game.current_bet
+
+    # One preflop orbit that stays inside the betting round
+    codes = {"fold": FOLD, "call": CALL, "raise": RAISE}
+    script = [("call", 0), ("raise", 100), ("fold", 0), ("call", 0)]
+    seats = []
+    for action, amount in script:
+        seats.append(game.current_player_idx)
+        game.step(action, amount)
+
+    pot, current_bet = apply_actions(
+        stacks, bets, in_hand,
+        np.array(seats, dtype=np.int64),
+        np.array([codes[a] for a, _ in script], dtype=np.int64),
+        np.array([amount for _, amount in script], dtype=np.int64),
+        current_bet,
+    )
+    assert pot_before + pot == game.pot
+    assert current_bet == game.current_bet
+    assert stacks.tolist() == [p.stack for p in players]
+    assert bets.tolist() == [p.current_bet for p in players]
+    assert in_hand.tolist() == [p.in_hand for p in players]
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -90,8 +90,8 @@ def test_rule_based_tournament_progression():
     print(f"Player_0 at index: {[p.name for p in env.all_players].index('Player_0')}")
     print(f"Initial stacks: {[(p.name, p.stack) for p in env.all_players]}")
     
-    # Play many steps
-    for step in range(100):
+    # Play many steps (the first bust depends on the seeded deals; leave room)
+    for step in range(200):
         mask = info.get('action_mask', [False, False, False])
         if not any(mask):
             print(f"Step {step}: No legal actions available")
@@ -19,7 +19,8 @@ def test_elimination_messages():
         max_players_per_table=9,
         hands_per_blind_level=2,  # Short levels to force eliminations
         starting_stack=100,  # Small stacks to force eliminations quickly
-        blinds_schedule=[(5, 10, 0), (10, 20, 0), (20, 40, 0)]  # Aggressive blinds
+        blinds_schedule=[(5, 10, 0), (10, 20, 0), (20, 40, 0)],  # Aggressive blinds
+        verbose=True  # Print elimination messages
     )
     
     print(f"Starting tournament with {num_players} players")
@@ -1,8 +1,15 @@
 # poker-ai/utils/enums.py
  
-from enum import Enum
+from enum import Enum, IntEnum
 
 class GameMode(Enum):
     AI_VS_AI = 1
     HUMAN_VS_AI = 2
     HUMAN_VS_HUMAN = 3
+
+class ActionId(IntEnum):
+    """Integer ids for PokerGame actions, for callers that pass actions as ints (see PokerGame.step_int)."""
+    FOLD = 0
+    CHECK = 1
+    CALL = 2
+    RAISE = 3